@@ -0,0 +1,197 @@
+"""
+Shared process pool for CPU-bound scoring in Mosaic 2.0
+Keeps cross-encoder inference, cosine scoring and OSINT keyword scans off the
+request threads so a single uvicorn worker is not stalled by the GIL.
+"""
+
+import asyncio
+import functools
+import importlib
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+COMPUTE_POOL_WORKERS = int(os.getenv("COMPUTE_POOL_WORKERS", "2"))             # 0 = run inline
+COMPUTE_POOL_MAX_PENDING = int(os.getenv("COMPUTE_POOL_MAX_PENDING", "8"))     # queued + running tasks
+COMPUTE_POOL_ACQUIRE_TIMEOUT = float(os.getenv("COMPUTE_POOL_ACQUIRE_TIMEOUT", "0.25"))
+COMPUTE_POOL_TASK_TIMEOUT = float(os.getenv("COMPUTE_POOL_TASK_TIMEOUT", "10"))
+
+# Modules imported once in every worker; importing them loads their models
+WARMUP_MODULES = [
+    module.strip()
+    for module in os.getenv("COMPUTE_POOL_WARMUP", ".reranker").split(",")
+    if module.strip()
+]
+
+_IN_WORKER = False
+
+class ComputePoolBusy(RuntimeError):
+    """Raised when the pool queue is full (back-pressure)."""
+
+def _init_worker(package: str, warmup_modules: list):
+    """Pool worker initializer: mark the process and warm models once."""
+    global _IN_WORKER
+    _IN_WORKER = True
+    for module in warmup_modules:
+        try:
+            importlib.import_module(module, package)
+        except Exception as e:
+            print(f"Compute pool warm-up failed for {module}: {e}")
+
+def _ping() -> int:
+    """No-op task used to force worker start-up."""
+    return os.getpid()
+
+def in_worker() -> bool:
+    """True inside a pool worker process (kernels must run inline there)."""
+    return _IN_WORKER
+
+class ComputePool:
+    """Bounded process pool with back-pressure for CPU-bound stages."""
+
+    def __init__(self, workers: int = COMPUTE_POOL_WORKERS, max_pending: int = COMPUTE_POOL_MAX_PENDING,
+                 acquire_timeout: float = COMPUTE_POOL_ACQUIRE_TIMEOUT):
+        self.workers = workers
+        self.max_pending = max(1, max_pending)
+        self.acquire_timeout = acquire_timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+
+        # Performance tracking
+        self.pending = 0
+        self.total_submitted = 0
+        self.total_rejected = 0
+        self.total_failed = 0
+        self.total_task_time = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0 and not _IN_WORKER
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the executor lazily; spawn avoids forking torch threads."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(__package__, WARMUP_MODULES)
+                )
+            return self._executor
+
+    def submit(self, fn: Callable, *args: Any, acquire_timeout: Optional[float] = None) -> Future:
+        """Submit a task, raising ComputePoolBusy if the queue stays full for acquire_timeout."""
+        wait = self.acquire_timeout if acquire_timeout is None else acquire_timeout
+        if not self._slots.acquire(timeout=wait):
+            self.total_rejected += 1
+            raise ComputePoolBusy(f"compute pool full ({self.max_pending} pending)")
+
+        submitted_at = time.time()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self.pending += 1
+            self.total_submitted += 1
+
+        def _release(done: Future):
+            with self._lock:
+                self.pending -= 1
+                self.total_task_time += time.time() - submitted_at
+                if done.exception() is not None:
+                    self.total_failed += 1
+            self._slots.release()
+
+        future.add_done_callback(_release)
+        return future
+
+    def run(self, fn: Callable, *args: Any, timeout: float = COMPUTE_POOL_TASK_TIMEOUT,
+            acquire_timeout: Optional[float] = None) -> Any:
+        """Run fn in the pool and wait (the waiting thread releases the GIL).
+
+        Raises ComputePoolBusy when no slot frees up and TimeoutError when the
+        task overruns; a timed-out task is cancelled if it has not started.
+        """
+        if not self.enabled:
+            return fn(*args)
+        future = self.submit(fn, *args, acquire_timeout=acquire_timeout)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def arun(self, fn: Callable, *args: Any, timeout: float = COMPUTE_POOL_TASK_TIMEOUT,
+                   acquire_timeout: Optional[float] = None) -> Any:
+        """Await fn in the pool without blocking the event loop (same errors as run)."""
+        if not self.enabled:
+            return fn(*args)
+        loop = asyncio.get_running_loop()
+        # Acquiring a slot may block for acquire_timeout; keep that off the loop too
+        future = await loop.run_in_executor(None, functools.partial(self.submit, fn, *args,
+                                                                    acquire_timeout=acquire_timeout))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def warm_up(self):
+        """Start every worker so model loading happens before the first request."""
+        if not self.enabled:
+            return
+        executor = self._get_executor()
+        for future in [executor.submit(_ping) for _ in range(self.workers)]:
+            try:
+                future.result(timeout=300)
+            except Exception as e:
+                print(f"Compute pool warm-up error: {e}")
+
+    def shutdown(self):
+        """Stop worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def get_health_status(self) -> Dict[str, Any]:
+        """Get compute pool health status."""
+        completed = self.total_submitted - self.pending
+        return {
+            "enabled": self.enabled,
+            "workers": self.workers,
+            "started": self._executor is not None,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "total_submitted": self.total_submitted,
+            "total_rejected": self.total_rejected,
+            "total_failed": self.total_failed,
+            "average_task_time": self.total_task_time / completed if completed > 0 else 0.0,
+            "warmup_modules": WARMUP_MODULES,
+            "status": "operational" if self.enabled else "inline"
+        }
+
+# Global compute pool instance
+compute_pool = ComputePool()
+
+def run_cpu_bound(fn: Callable, *args: Any, timeout: float = COMPUTE_POOL_TASK_TIMEOUT,
+                  acquire_timeout: Optional[float] = None) -> Any:
+    """Run a CPU-bound kernel on the shared pool (inline if disabled)."""
+    return compute_pool.run(fn, *args, timeout=timeout, acquire_timeout=acquire_timeout)
+
+async def arun_cpu_bound(fn: Callable, *args: Any, timeout: float = COMPUTE_POOL_TASK_TIMEOUT,
+                         acquire_timeout: Optional[float] = None) -> Any:
+    """Await a CPU-bound kernel on the shared pool (inline if disabled)."""
+    return await compute_pool.arun(fn, *args, timeout=timeout, acquire_timeout=acquire_timeout)
+
+def get_compute_pool_health() -> Dict[str, Any]:
+    """Get compute pool health status."""
+    return compute_pool.get_health_status()
@@ -0,0 +1,81 @@
+"""
+CPU-bound kernels for the shared compute pool
+Plain module-level functions so they pickle into pool workers; imports of
+heavier engine modules happen lazily inside the worker.
+"""
+
+import json
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+def score_pairs_in_chunks(predict: Callable[[List[Tuple[str, str]]], Sequence[float]],
+                          pairs: Sequence[Tuple[str, str]], chunk_size: int, deadline: float,
+                          per_pair_cost_ms: float) -> Tuple[List[float], bool, float]:
+    """Score pairs chunk by chunk until the next chunk would pass deadline (epoch seconds).
+
+    Returns (scores for a prefix of pairs, whether it stopped early, milliseconds
+    spent in predict). The first chunk is always scored.
+    """
+    scores: List[float] = []
+    model_ms = 0.0
+    for offset in range(0, len(pairs), chunk_size):
+        chunk = list(pairs[offset:offset + chunk_size])
+        if scores and time.time() + len(chunk) * per_pair_cost_ms / 1000 > deadline:
+            return scores, True, model_ms
+        chunk_start = time.time()
+        scores.extend(float(score) for score in predict(chunk))
+        model_ms += (time.time() - chunk_start) * 1000
+    return scores, False, model_ms
+
+def predict_rerank_pairs(pairs: Sequence[Tuple[str, str]], chunk_size: int, deadline: float,
+                         per_pair_cost_ms: float) -> Tuple[List[float], bool, float]:
+    """Score a whole rerank batch with the worker's warmed cross-encoder, stopping at the deadline."""
+    from .reranker import reranker
+
+    if reranker.model is None:
+        raise RuntimeError("cross-encoder not initialized in worker")
+    return score_pairs_in_chunks(reranker.model.predict, pairs, chunk_size, deadline, per_pair_cost_ms)
+
+def cosine_similarity_with_boost(vec1: List[float], vec2: List[float]) -> float:
+    """Normalized cosine similarity with the simple magnitude keyword boost."""
+    try:
+        dot_product = sum(a * b for a, b in zip(vec1, vec2))
+        norm1 = sum(a * a for a in vec1) ** 0.5
+        norm2 = sum(b * b for b in vec2) ** 0.5
+
+        if norm1 == 0 or norm2 == 0:
+            return 0.0
+
+        similarity = dot_product / (norm1 * norm2)
+
+        # Boost factor based on vector magnitudes (simple heuristic)
+        boost_factor = min(1.2, 1.0 + (norm1 + norm2) / 1000.0)
+        return min(1.0, similarity * boost_factor)
+    except Exception:
+        return 0.0
+
+def score_embedding_rows(query_embedding: List[float], rows: List[Tuple[str, str, str]],
+                         min_similarity: float) -> List[Dict[str, Any]]:
+    """Decode stored embeddings and keep rows above min_similarity."""
+    matches = []
+    for text, embedding_json, metadata_json in rows:
+        try:
+            stored_embedding = json.loads(embedding_json)
+            similarity = cosine_similarity_with_boost(query_embedding, stored_embedding)
+
+            if similarity >= min_similarity:
+                matches.append({
+                    "text": text,
+                    "similarity": similarity,
+                    "metadata": json.loads(metadata_json) if metadata_json else {}
+                })
+        except Exception as e:
+            print(f"Error processing embedding: {e}")
+            continue
+    return matches
+
+def analyze_job_postings(postings: List[Dict[str, Any]]) -> list:
+    """Run OSINT keyword scans over a batch of postings."""
+    from .osint_forensics import osint_forensics
+
+    return [osint_forensics.analyze_job_posting(posting) for posting in postings]
@@ -1,7 +1,9 @@
 import os
 import re
+import asyncio
 import logging
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -17,6 +19,7 @@ from fastapi import (
     UploadFile,
 )
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 import hashlib
 import secrets
@@ -79,7 +82,7 @@ from .rag_engine import (
     get_rag_response, get_rag_health, discover_domain_adjacent_opportunities_rag
 )
 from .rag_source_discovery import (
-    discover_sources_for_query, get_optimal_sources_for_query, get_discovery_analytics
+    discover_sources_for_query, get_discovery_analytics
 )
 from .cost_controls import check_cost_limits, check_resource_limits, record_usage, get_usage_analytics
 from .competitive_intelligence import (
@@ -91,14 +94,23 @@ from .osint_forensics import analyze_company_osint, get_osint_health
 from .domain_adjacent_search import discover_domain_adjacent_opportunities, get_domain_adjacent_health
 from .analytics import get_analytics_dashboard, export_analytics_csv, get_analytics_health
 from .reranker import get_reranker_health
+from .compute_pool import compute_pool, get_compute_pool_health
+from .skill_extractor import get_skill_extractor_health
+from .job_matching import rank_opportunities, get_job_matching_health
+from .source_router import route_sources, record_search_outcome, get_source_router_health
 from .corpus_reindex import reindex_corpus, get_reindex_status
 from .settings import get_feature_flag
 from .job_sources import (
-    GreenhouseSource, SerpApiSource, RedditSource, IndeedSource,
-    LinkedInSource, GlassdoorSource, RemoteOKSource, WeWorkRemotelySource,
-    DiceSource, MonsterSource, ZipRecruiterSource, CareerBuilderSource,
-    HackerNewsSource
+    init_sources, get_sources, get_enabled_sources, close_http_session, fan_out_executor,
+    job_index, start_ingestion, stop_ingestion, request_crawl, get_ingestion_health, dedupe_jobs, dedupe_against,
+    get_source_health_dashboard, remember_jobs, get_job_record,
+    start_greenhouse_crawler, stop_greenhouse_crawler, add_greenhouse_boards, validate_board_tokens,
+    get_greenhouse_crawler_health,
+    SearchCursor, InvalidCursor, query_key, per_source_limit, paginate_live,
+    posting_filter, posting_facets, get_normalizer_health,
+    saved_searches, percolate_jobs, get_saved_search_health
 )
+from .job_sources.job_vectors import index_job_vectors
 
 app = FastAPI()
 logger = logging.getLogger(__name__)
@@ -246,6 +258,19 @@ class ResumeVersionResponse(BaseModel):
     versions: List[Dict[str, Any]]
 
 
+class SavedSearchRequest(BaseModel):
+    query: str = Field(..., min_length=1)
+    name: Optional[str] = None
+    location: Optional[str] = None
+    remote: Optional[bool] = None
+    sources: Optional[List[str]] = None
+    radius_km: Optional[float] = None
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    currency: str = "USD"
+    min_similarity: Optional[float] = Field(None, ge=-1.0, le=1.0)
+
+
 def _clamp(value: float) -> int:
     return max(0, min(100, round(value)))
 
@@ -527,9 +552,27 @@ async def _startup():
     except Exception as e:
         print(f"⚠️ Failed to clear cache on startup: {e}")
 
+    # Create long-lived job source singletons (shared HTTP pool, persistent rate limits)
+    init_sources()
+
+    # Keep the local job index fresh so /jobs/search rarely has to go live
+    start_ingestion(lambda: get_enabled_sources(include_stubbed=get_feature_flag("JOB_SOURCES_STUBBED_ENABLED")))
+    start_greenhouse_crawler()
+
+    # Start compute pool workers (and load their models) without delaying readiness
+    threading.Thread(target=compute_pool.warm_up, name="compute-pool-warmup", daemon=True).start()
+
     SERVICE_READY.set()
 
 
+@app.on_event("shutdown")
+async def _shutdown():
+    compute_pool.shutdown()
+    stop_ingestion()
+    stop_greenhouse_crawler()
+    close_http_session()
+
+
 @app.get("/")
 def root():
     s = get_settings()
@@ -890,12 +933,17 @@ async def wimd_upload(
 
 
 @app.get("/ob/opportunities", response_model=OpportunitiesResponse)
-def ob_opportunities(session_header: Optional[str] = Header(None, alias="X-Session-ID")):
+def ob_opportunities(
+    limit: int = 10,
+    rerank: bool = False,
+    session_header: Optional[str] = Header(None, alias="X-Session-ID"),
+):
     session_id = _resolve_session(None, session_header, allow_create=False)
     metrics = latest_metrics(session_id)
     if not metrics:
         raise HTTPException(status_code=404, detail="metrics_not_ready")
-    matches = _generate_matches(metrics)
+    # Rank indexed postings against the profile vector; the static library covers empty indexes
+    matches = rank_opportunities(session_id, max(1, min(limit, 50)), rerank) or _generate_matches(metrics)
     store_job_matches(session_id, matches)
     return OpportunitiesResponse(session_id=session_id, opportunities=matches)
 
@@ -1484,10 +1532,90 @@ def health_rag():
         }
 
 # Job Sources Endpoints
+def _job_summary(job) -> Dict[str, Any]:
+    """Search-result view of a JobPosting (description truncated)."""
+    return {
+        "id": job.id,
+        "title": job.title,
+        "company": job.company,
+        "location": job.location,
+        "description": job.description[:200] + "..." if len(job.description) > 200 else job.description,
+        "url": job.url,
+        "source": job.source,
+        "remote": job.remote,
+        "skills": job.skills,
+        "experience_level": job.experience_level,
+        "salary_range": job.salary_range,
+        "normalized": posting_facets(job),
+        "alternates": job.metadata.get("alternates", [])
+    }
+
+
+def _write_through_jobs(jobs: List[Any]):
+    """Index live results so the next identical query is an index hit, then alert on new postings.
+
+    Runs after the response is sent; postings are embedded before percolation
+    so similarity-threshold saved searches can match them.
+    """
+    try:
+        new_jobs = job_index.unseen(jobs)
+        job_index.upsert(jobs)
+        index_job_vectors(new_jobs)
+        percolate_jobs(new_jobs)
+    except Exception as e:
+        print(f"Job index write-through failed: {e}")
+
+
 @app.get("/jobs/search")
-def jobs_search(query: str, location: str = None, limit: int = 10):
-    """Search jobs across all sources"""
+async def jobs_search(background: BackgroundTasks, query: str, location: str = None, limit: int = 10,
+                      offset: int = 0,
+                      remote: Optional[bool] = None, source: Optional[str] = None,
+                      cursor: Optional[str] = None, radius_km: Optional[float] = None,
+                      salary_min: Optional[float] = None, salary_max: Optional[float] = None,
+                      currency: str = "USD"):
+    """Search jobs across all sources (local index first, live sources on a miss)
+
+    Pass the returned next_cursor to fetch the following page; it resumes the
+    index or each live source where the previous page stopped. offset applies
+    to index results only and is superseded by cursor. radius_km limits results
+    to postings within that distance of a city-level location; salary_min and
+    salary_max are annual amounts in currency.
+    """
     try:
+        cursor_key = query_key(query, location, remote, source, radius_km, salary_min, salary_max, currency)
+        page_cursor = None
+        if cursor:
+            try:
+                page_cursor = SearchCursor.decode(cursor, cursor_key)
+            except InvalidCursor as e:
+                return {"error": str(e), "invalid_cursor": True}
+        
+        # Served from the local index: no upstream calls, so no cost/resource charge
+        if page_cursor is None or page_cursor.mode == "index":
+            start = time.time()
+            index_offset = page_cursor.offset if page_cursor else offset
+            indexed_jobs, total = await asyncio.to_thread(
+                job_index.search, query, location, remote, [source] if source else None, limit, index_offset,
+                None, radius_km, salary_min, salary_max, currency
+            )
+            if total > 0 or page_cursor is not None:
+                next_offset = index_offset + len(indexed_jobs)
+                next_cursor = None
+                if next_offset < total:
+                    next_cursor = SearchCursor(cursor_key, "index", offset=next_offset).encode()
+                return {
+                    "query": query,
+                    "location": location,
+                    "served_from": "index",
+                    "total_results": total,
+                    "offset": index_offset,
+                    "next_cursor": next_cursor,
+                    "sources_used": len({job.source for job in indexed_jobs}),
+                    "partial": False,
+                    "elapsed_ms": round((time.time() - start) * 1000, 1),
+                    "jobs": [_job_summary(job) for job in dedupe_jobs(indexed_jobs)]
+                }
+        
         # Check cost limits first
         cost_check = check_cost_limits("job_search", 0.01)  # $0.01 per job search
         if not cost_check["allowed"]:
@@ -1504,31 +1632,46 @@ def jobs_search(query: str, location: str = None, limit: int = 10):
                 "resource_limit": True
             }
         
-        # Initialize job sources
-        greenhouse = GreenhouseSource()
-        serpapi = SerpApiSource()
-        reddit = RedditSource()
+        # Long-lived job sources; a live cursor only carries sources that are not exhausted
+        source_names = [source] if source else ["greenhouse", "serpapi", "reddit"]
+        if page_cursor is not None:
+            source_offsets = {name: page_cursor.source_offsets[name]
+                              for name in source_names if name in page_cursor.source_offsets}
+            seen = page_cursor.seen
+        else:
+            source_offsets = {name: 0 for name in source_names}
+            seen = []
+        sources = get_sources(list(source_offsets))
         
-        all_jobs = []
-        success_count = 0
+        # Each source is asked for its share of the page, resuming from its own offset
+        page_size = per_source_limit(limit, len(sources))
+        fan_out = await fan_out_executor.run(sources, query, location, page_size,
+                                             stop_after=limit, offsets=source_offsets)
+        record_search_outcome(query, location, fan_out.timings)
+        success_count = len(fan_out.used_sources)
+        if page_cursor is None:
+            # Index miss: crawl this query in depth ahead of the scheduled seeds
+            await asyncio.to_thread(
+                request_crawl, [name for name, job_source in sources.items() if not job_source.self_indexed],
+                query, location
+            )
         
-        # Search each source
-        for source in [greenhouse, serpapi, reddit]:
-            try:
-                jobs = source.search_jobs(query, location, limit)
-                all_jobs.extend(jobs)
-                success_count += 1
-            except Exception as e:
-                print(f"Error searching {source.name}: {e}")
-                continue
+        # Merge, drop postings already returned on earlier pages, collapse cross-board duplicates
+        normalized_keep = posting_filter(location, radius_km, salary_min, salary_max, currency)
+        keep = None
+        if remote is not None or normalized_keep is not None:
+            keep = lambda job: ((remote is None or job.remote == remote)
+                                and (normalized_keep is None or normalized_keep(job)))
+        page_jobs, next_offsets, seen = await asyncio.to_thread(
+            paginate_live, fan_out.jobs_by_source, list(sources), limit, source_offsets,
+            {name: page_size for name in sources}, fan_out.used_sources, seen, keep
+        )
+        remember_jobs(page_jobs)  # cluster representatives carry their alternates
+        next_cursor = SearchCursor(cursor_key, "live", source_offsets=next_offsets, seen=seen).encode() \
+            if next_offsets else None
         
-        # Remove duplicates and limit results
-        unique_jobs = []
-        seen_ids = set()
-        for job in all_jobs:
-            if job.id not in seen_ids:
-                unique_jobs.append(job)
-                seen_ids.add(job.id)
+        # Write live results through off the request path (sync tasks run in the threadpool)
+        background.add_task(_write_through_jobs, page_jobs)
         
         # Record usage
         record_usage("job_search", 0.01, success_count > 0)
@@ -1536,151 +1679,183 @@ def jobs_search(query: str, location: str = None, limit: int = 10):
         return {
             "query": query,
             "location": location,
-            "total_results": len(unique_jobs),
+            "served_from": "live",
+            "total_results": len(page_jobs),
+            "next_cursor": next_cursor,
             "sources_used": success_count,
-            "jobs": [
-                {
-                    "id": job.id,
-                    "title": job.title,
-                    "company": job.company,
-                    "location": job.location,
-                    "description": job.description[:200] + "..." if len(job.description) > 200 else job.description,
-                    "url": job.url,
-                    "source": job.source,
-                    "remote": job.remote,
-                    "skills": job.skills,
-                    "experience_level": job.experience_level
-                }
-                for job in unique_jobs[:limit]
-            ]
+            "partial": fan_out.partial,
+            "elapsed_ms": round(fan_out.elapsed * 1000, 1),
+            "source_timings": {name: timing.to_dict() for name, timing in fan_out.timings.items()},
+            "jobs": [_job_summary(job) for job in page_jobs]
         }
     except Exception as e:
         record_usage("job_search", 0.01, False)
         return {"error": str(e)}
 
 @app.get("/jobs/search/rag")
-def jobs_search_rag(query: str, location: str = None, limit: int = 10):
-    """RAG-powered job search with dynamic source discovery"""
+async def jobs_search_rag(query: str, location: str = None, limit: int = 10):
+    """Job search with sources ranked by the statistics-based source router"""
     try:
-        # Use RAG to discover optimal sources
-        optimal_sources = get_optimal_sources_for_query(query, location)
-        
-        # Initialize all available sources (production-ready only by default)
-        source_map = {
-            # Production-ready sources (no API key required)
-            "greenhouse": GreenhouseSource(),
-            "serpapi": SerpApiSource(),
-            "reddit": RedditSource(),
-            "remoteok": RemoteOKSource(),
-            "weworkremotely": WeWorkRemotelySource(),
-            "hackernews": HackerNewsSource()
-        }
-        
-        # Add stubbed sources only if feature flag is enabled
-        if get_feature_flag("JOB_SOURCES_STUBBED_ENABLED"):
-            source_map.update({
-                "indeed": IndeedSource(),
-                "linkedin": LinkedInSource(),
-                "glassdoor": GlassdoorSource(),
-                "dice": DiceSource(),
-                "monster": MonsterSource(),
-                "ziprecruiter": ZipRecruiterSource(),
-                "careerbuilder": CareerBuilderSource()
-            })
+        # Production-ready sources, plus scraping/RSS sources if the feature flag is enabled
+        source_map = get_enabled_sources(include_stubbed=get_feature_flag("JOB_SOURCES_STUBBED_ENABLED"))
         
-        all_jobs = []
-        used_sources = []
-        
-        # Search optimal sources first
-        for source_name in optimal_sources:
-            if source_name in source_map:
-                try:
-                    source = source_map[source_name]
-                    jobs = source.search_jobs(query, location, limit)
-                    all_jobs.extend(jobs)
-                    used_sources.append(source_name)
-                except Exception as e:
-                    print(f"Error searching {source_name}: {e}")
-                    continue
+        # Rank sources from logged outcomes (in-memory, no LLM call); best-ranked sources come first
+        route = route_sources(query, location, list(source_map))
+        source_order = route.order
+        fan_out = await fan_out_executor.run(source_map, query, location, limit, stop_after=limit)
+        record_search_outcome(query, location, fan_out.timings)
+        used_sources = [name for name in source_order if name in fan_out.used_sources]
         
-        # Fallback to other sources if needed
-        if len(all_jobs) < limit:
-            for source_name, source in source_map.items():
-                if source_name not in used_sources:
-                    try:
-                        jobs = source.search_jobs(query, location, limit)
-                        all_jobs.extend(jobs)
-                        used_sources.append(source_name)
-                    except Exception as e:
-                        print(f"Error searching {source_name}: {e}")
-                        continue
-        
-        # Remove duplicates and limit results
-        unique_jobs = []
-        seen_ids = set()
-        for job in all_jobs:
-            if job.id not in seen_ids:
-                unique_jobs.append(job)
-                seen_ids.add(job.id)
+        # Collapse the same posting listed by several boards, then limit results
+        unique_jobs = await asyncio.to_thread(dedupe_jobs, fan_out.ordered_jobs(source_order))
+        remember_jobs(unique_jobs)  # cluster representatives carry their alternates
         
         return {
             "query": query,
             "location": location,
             "rag_optimized": True,
-            "optimal_sources": optimal_sources,
+            "optimal_sources": route.optimal,
+            "routing": {"cold_start": route.cold_start, "scores": route.scores},
             "used_sources": used_sources,
             "total_results": len(unique_jobs),
-            "jobs": [
-                {
-                    "id": job.id,
-                    "title": job.title,
-                    "company": job.company,
-                    "location": job.location,
-                    "description": job.description[:200] + "..." if len(job.description) > 200 else job.description,
-                    "url": job.url,
-                    "source": job.source,
-                    "remote": job.remote,
-                    "skills": job.skills,
-                    "experience_level": job.experience_level
-                }
-                for job in unique_jobs[:limit]
-            ]
+            "partial": fan_out.partial,
+            "elapsed_ms": round(fan_out.elapsed * 1000, 1),
+            "source_timings": {name: timing.to_dict() for name, timing in fan_out.timings.items()},
+            "jobs": [_job_summary(job) for job in unique_jobs[:limit]]
         }
     except Exception as e:
         return {"error": str(e)}
 
+def _stream_event(event: str, payload: Dict[str, Any], fmt: str) -> str:
+    """Encode one stream event as an SSE frame or an NDJSON line."""
+    import json
+    if fmt == "sse":
+        return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+    return json.dumps({"event": event, **payload}, default=str) + "\n"
+
+
+@app.get("/jobs/search/rag/stream")
+async def jobs_search_rag_stream(query: str, location: str = None, limit: int = 10, format: str = "ndjson"):
+    """Streaming /jobs/search/rag: one `jobs` event per source as it returns, then a `summary` event.
+
+    format=ndjson (default) emits one JSON object per line; format=sse emits
+    Server-Sent Events. Jobs already sent are never repeated: each batch is
+    deduplicated against everything emitted before it.
+    """
+    fmt = "sse" if format == "sse" else "ndjson"
+    source_map = get_enabled_sources(include_stubbed=get_feature_flag("JOB_SOURCES_STUBBED_ENABLED"))
+
+    async def events():
+        start = time.time()
+        route = route_sources(query, location, list(source_map))
+        emitted = []
+        timings = {}
+        partial = False
+        try:
+            async for batch in fan_out_executor.stream(source_map, query, location, limit, stop_after=limit):
+                timings[batch.source] = batch.timing
+                partial = partial or batch.timing.status != "ok"
+                new_jobs = await asyncio.to_thread(dedupe_against, emitted, batch.jobs)
+                new_jobs = new_jobs[:max(0, limit - len(emitted))]
+                emitted.extend(new_jobs)
+                remember_jobs(new_jobs)
+                yield _stream_event("jobs", {
+                    "source": batch.source,
+                    "timing": batch.timing.to_dict(),
+                    "jobs": [_job_summary(job) for job in new_jobs]
+                }, fmt)
+
+            record_search_outcome(query, location, timings)
+            ok_sources = [name for name, timing in timings.items() if timing.status == "ok"]
+            used_sources = [name for name in route.order if name in ok_sources]
+            used_sources += [name for name in ok_sources if name not in used_sources]
+            yield _stream_event("summary", {
+                "query": query,
+                "location": location,
+                "rag_optimized": True,
+                "optimal_sources": route.optimal,
+                "routing": {"cold_start": route.cold_start, "scores": route.scores},
+                "used_sources": used_sources,
+                "total_results": len(emitted),
+                "partial": partial,
+                "elapsed_ms": round((time.time() - start) * 1000, 1),
+                "source_timings": {name: timing.to_dict() for name, timing in timings.items()}
+            }, fmt)
+        except Exception as e:
+            yield _stream_event("error", {"error": str(e)}, fmt)
+
+    media_type = "text/event-stream" if fmt == "sse" else "application/x-ndjson"
+    return StreamingResponse(events(), media_type=media_type,
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+# Saved searches are matched against new postings as they are indexed; matches queue as alerts
+def _require_user(user_id: str) -> str:
+    """Reject callers that are not registered users (as /auth/me does)."""
+    if not get_user_by_id(user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+    return user_id
+
+@app.post("/jobs/saved-searches")
+def create_saved_search(payload: SavedSearchRequest, user_id: str = Header(..., alias="X-User-ID")):
+    """Save a search; new postings matching it are queued as alerts."""
+    _require_user(user_id)
+    try:
+        search = saved_searches.create(user_id, **payload.model_dump())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return search.to_dict()
+
+@app.get("/jobs/saved-searches")
+def list_saved_searches(user_id: str = Header(..., alias="X-User-ID")):
+    """List the caller's saved searches."""
+    _require_user(user_id)
+    return {"saved_searches": [search.to_dict() for search in saved_searches.list(user_id)]}
+
+@app.delete("/jobs/saved-searches/{search_id}")
+def delete_saved_search(search_id: str, user_id: str = Header(..., alias="X-User-ID")):
+    """Delete a saved search and its undelivered alerts."""
+    _require_user(user_id)
+    if not saved_searches.delete(user_id, search_id):
+        raise HTTPException(status_code=404, detail="saved_search_not_found")
+    return {"deleted": search_id}
+
+@app.get("/jobs/alerts")
+def get_job_alerts(limit: int = 100, user_id: str = Header(..., alias="X-User-ID")):
+    """Undelivered new-posting alerts for the caller, oldest first."""
+    _require_user(user_id)
+    return {"alerts": saved_searches.pending_alerts(user_id, max(1, min(limit, 500)))}
+
+@app.post("/jobs/alerts/delivered")
+def mark_job_alerts_delivered(alert_ids: List[int] = Body(..., embed=True),
+                              user_id: str = Header(..., alias="X-User-ID")):
+    """Remove delivered alerts from the caller's queue."""
+    _require_user(user_id)
+    return {"delivered": saved_searches.mark_delivered(user_id, alert_ids)}
+
 @app.get("/jobs/{job_id}")
 def get_job_details(job_id: str):
     """Get detailed job information"""
     try:
-        # Try each source to find the job
-        sources = [GreenhouseSource(), SerpApiSource(), RedditSource()]
-        
-        for source in sources:
-            try:
-                job = source.get_job_details(job_id)
-                if job:
-                    return {
-                        "id": job.id,
-                        "title": job.title,
-                        "company": job.company,
-                        "location": job.location,
-                        "description": job.description,
-                        "url": job.url,
-                        "source": job.source,
-                        "posted_date": job.posted_date.isoformat() if job.posted_date else None,
-                        "salary_range": job.salary_range,
-                        "job_type": job.job_type,
-                        "remote": job.remote,
-                        "skills": job.skills,
-                        "experience_level": job.experience_level,
-                        "metadata": job.metadata
-                    }
-            except Exception as e:
-                print(f"Error getting job details from {source.name}: {e}")
-                continue
-        
-        return {"error": "Job not found"}
+        # Populated by every search and ingestion run (full description)
+        job = get_job_record(job_id)
+        if job is None:
+            return {"error": "Job not found"}
+        return {
+            "id": job.id,
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "description": job.description,
+            "url": job.url,
+            "source": job.source,
+            "posted_date": job.posted_date.isoformat() if job.posted_date else None,
+            "salary_range": job.salary_range,
+            "job_type": job.job_type,
+            "remote": job.remote,
+            "skills": job.skills,
+            "experience_level": job.experience_level,
+            "metadata": job.metadata
+        }
     except Exception as e:
         return {"error": str(e)}
 
@@ -1953,6 +2128,69 @@ def get_reranker_health_endpoint():
     """Get cross-encoder reranker health status."""
     return get_reranker_health()
 
+@app.get("/health/compute")
+def get_compute_pool_health_endpoint():
+    """Get shared CPU compute pool health status."""
+    return get_compute_pool_health()
+
+@app.get("/health/jobs/index")
+def get_job_index_health_endpoint():
+    """Get local job index and ingestion scheduler status."""
+    return get_ingestion_health()
+
+@app.get("/health/jobs/saved-searches")
+def get_saved_search_health_endpoint():
+    """Saved search count, percolator index size and alert queue depth."""
+    return get_saved_search_health()
+
+@app.get("/health/jobs/sources")
+def get_job_source_health_endpoint():
+    """Per-source circuit state, success rate, p95 latency and yield."""
+    return get_source_health_dashboard()
+
+@app.get("/health/jobs/greenhouse")
+def get_greenhouse_crawler_health_endpoint():
+    """Greenhouse board catalog size and crawler status."""
+    return get_greenhouse_crawler_health()
+
+@app.get("/health/jobs/vectors")
+def get_job_matching_health_endpoint():
+    """Job vector index size, embedding backend and opportunity ranking stats."""
+    return get_job_matching_health()
+
+@app.get("/health/jobs/router")
+def get_source_router_health_endpoint():
+    """Source router stats: per-source estimates, cold starts and LLM seeds."""
+    return get_source_router_health()
+
+@app.get("/health/jobs/normalize")
+def get_job_normalizer_health_endpoint():
+    """Location gazetteer size and normalizer cache stats."""
+    return get_normalizer_health()
+
+@app.get("/health/skills")
+def get_skill_extractor_health_endpoint():
+    """Skills taxonomy size and compiled matcher stats."""
+    return get_skill_extractor_health()
+
+def _require_admin(admin_key: Optional[str]):
+    """Reject callers without the configured admin key (admin endpoints are off when it is unset)."""
+    expected = get_settings().ADMIN_API_KEY
+    if not expected or not admin_key or not secrets.compare_digest(admin_key, expected):
+        raise HTTPException(status_code=403, detail="Admin key required")
+
+@app.post("/jobs/sources/greenhouse/boards")
+def add_greenhouse_boards_endpoint(tokens: List[str] = Body(..., embed=True),
+                                   admin_key: Optional[str] = Header(None, alias="X-Admin-Key")):
+    """Add Greenhouse board tokens to the crawl catalog (admin only)."""
+    _require_admin(admin_key)
+    try:
+        tokens = validate_board_tokens(tokens)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    added = add_greenhouse_boards({"token": token} for token in tokens)
+    return {"added": added, "requested": len(tokens)}
+
 # Corpus Reindex Endpoints
 @app.post("/corpus/reindex")
 def reindex_corpus_endpoint():
@@ -0,0 +1,235 @@
+"""
+Profile-to-job Matching for Mosaic 2.0
+Builds a profile vector from a session's PS101 responses, coaching messages
+and uploaded documents, then ranks the precomputed job vector index by cosine
+similarity with per-field boosts and optional cross-encoder reranking.
+"""
+
+import hashlib
+import os
+import time
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from xml.etree import ElementTree
+
+from .job_sources.base import JobPosting, TTLCache
+from .job_sources.job_vectors import job_vectors
+from .job_sources.records import get_job_record
+from .reranker import rerank_documents
+from .skill_extractor import extract_skills
+from .storage import get_session_data, list_file_paths, wimd_history
+
+try:
+    from pypdf import PdfReader
+    PDF_AVAILABLE = True
+except ImportError:
+    PDF_AVAILABLE = False
+
+JOB_MATCH_CANDIDATES = int(os.getenv("JOB_MATCH_CANDIDATES", "200"))         # vector hits considered before boosts
+JOB_MATCH_SKILL_BOOST = float(os.getenv("JOB_MATCH_SKILL_BOOST", "0.15"))    # x share of the posting's skills the user has
+JOB_MATCH_TITLE_BOOST = float(os.getenv("JOB_MATCH_TITLE_BOOST", "0.10"))    # a profile skill appears in the title
+JOB_MATCH_RECENCY_BOOST = float(os.getenv("JOB_MATCH_RECENCY_BOOST", "0.05"))  # decays to 0 over JOB_MATCH_RECENCY_DAYS
+JOB_MATCH_RECENCY_DAYS = int(os.getenv("JOB_MATCH_RECENCY_DAYS", "30"))
+JOB_MATCH_PROFILE_TTL = int(os.getenv("JOB_MATCH_PROFILE_TTL", "3600"))      # seconds a profile vector is reused
+PROFILE_MAX_CHARS = 12000
+UPLOAD_MAX_CHARS = 6000
+UPLOAD_MAX_BYTES = 2 * 1024 * 1024
+TEXT_SUFFIXES = {".txt", ".md", ".markdown", ".csv", ".json", ".rtf", ".html", ".htm"}
+
+def _read_docx(path: Path) -> str:
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    namespace = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    return "\n".join(
+        "".join(node.text or "" for node in paragraph.iter(f"{namespace}t"))
+        for paragraph in root.iter(f"{namespace}p")
+    )
+
+def _read_upload(path: Path, content_type: str) -> str:
+    """Best-effort plain text from an uploaded resume or notes file."""
+    if not path.exists() or path.stat().st_size > UPLOAD_MAX_BYTES:
+        return ""
+    suffix = path.suffix.lower()
+    if suffix == ".docx":
+        return _read_docx(path)[:UPLOAD_MAX_CHARS]
+    if suffix == ".pdf":
+        if not PDF_AVAILABLE:
+            return ""
+        reader = PdfReader(str(path))
+        text = []
+        for page in reader.pages:
+            text.append(page.extract_text() or "")
+            if sum(len(chunk) for chunk in text) >= UPLOAD_MAX_CHARS:
+                break
+        return "\n".join(text)[:UPLOAD_MAX_CHARS]
+    if suffix in TEXT_SUFFIXES or (content_type or "").startswith("text/"):
+        return path.read_text(errors="ignore")[:UPLOAD_MAX_CHARS]
+    return ""
+
+class JobMatcher:
+    """Ranks indexed postings against a session's profile vector."""
+
+    def __init__(self):
+        self.profiles = TTLCache(max_entries=2000, default_ttl=JOB_MATCH_PROFILE_TTL)
+        self.uploads = TTLCache(max_entries=4000, default_ttl=JOB_MATCH_PROFILE_TTL)
+        self.total_matches = 0
+        self.total_fallbacks = 0
+        self.average_latency = 0.0
+
+    def upload_text(self, path: Path, content_type: str) -> str:
+        """_read_upload, re-parsed only when the file's (path, mtime, size) changes."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return ""
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        text = self.uploads.get(key)
+        if text is None:
+            text = _read_upload(path, content_type)
+            self.uploads.set(key, text)
+        return text
+
+    def build_profile_text(self, session_id: str) -> str:
+        """PS101 answers first (most deliberate), then recent coaching prompts, then uploads."""
+        parts: List[str] = []
+        session_data = get_session_data(session_id) or {}
+        parts.extend(item.get("response", "") for item in session_data.get("ps101_responses", []))
+
+        try:
+            parts.extend(entry["prompt"] for entry in wimd_history(session_id, limit=10) if entry.get("prompt"))
+        except Exception as e:
+            print(f"Profile history lookup failed for {session_id}: {e}")
+
+        try:
+            for upload in list_file_paths(session_id):
+                try:
+                    parts.append(self.upload_text(Path(upload["file_path"]), upload.get("file_type")))
+                except Exception as e:
+                    print(f"Could not read upload {upload.get('filename')}: {e}")
+        except Exception as e:
+            print(f"Upload lookup failed for {session_id}: {e}")
+
+        return "\n".join(part.strip() for part in parts if part and part.strip())[:PROFILE_MAX_CHARS]
+
+    def get_profile(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Profile text, vector and skills; re-embedded only when the underlying text changes."""
+        text = self.build_profile_text(session_id)
+        if not text:
+            return None
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        cached = self.profiles.get(session_id)
+        if cached and cached["hash"] == digest:
+            return cached
+        profile = {
+            "hash": digest,
+            "text": text,
+            "vector": job_vectors.embed_query(text),
+            "skills": {skill.lower() for skill in extract_skills(text)}
+        }
+        self.profiles.set(session_id, profile)
+        return profile
+
+    def _boost(self, job: JobPosting, similarity: float, profile_skills: set) -> Dict[str, float]:
+        job_skills = {skill.lower() for skill in job.skills or []}
+        skill_share = len(job_skills & profile_skills) / len(job_skills) if job_skills else 0.0
+        title_hit = any(skill.lower() in profile_skills for skill in extract_skills(job.title))
+        recency = 0.0
+        if job.posted_date:
+            age_days = (datetime.now(job.posted_date.tzinfo) - job.posted_date).days
+            recency = max(0.0, 1.0 - age_days / JOB_MATCH_RECENCY_DAYS)
+        boosts = {
+            "skills": JOB_MATCH_SKILL_BOOST * skill_share,
+            "title": JOB_MATCH_TITLE_BOOST if title_hit else 0.0,
+            "recency": JOB_MATCH_RECENCY_BOOST * recency
+        }
+        boosts["score"] = similarity + sum(boosts.values())
+        return boosts
+
+    def rank(self, session_id: str, limit: int = 10, rerank: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """Top-k opportunity dicts for a session, or None when there is no profile or no vectors."""
+        start = time.time()
+        profile = self.get_profile(session_id)
+        if profile is None:
+            self.total_fallbacks += 1
+            return None
+        hits = job_vectors.search(profile["vector"], k=max(limit, JOB_MATCH_CANDIDATES))
+        if not hits:
+            self.total_fallbacks += 1
+            return None
+
+        candidates = []
+        for job_id, similarity in hits:
+            job = get_job_record(job_id)
+            if job is None:
+                continue
+            boosts = self._boost(job, similarity, profile["skills"])
+            candidates.append({
+                "job": job,
+                "similarity": boosts.pop("score"),
+                "vector_similarity": similarity,
+                "boosts": boosts,
+                "text": f"{job.title} at {job.company}. {job.description[:1000]}"
+            })
+        candidates.sort(key=lambda item: item["similarity"], reverse=True)
+
+        reranked = False
+        if rerank and candidates:
+            try:
+                result = rerank_documents(profile["text"][:2000], candidates[:max(limit * 3, 20)])
+                candidates = result.reranked_documents + candidates[max(limit * 3, 20):]
+                reranked = not result.skipped
+            except Exception as e:
+                print(f"Opportunity reranking failed, using vector order: {e}")
+
+        matches = [self._to_match(item, profile["skills"], reranked) for item in candidates[:limit]]
+        self.total_matches += 1
+        latency = time.time() - start
+        self.average_latency = latency if self.total_matches == 1 else self.average_latency * 0.9 + latency * 0.1
+        return matches
+
+    @staticmethod
+    def _to_match(item: Dict[str, Any], profile_skills: set, reranked: bool) -> Dict[str, Any]:
+        job: JobPosting = item["job"]
+        return {
+            "job_id": job.id,
+            "role": job.title,
+            "company": job.company,
+            "location": job.location,
+            "fit_score": max(0, min(100, round(item["similarity"] * 100))),
+            "skills_match": [skill for skill in job.skills if skill.lower() in profile_skills],
+            "values_match": [],
+            "extras": {
+                "source": job.source,
+                "url": job.url,
+                "vector_similarity": round(item["vector_similarity"], 4),
+                "boosts": {field: round(value, 4) for field, value in item["boosts"].items()},
+                "reranked": reranked
+            }
+        }
+
+    def get_health_status(self) -> Dict[str, Any]:
+        return {
+            "vector_index": job_vectors.stats(),
+            "profiles_cached": self.profiles.stats(),
+            "uploads_cached": self.uploads.stats(),
+            "total_matches": self.total_matches,
+            "total_fallbacks": self.total_fallbacks,
+            "average_latency": self.average_latency,
+            "pdf_uploads_supported": PDF_AVAILABLE
+        }
+
+# Global job matcher instance
+job_matcher = JobMatcher()
+
+def rank_opportunities(session_id: str, limit: int = 10, rerank: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """Vector-ranked opportunities; None means the caller should use its fallback."""
+    try:
+        return job_matcher.rank(session_id, limit, rerank)
+    except Exception as e:
+        print(f"Vector opportunity ranking failed: {e}")
+        return None
+
+def get_job_matching_health() -> Dict[str, Any]:
+    return job_matcher.get_health_status()
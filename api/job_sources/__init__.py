@@ -3,7 +3,7 @@ Job Sources Interface for Mosaic 2.0
 Provides standardized interface for different job data sources.
 """
 
-from .base import JobSource, JobPosting
+from .base import JobSource, JobPosting, FeedCache, feed_cache
 from .greenhouse import GreenhouseSource
 from .serpapi import SerpApiSource
 from .reddit import RedditSource
@@ -17,10 +17,29 @@ from .monster import MonsterSource
 from .ziprecruiter import ZipRecruiterSource
 from .careerbuilder import CareerBuilderSource
 from .hackernews import HackerNewsSource
+from .http import get_http_session, get_async_client, close_http_session, set_http_mode, get_http_mode, run_sync
+from .registry import init_sources, get_source, get_sources, get_enabled_sources
+from .fanout import FanOutExecutor, FanOutResult, SourceTiming, fan_out_executor
+from .job_index import JobIndex, job_index
+from .normalize import parse_location, parse_salary, posting_filter, posting_facets, get_normalizer_health
+from .dedupe import dedupe_jobs, dedupe_against
+from .health import SourceUnavailable, source_health, get_source_health_dashboard
+from .records import JobRecordStore, job_records, remember_jobs, get_job_record
+from .greenhouse_crawler import (
+    BoardCatalog, GreenhouseCrawler, start_greenhouse_crawler, stop_greenhouse_crawler,
+    add_greenhouse_boards, validate_board_tokens, get_greenhouse_crawler_health
+)
+from .pagination import SearchCursor, InvalidCursor, query_key, per_source_limit, paginate_live
+from .rate_limits import RateLimited, RateLimiter, rate_limiter, crawl_priority
+from .crawl_queue import CrawlQueue, CrawlScheduler
+from .saved_searches import SavedSearch, SavedSearchStore, saved_searches, percolate_jobs, get_saved_search_health
+from .ingestion import IngestionScheduler, start_ingestion, stop_ingestion, request_crawl, get_ingestion_health
 
 __all__ = [
     'JobSource',
-    'JobPosting', 
+    'JobPosting',
+    'FeedCache',
+    'feed_cache',
     'GreenhouseSource',
     'SerpApiSource',
     'RedditSource',
@@ -33,5 +52,63 @@ __all__ = [
     'MonsterSource',
     'ZipRecruiterSource',
     'CareerBuilderSource',
-    'HackerNewsSource'
+    'HackerNewsSource',
+    'get_http_session',
+    'get_async_client',
+    'close_http_session',
+    'set_http_mode',
+    'get_http_mode',
+    'run_sync',
+    'init_sources',
+    'get_source',
+    'get_sources',
+    'get_enabled_sources',
+    'FanOutExecutor',
+    'FanOutResult',
+    'SourceTiming',
+    'fan_out_executor',
+    'JobIndex',
+    'job_index',
+    'parse_location',
+    'parse_salary',
+    'posting_filter',
+    'posting_facets',
+    'get_normalizer_health',
+    'RateLimited',
+    'RateLimiter',
+    'rate_limiter',
+    'crawl_priority',
+    'CrawlQueue',
+    'CrawlScheduler',
+    'SavedSearch',
+    'SavedSearchStore',
+    'saved_searches',
+    'percolate_jobs',
+    'get_saved_search_health',
+    'IngestionScheduler',
+    'start_ingestion',
+    'stop_ingestion',
+    'request_crawl',
+    'get_ingestion_health',
+    'dedupe_jobs',
+    'dedupe_against',
+    'SourceUnavailable',
+    'source_health',
+    'get_source_health_dashboard',
+    'JobRecordStore',
+    'job_records',
+    'remember_jobs',
+    'get_job_record',
+    'BoardCatalog',
+    'GreenhouseCrawler',
+    'start_greenhouse_crawler',
+    'stop_greenhouse_crawler',
+    'add_greenhouse_boards',
+    'validate_board_tokens',
+    'get_greenhouse_crawler_health',
+    'SearchCursor',
+    'InvalidCursor',
+    'query_key',
+    'per_source_limit',
+    'paginate_live'
 ]
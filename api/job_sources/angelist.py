@@ -14,7 +14,7 @@ class AngelListSource(JobSource):
         super().__init__("angelist", api_key, rate_limit=60)
         self.base_url = "https://api.angel.co"
     
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search AngelList startup jobs - REQUIRES PAID API KEY."""
         if not self._check_rate_limit():
             return []
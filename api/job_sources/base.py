@@ -2,11 +2,32 @@
 Base classes for job sources interface.
 """
 
+import asyncio
+import os
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Dict, Any, Optional, Callable
 from dataclasses import dataclass
 from datetime import datetime
 
+import httpx
+import requests
+
+from .http import get_async_client, get_http_mode, get_http_session, run_sync, source_context
+from .health import source_health
+from .rate_limits import rate_limiter
+
+FEED_CACHE_TTL = int(os.getenv("JOB_SOURCES_FEED_TTL", "300"))               # seconds, default per source
+FEED_CACHE_MAX_ENTRIES = int(os.getenv("JOB_SOURCES_FEED_CACHE_SIZE", "256"))  # distinct feed URLs kept
+
+# What adapters catch around upstream calls: transport/HTTP errors from either client,
+# plus SourceUnavailable, RateLimited and FixtureMissing (all RequestExceptions)
+REQUEST_ERRORS = (requests.RequestException, httpx.HTTPError)
+
 @dataclass
 class JobPosting:
     """Standardized job posting data structure."""
@@ -31,38 +52,313 @@ class JobPosting:
         if self.metadata is None:
             self.metadata = {}
 
+class TTLCache:
+    """Thread-safe key/value cache with per-entry expiry and LRU size cap."""
+
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 300):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        with self._lock:
+            self._entries[key] = (time.time() + (self.default_ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "max_entries": self.max_entries,
+                "hits": self.hits, "misses": self.misses}
+
+@dataclass
+class FeedEntry:
+    """A parsed feed payload plus the validators needed to revalidate it."""
+    payload: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    expires_at: float
+
+class FeedCache:
+    """Raw-feed cache keyed by URL.
+
+    Entries stay resident past their TTL (up to the size cap) so an expired
+    feed can be revalidated with If-None-Match/If-Modified-Since and reused
+    on a 304 instead of being downloaded and parsed again.
+    """
+
+    def __init__(self, max_entries: int = FEED_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, FeedEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        # asyncio locks belong to one event loop, so single-flight is per loop
+        self._url_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]" = \
+            weakref.WeakKeyDictionary()
+        self.stats_counters = {"hits": 0, "fetches": 0, "revalidated": 0}
+
+    def url_lock(self, url: str) -> asyncio.Lock:
+        """Per-URL lock so concurrent misses on one feed trigger a single download."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            return self._url_locks.setdefault(loop, {}).setdefault(url, asyncio.Lock())
+
+    def get(self, url: str) -> Optional[FeedEntry]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def store(self, url: str, entry: FeedEntry):
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                for locks in self._url_locks.values():
+                    locks.pop(evicted, None)
+
+    def record(self, outcome: str):
+        with self._lock:
+            self.stats_counters[outcome] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries, **self.stats_counters}
+
+# Shared across sources so every query for the same URL hits one entry
+feed_cache = FeedCache()
+
 class JobSource(ABC):
-    """Abstract base class for job data sources."""
+    """Abstract base class for job data sources.
+
+    Adapters implement asearch_jobs on the shared async client; search_jobs
+    and search_page are blocking wrappers for threaded callers.
+    """
+    
+    # How long a fetched feed is served without contacting upstream
+    feed_ttl: float = FEED_CACHE_TTL
+    
+    # True when a dedicated crawler keeps the local index fresh for this source
+    self_indexed: bool = False
     
     def __init__(self, name: str, api_key: str = None, rate_limit: int = 60):
         self.name = name
         self.api_key = api_key
-        self.rate_limit = rate_limit
-        self.last_request = datetime.min
-        self.requests_this_minute = 0
+        self.rate_limit = rate_limit  # requests/minute, enforced by the shared per-source token bucket
+    
+    @property
+    def http(self) -> requests.Session:
+        """Shared keep-alive session (pooled per host, gzip)."""
+        return get_http_session()
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """Blocking GET through the shared pooled session, guarded by this source's circuit breaker.
+
+        Raises SourceUnavailable (a RequestException) without touching the
+        network while the circuit is open, and RateLimited when an interactive
+        request cannot get a token from the source's bucket in time. Transport
+        errors, 5xx, 403 and 429 count as failures; other responses count as
+        successes. Adapters use _aget; this remains for threaded callers such
+        as the board crawler.
+        """
+        breaker = source_health.breaker(self.name)
+        if breaker.is_open():
+            breaker.before_request()  # raises without spending a token
+        # Token first, so a throttled request never holds the half-open probe slot
+        if get_http_mode() != "replay":
+            rate_limiter.acquire(self.name, self.rate_limit)
+        breaker.before_request()
+        start = time.time()
+        try:
+            with source_context(self.name):
+                response = self.http.get(url, **kwargs)
+        except Exception as e:
+            # Any failure resolves the request, so a half-open probe is never left in flight
+            breaker.record(False, (time.time() - start) * 1000, f"{type(e).__name__}: {e}")
+            raise
+        self._record_status(response.status_code, start)
+        return response
+
+    def _record_status(self, status_code: int, start: float):
+        failed = status_code >= 500 or status_code in (403, 429)
+        source_health.breaker(self.name).record(not failed, (time.time() - start) * 1000,
+                                                f"HTTP {status_code}" if failed else None)
+
+    async def _acquire_token(self):
+        """Take one token from this source's bucket (replay never throttles)."""
+        if get_http_mode() != "replay":
+            await rate_limiter.aacquire(self.name, self.rate_limit)
+
+    async def _admit(self, throttle: bool = True) -> bool:
+        """Circuit and rate-limit checks for one async request (see _get); True when it holds the probe."""
+        breaker = source_health.breaker(self.name)
+        if breaker.is_open():
+            breaker.before_request()
+        if throttle:
+            await self._acquire_token()
+        return breaker.before_request()
+
+    async def _aget(self, url: str, throttle: bool = True, **kwargs) -> httpx.Response:
+        """GET on the event loop's shared AsyncClient, with the same breaker and bucket rules as _get.
+
+        throttle=False skips the token for requests already paid for as a batch
+        (see _acquire_token); the circuit breaker still applies.
+        """
+        probe = await self._admit(throttle)
+        start = time.time()
+        try:
+            with source_context(self.name):
+                response = await get_async_client().get(url, **kwargs)
+        except asyncio.CancelledError:
+            # A cancelled probe says nothing about upstream; let the next request probe
+            if probe:
+                source_health.breaker(self.name).release_probe()
+            raise
+        except Exception as e:
+            source_health.breaker(self.name).record(False, (time.time() - start) * 1000, f"{type(e).__name__}: {e}")
+            raise
+        self._record_status(response.status_code, start)
+        return response
+
+    @asynccontextmanager
+    async def _astream(self, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Like _aget, but the body is read incrementally inside the block."""
+        probe = await self._admit()
+        start = time.time()
+        recorded = False
+        try:
+            with source_context(self.name):
+                async with get_async_client().stream("GET", url, **kwargs) as response:
+                    self._record_status(response.status_code, start)
+                    recorded = True
+                    yield response
+        except asyncio.CancelledError:
+            if probe and not recorded:
+                source_health.breaker(self.name).release_probe()
+            raise
+        except Exception as e:
+            # Errors raised by the caller's block after the status was recorded are not upstream's
+            if not recorded:
+                source_health.breaker(self.name).record(False, (time.time() - start) * 1000,
+                                                        f"{type(e).__name__}: {e}")
+            raise
+
+    async def _afetch_feed(self, url: str, parse: Callable[[httpx.Response], Any],
+                           ttl: Optional[float] = None, **kwargs) -> Any:
+        """Fetch a whole feed through the shared feed cache and return its parsed payload.
+
+        Within the TTL the cached payload is returned without any request. After
+        it, the feed is revalidated with its ETag/Last-Modified and a 304 renews
+        the entry without re-parsing. HTTP errors raise httpx exceptions.
+        """
+        ttl = self.feed_ttl if ttl is None else ttl
+        entry = feed_cache.get(url)
+        if entry is not None and entry.expires_at > time.time():
+            feed_cache.record("hits")
+            return entry.payload
+        
+        async with feed_cache.url_lock(url):
+            # Another task may have refreshed the feed while we waited
+            entry = feed_cache.get(url)
+            now = time.time()
+            if entry is not None and entry.expires_at > now:
+                feed_cache.record("hits")
+                return entry.payload
+            
+            headers = dict(kwargs.pop('headers', None) or {})
+            if entry is not None:
+                if entry.etag:
+                    headers['If-None-Match'] = entry.etag
+                if entry.last_modified:
+                    headers['If-Modified-Since'] = entry.last_modified
+            
+            response = await self._aget(url, headers=headers, **kwargs)
+            if response.status_code == 304 and entry is not None:
+                feed_cache.record("revalidated")
+                entry.fetched_at = now
+                entry.expires_at = now + ttl
+                feed_cache.store(url, entry)
+                return entry.payload
+            
+            response.raise_for_status()
+            payload = parse(response)
+            feed_cache.record("fetches")
+            feed_cache.store(url, FeedEntry(
+                payload=payload,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                fetched_at=now,
+                expires_at=now + ttl
+            ))
+            return payload
     
     @abstractmethod
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search for jobs matching the query."""
         pass
     
+    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+        """Blocking wrapper around asearch_jobs for threads and scripts."""
+        return run_sync(self.asearch_jobs(query, location, limit))
+    
+    async def asearch_page(self, query: str, location: str = None, limit: int = 10,
+                           offset: int = 0) -> List[JobPosting]:
+        """One page of results starting at offset.
+
+        The default over-fetches offset + limit and slices; sources whose feeds
+        are cached (or that can page natively) make later pages cheap.
+        """
+        if offset <= 0:
+            return await self.asearch_jobs(query, location, limit)
+        return (await self.asearch_jobs(query, location, offset + limit))[offset:]
+    
+    def search_page(self, query: str, location: str = None, limit: int = 10, offset: int = 0) -> List[JobPosting]:
+        """Blocking wrapper around asearch_page."""
+        return run_sync(self.asearch_page(query, location, limit, offset))
+    
     @abstractmethod
     def get_job_details(self, job_id: str) -> Optional[JobPosting]:
         """Get detailed information for a specific job."""
         pass
     
     def _check_rate_limit(self) -> bool:
-        """Check if we're within rate limits."""
-        now = datetime.now()
-        
-        if (now - self.last_request).total_seconds() >= 60:
-            self.requests_this_minute = 0
-            self.last_request = now
-        
-        if self.requests_this_minute < self.rate_limit:
-            self.requests_this_minute += 1
+        """Whether this source's bucket can serve a request at the caller's priority (consumes nothing)."""
+        if get_http_mode() == "replay":
             return True
-        return False
+        return rate_limiter.has_capacity(self.name, self.rate_limit)
     
     def _normalize_job_data(self, raw_data: Dict[str, Any]) -> JobPosting:
         """Normalize raw job data to standard format."""
@@ -88,6 +384,7 @@ class JobSource(ABC):
         return {
             "name": self.name,
             "rate_limited": not self._check_rate_limit(),
-            "requests_this_minute": self.requests_this_minute,
-            "api_key_configured": bool(self.api_key)
+            "rate_limit": rate_limiter.bucket(self.name, self.rate_limit).stats(),
+            "api_key_configured": bool(self.api_key),
+            "circuit": source_health.breaker(self.name).snapshot()
         }
@@ -0,0 +1,252 @@
+"""
+Persistent crawl queue with fair, rate-limit-aware dispatch.
+Background ingestion is a set of (source, query, location) tasks stored in
+SQLite, so the crawl frontier, per-task schedules and error backoff survive
+restarts. The dispatcher runs due tasks on a small thread pool, at most one
+per source at a time, always preferring the more urgent priority class and
+round-robining between sources within a class; a source is only dispatched
+when its token bucket can serve background traffic, so a throttled board
+never holds up the others.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .base import JobPosting, JobSource
+from .health import source_health
+from .job_index import DATA_ROOT
+from .rate_limits import BACKGROUND, HOT, PRIORITY_NAMES, crawl_priority, rate_limiter
+
+JOB_CRAWL_QUEUE_PATH = Path(os.getenv("JOB_CRAWL_QUEUE_PATH", DATA_ROOT / "crawl_queue.db"))
+JOB_CRAWL_CONCURRENCY = int(os.getenv("JOB_CRAWL_CONCURRENCY", "4"))          # sources crawled at once
+JOB_CRAWL_RETRY_BASE = float(os.getenv("JOB_CRAWL_RETRY_BASE", "60"))         # seconds, doubled per failed attempt
+JOB_CRAWL_RETRY_MAX = float(os.getenv("JOB_CRAWL_RETRY_MAX", "3600"))
+JOB_CRAWL_MAX_ATTEMPTS = int(os.getenv("JOB_CRAWL_MAX_ATTEMPTS", "5"))        # one-shot tasks are dropped after this
+IDLE_POLL = 0.25                                                              # seconds between checks while throttled
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_tasks (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    query TEXT NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    priority INTEGER NOT NULL,
+    recurring INTEGER NOT NULL DEFAULT 0,
+    not_before REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_run REAL,
+    last_results INTEGER,
+    last_error TEXT,
+    UNIQUE (source, query, location)
+);
+CREATE INDEX IF NOT EXISTS idx_crawl_tasks_due ON crawl_tasks(not_before, priority);
+"""
+
+class CrawlQueue:
+    """(source, query, location) crawl tasks with schedules, priorities and retry state."""
+
+    def __init__(self, path: Path = JOB_CRAWL_QUEUE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _conn(self):
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.path, timeout=10)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_SCHEMA)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._initialized = True
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.row_factory = sqlite3.Row
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def enqueue(self, tasks: Iterable[Tuple[str, str, Optional[str]]], priority: int = BACKGROUND,
+                recurring: bool = False, expedite: bool = False) -> int:
+        """Add tasks; existing ones keep their schedule unless expedite pulls them forward.
+
+        An expedited task is raised to `priority` and made due now, which is how
+        user demand jumps a query ahead of the scheduled crawl.
+        """
+        now = time.time()
+        rows = [(source, query.strip(), (location or "").strip(), priority, int(recurring), now)
+                for source, query, location in tasks if query and query.strip()]
+        if not rows:
+            return 0
+        conflict = (
+            "DO UPDATE SET priority = MIN(priority, excluded.priority), "
+            "not_before = MIN(not_before, excluded.not_before), recurring = MAX(recurring, excluded.recurring)"
+            if expedite else
+            "DO UPDATE SET recurring = MAX(recurring, excluded.recurring)"
+        )
+        with self._conn() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT INTO crawl_tasks (source, query, location, priority, recurring, not_before) "
+                f"VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(source, query, location) {conflict}",
+                rows
+            )
+            return conn.total_changes - before
+
+    def due_heads(self, sources: Iterable[str], now: Optional[float] = None) -> List[sqlite3.Row]:
+        """The most urgent due task of each listed source."""
+        sources = list(sources)
+        if not sources:
+            return []
+        with self._conn() as conn:
+            return conn.execute(
+                "SELECT * FROM (SELECT *, ROW_NUMBER() OVER (PARTITION BY source ORDER BY priority, not_before) AS rank "
+                f"FROM crawl_tasks WHERE not_before <= ? AND source IN ({', '.join('?' for _ in sources)})) "
+                "WHERE rank = 1 ORDER BY priority, not_before",
+                [now or time.time()] + sources
+            ).fetchall()
+
+    def complete(self, task: sqlite3.Row, results: int, interval: float):
+        """Recurring tasks return to background priority and are due again after interval; one-shot tasks are removed."""
+        now = time.time()
+        with self._conn() as conn:
+            if task["recurring"]:
+                conn.execute(
+                    "UPDATE crawl_tasks SET priority = ?, not_before = ?, attempts = 0, last_run = ?, "
+                    "last_results = ?, last_error = NULL WHERE id = ?",
+                    (BACKGROUND, now + interval, now, results, task["id"])
+                )
+            else:
+                conn.execute("DELETE FROM crawl_tasks WHERE id = ?", (task["id"],))
+
+    def fail(self, task: sqlite3.Row, error: str):
+        """Back off exponentially; one-shot tasks are dropped after JOB_CRAWL_MAX_ATTEMPTS."""
+        now = time.time()
+        attempts = task["attempts"] + 1
+        with self._conn() as conn:
+            if not task["recurring"] and attempts >= JOB_CRAWL_MAX_ATTEMPTS:
+                conn.execute("DELETE FROM crawl_tasks WHERE id = ?", (task["id"],))
+                return
+            delay = min(JOB_CRAWL_RETRY_BASE * 2 ** (attempts - 1), JOB_CRAWL_RETRY_MAX)
+            conn.execute(
+                "UPDATE crawl_tasks SET not_before = ?, attempts = ?, last_run = ?, last_error = ? WHERE id = ?",
+                (now + delay, attempts, now, error[:500], task["id"])
+            )
+
+    def defer(self, task: sqlite3.Row, delay: float):
+        with self._conn() as conn:
+            conn.execute("UPDATE crawl_tasks SET not_before = ? WHERE id = ?", (time.time() + delay, task["id"]))
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT source, priority, COUNT(*) AS n, SUM(not_before <= ?) AS due, SUM(attempts > 0) AS retrying "
+                "FROM crawl_tasks GROUP BY source, priority",
+                (now,)
+            ).fetchall()
+        by_source: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            entry = by_source.setdefault(row["source"], {"tasks": 0, "due": 0, "retrying": 0})
+            entry["tasks"] += row["n"]
+            entry["due"] += row["due"] or 0
+            entry["retrying"] += row["retrying"] or 0
+            entry[PRIORITY_NAMES.get(row["priority"], str(row["priority"]))] = row["n"]
+        return {
+            "path": str(self.path),
+            "tasks": sum(entry["tasks"] for entry in by_source.values()),
+            "due": sum(entry["due"] for entry in by_source.values()),
+            "by_source": by_source
+        }
+
+TaskHandler = Callable[[str, List[JobPosting]], int]
+
+class CrawlScheduler:
+    """Dispatches due crawl tasks fairly across sources within their rate limits."""
+
+    def __init__(self, queue: CrawlQueue, concurrency: int = JOB_CRAWL_CONCURRENCY):
+        self.queue = queue
+        self.concurrency = concurrency
+        self._last_served: Dict[str, float] = {}
+        self.dispatched = 0
+
+    def _pick(self, heads: List[sqlite3.Row], sources: Dict[str, JobSource], busy: set) -> List[sqlite3.Row]:
+        """Startable heads: most urgent class first, least recently served source first within it."""
+        ready = []
+        for task in heads:
+            name = task["source"]
+            if name in busy:
+                continue
+            bucket = rate_limiter.bucket(name, sources[name].rate_limit)
+            if bucket.wait_time(task["priority"]) > 0:
+                continue
+            ready.append(task)
+        ready.sort(key=lambda task: (task["priority"], self._last_served.get(task["source"], 0.0)))
+        return ready
+
+    def _run_task(self, task: sqlite3.Row, source: JobSource, handler: TaskHandler, limit: int) -> Tuple[int, int]:
+        """(postings fetched, postings written) for one task, at the task's priority."""
+        with crawl_priority(task["priority"]):
+            jobs = source.search_jobs(task["query"], task["location"] or None, limit)
+        return len(jobs), handler(task["source"], jobs)
+
+    def drain(self, sources: Dict[str, JobSource], handler: TaskHandler, limit: int, interval: float,
+              stop: Optional[threading.Event] = None) -> Dict[str, Dict[str, Any]]:
+        """Run every due task for these sources; returns per-source {tasks, upserted, errors, skipped}."""
+        summary: Dict[str, Dict[str, Any]] = {name: {"tasks": 0, "upserted": 0, "errors": 0} for name in sources}
+        busy: Dict[Any, sqlite3.Row] = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="job-crawl") as executor:
+            while not (stop and stop.is_set()):
+                available = []
+                for name in sources:
+                    if source_health.is_available(name):
+                        available.append(name)
+                    else:
+                        summary[name]["skipped"] = "circuit open"
+                running = {task["source"] for task in busy.values()}
+                heads = self.queue.due_heads([name for name in available if name not in running])
+                for task in self._pick(heads, sources, running):
+                    if len(busy) >= self.concurrency:
+                        break
+                    future = executor.submit(self._run_task, task, sources[task["source"]], handler, limit)
+                    busy[future] = task
+                    self._last_served[task["source"]] = time.monotonic()
+                    self.dispatched += 1
+                if not busy:
+                    if not heads:
+                        break
+                    # Everything due is throttled: wait for a bucket to refill
+                    time.sleep(IDLE_POLL)
+                    continue
+                # Wake on the first finished task, or shortly, so throttled sources get another look
+                done, _ = wait(list(busy), timeout=IDLE_POLL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._finish(busy.pop(future), future, summary, interval)
+            for future in list(busy):
+                self._finish(busy.pop(future), future, summary, interval)
+        return summary
+
+    def _finish(self, task: sqlite3.Row, future, summary: Dict[str, Dict[str, Any]], interval: float):
+        entry = summary[task["source"]]
+        entry["tasks"] += 1
+        try:
+            fetched, written = future.result()
+        except Exception as e:
+            entry["errors"] += 1
+            print(f"Crawl task failed for {task['source']} ({task['query']}): {e}")
+            self.queue.fail(task, f"{type(e).__name__}: {e}")
+            return
+        entry["upserted"] += written
+        self.queue.complete(task, fetched, interval)
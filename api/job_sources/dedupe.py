@@ -0,0 +1,247 @@
+"""
+Cross-source job deduplication.
+The same role is often listed by several boards under different ids. Postings
+are fingerprinted by normalized title, canonical company and normalized
+location plus a SimHash of the description, clustered in a single pass over
+hash buckets, and each cluster is collapsed to its richest record with the
+other listings attached as alternates.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .base import JobPosting
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 8            # max_distance < SIMHASH_BANDS guarantees a shared band (pigeonhole)
+SIMHASH_MAX_DISTANCE = 6     # a one-word edit to a ~300-word description moves up to ~6 bits
+MIN_SIMHASH_TOKENS = 12      # shorter descriptions carry too little signal to compare
+MAX_SIMHASH_TOKENS = 600     # the opening of a description is enough to identify it
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+_TITLE_ABBREVIATIONS = {
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "mgr": "manager",
+    "swe": "software engineer",
+    "sde": "software engineer",
+    "ml": "machine learning",
+    "fe": "frontend",
+    "be": "backend",
+}
+_TITLE_NOISE = {"remote", "hybrid", "onsite", "m", "f", "d", "w", "all", "genders"}
+_COMPANY_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "company",
+    "gmbh", "ag", "sa", "plc", "bv", "pty", "the",
+}
+_UNKNOWN_LOCATIONS = {"", "unknown", "see description", "various", "multiple locations", "n a"}
+_REMOTE_LOCATIONS = {"remote", "anywhere", "worldwide", "global", "distributed", "work from home", "wfh"}
+
+@dataclass(frozen=True)
+class JobFingerprint:
+    """Normalized identity of a posting."""
+    title: str
+    company: str
+    location: str
+    simhash: Optional[int]
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return (self.title, self.company, self.location)
+
+def _words(text: str) -> List[str]:
+    return _WORD_RE.findall((text or "").lower())
+
+def normalize_title(title: str) -> str:
+    """Lowercase, expand common abbreviations, drop work-mode noise words."""
+    # Parenthesised/bracketed asides are usually location or mode: "Engineer (Remote, EU)"
+    title = re.sub(r"[\(\[].*?[\)\]]", " ", title or "")
+    words = []
+    for word in _words(title):
+        if word in _TITLE_NOISE:
+            continue
+        words.extend(_TITLE_ABBREVIATIONS.get(word, word).split())
+    return " ".join(words)
+
+def canonical_company(company: str) -> str:
+    """Lowercase company name without legal suffixes or punctuation."""
+    words = [word for word in _words(company) if word not in _COMPANY_SUFFIXES]
+    return " ".join(words)
+
+def normalize_location(location: str) -> str:
+    """'remote', '' for unknown, otherwise the leading (city) component."""
+    text = (location or "").lower().strip()
+    flat = " ".join(_words(text))
+    if flat in _UNKNOWN_LOCATIONS:
+        return ""
+    if flat in _REMOTE_LOCATIONS or flat.startswith("remote"):
+        return "remote"
+    return " ".join(_words(text.split(",")[0]))
+
+def simhash(text: str, bits: int = SIMHASH_BITS) -> Optional[int]:
+    """64-bit SimHash over word 3-shingles; None when the text is too short."""
+    words = _words(_TAG_RE.sub(" ", text or ""))[:MAX_SIMHASH_TOKENS]
+    if len(words) < MIN_SIMHASH_TOKENS:
+        return None
+    # Count set bits column-wise over fixed-width bit strings (far cheaper than per-bit Python loops)
+    rows = [
+        format(int.from_bytes(hashlib.blake2b(" ".join(words[i:i + 3]).encode("utf-8"),
+                                              digest_size=bits // 8).digest(), "big"), f"0{bits}b")
+        for i in range(len(words) - 2)
+    ]
+    majority = len(rows) / 2
+    return int("".join("1" if column.count("1") > majority else "0" for column in zip(*rows)), 2)
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+def fingerprint(job: JobPosting) -> JobFingerprint:
+    return JobFingerprint(
+        title=normalize_title(job.title),
+        company=canonical_company(job.company),
+        location=normalize_location(job.location),
+        simhash=simhash(job.description)
+    )
+
+def richness(job: JobPosting) -> float:
+    """How complete a record is; the richest listing represents its cluster."""
+    score = min(len(job.description or ""), 4000) / 100.0
+    score += 5 if job.salary_range else 0
+    score += 3 if job.posted_date else 0
+    score += 2 if normalize_location(job.location) else 0
+    score += min(len(job.skills or []), 10) * 0.5
+    score += 1 if job.job_type else 0
+    return score
+
+def _locations_compatible(a: str, b: str) -> bool:
+    return a == b or not a or not b
+
+def _titles_compatible(a: str, b: str) -> bool:
+    """Same normalized title, or mostly the same words (shared boilerplate is not enough)."""
+    if a == b:
+        return True
+    words_a, words_b = set(a.split()), set(b.split())
+    if not words_a or not words_b:
+        return False
+    return len(words_a & words_b) / len(words_a | words_b) >= 0.6
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # Keep the earliest posting as root so cluster order follows input order
+            if root_b < root_a:
+                root_a, root_b = root_b, root_a
+            self.parent[root_b] = root_a
+
+def cluster_jobs(jobs: List[JobPosting], max_distance: int = SIMHASH_MAX_DISTANCE) -> List[List[int]]:
+    """Group indexes of near-duplicate postings.
+
+    Two postings join a cluster when their (title, company, location)
+    fingerprints match, or when they share a company, have compatible
+    titles and locations, and descriptions within max_distance SimHash bits.
+    Candidates
+    come only from hash buckets, so the pass is linear in the number of
+    postings for realistic bucket sizes.
+    """
+    if max_distance >= SIMHASH_BANDS:
+        raise ValueError(f"max_distance must be below SIMHASH_BANDS ({SIMHASH_BANDS})")
+
+    prints = [fingerprint(job) for job in jobs]
+    groups = _UnionFind(len(jobs))
+    band_width = SIMHASH_BITS // SIMHASH_BANDS
+    band_mask = (1 << band_width) - 1
+
+    exact: Dict[Tuple[str, str, str], int] = {}
+    bands: Dict[Tuple[str, int, int], List[int]] = {}
+
+    for i, fp in enumerate(prints):
+        if fp.title and fp.company:
+            if fp.key in exact:
+                groups.union(exact[fp.key], i)
+            else:
+                exact[fp.key] = i
+
+        if fp.simhash is None or not fp.company:
+            continue
+        for band in range(SIMHASH_BANDS):
+            bucket = bands.setdefault((fp.company, band, fp.simhash >> (band * band_width) & band_mask), [])
+            for j in bucket:
+                other = prints[j]
+                if (_locations_compatible(fp.location, other.location)
+                        and _titles_compatible(fp.title, other.title)
+                        and hamming_distance(fp.simhash, other.simhash) <= max_distance):
+                    groups.union(j, i)
+            bucket.append(i)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(jobs)):
+        clusters.setdefault(groups.find(i), []).append(i)
+    return sorted(clusters.values(), key=lambda members: members[0])
+
+def unique_by_id(jobs: Iterable[JobPosting]) -> List[JobPosting]:
+    unique: List[JobPosting] = []
+    seen_ids = set()
+    for job in jobs:
+        if job.id not in seen_ids:
+            seen_ids.add(job.id)
+            unique.append(job)
+    return unique
+
+def collapse_cluster(jobs: List[JobPosting], members: List[int]) -> JobPosting:
+    """Richest record of a cluster with the other listings as alternates."""
+    if len(members) == 1:
+        return jobs[members[0]]
+    best = max(members, key=lambda i: (richness(jobs[i]), -i))
+    alternates = [
+        {"id": jobs[i].id, "source": jobs[i].source, "url": jobs[i].url}
+        for i in members if i != best
+    ]
+    # Copy rather than mutate: postings may be shared with caches
+    metadata = dict(jobs[best].metadata or {})
+    metadata["alternates"] = metadata.get("alternates", []) + alternates
+    return replace(jobs[best], metadata=metadata)
+
+def dedupe_jobs(jobs: Iterable[JobPosting], max_distance: int = SIMHASH_MAX_DISTANCE) -> List[JobPosting]:
+    """Collapse duplicate postings, keeping input order of first appearance.
+
+    Exact id repeats are dropped first. Each near-duplicate cluster is then
+    represented by its richest record, and the other listings are listed
+    under metadata["alternates"] as {id, source, url}.
+    """
+    unique = unique_by_id(jobs)
+    return [collapse_cluster(unique, members) for members in cluster_jobs(unique, max_distance)]
+
+def dedupe_against(emitted: List[JobPosting], batch: Iterable[JobPosting],
+                   max_distance: int = SIMHASH_MAX_DISTANCE) -> List[JobPosting]:
+    """New postings from batch that duplicate nothing already emitted.
+
+    For incremental (streamed) results: postings in emitted are fixed, so a
+    batch posting that clusters with any of them is dropped, and duplicates
+    within the batch collapse as in dedupe_jobs.
+    """
+    emitted_ids = {job.id for job in emitted}
+    fresh = [job for job in unique_by_id(batch) if job.id not in emitted_ids]
+    combined = list(emitted) + fresh
+    return [
+        collapse_cluster(combined, members)
+        for members in cluster_jobs(combined, max_distance)
+        if members[0] >= len(emitted)
+    ]
@@ -1,20 +1,28 @@
 """
 Dice job source implementation via web scraping.
 """
-import requests
 from typing import List, Optional
 from datetime import datetime
-from bs4 import BeautifulSoup
-from .base import JobSource, JobPosting
+from .base import REQUEST_ERRORS, JobSource, JobPosting
+from .html_parse import CardSpec, aparse_cards
 
 class DiceSource(JobSource):
     """Dice job board integration via web scraping."""
 
+    # Result cards on the search page (compiled once per process)
+    CARD_SPEC = CardSpec.build(
+        'div.card',
+        title='a.card-title-link',
+        href=('a.card-title-link', 'href'),
+        company='a.card-company',
+        location='span.location'
+    )
+
     def __init__(self, api_key: str = None, rate_limit: int = 100):
         super().__init__("dice", api_key, rate_limit)
         self.base_url = "https://www.dice.com/jobs"
 
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search Dice jobs via web scraping."""
         if not self._check_rate_limit():
             return []
@@ -30,34 +38,30 @@ class DiceSource(JobSource):
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             }
 
-            response = requests.get(self.base_url, params=params, headers=headers, timeout=10)
+            response = await self._aget(self.base_url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            job_cards = soup.find_all('div', class_='card', limit=limit)
+            job_cards = await aparse_cards(response.content, self.CARD_SPEC, limit)
 
             jobs = []
             for card in job_cards:
                 try:
-                    title_elem = card.find('a', class_='card-title-link')
-                    company_elem = card.find('a', class_='card-company')
-                    location_elem = card.find('span', class_='location')
-
-                    if not (title_elem and company_elem):
+                    title = card['title']
+                    if not (title and card['company']):
                         continue
 
-                    job_url = f"https://www.dice.com{title_elem.get('href', '')}"
-                    job_id = job_url.split('/')[-1].split('?')[0] if job_url else str(hash(title_elem.text))
+                    job_url = f"https://www.dice.com{card['href'] or ''}"
+                    job_id = job_url.split('/')[-1].split('?')[0] if job_url else str(hash(title))
 
                     job = {
                         "id": f"dice_{job_id}",
-                        "title": title_elem.text.strip(),
-                        "company": company_elem.text.strip(),
-                        "location": location_elem.text.strip() if location_elem else "See description",
-                        "description": f"Dice tech job: {title_elem.text.strip()}",
+                        "title": title,
+                        "company": card['company'],
+                        "location": card['location'] or "See description",
+                        "description": f"Dice tech job: {title}",
                         "url": job_url,
                         "posted_date": datetime.now(),
-                        "remote": 'remote' in (location_elem.text.lower() if location_elem else ''),
+                        "remote": 'remote' in (card['location'] or '').lower(),
                         "skills": [],
                         "experience_level": "mid"
                     }
@@ -69,7 +73,7 @@ class DiceSource(JobSource):
 
             return jobs
 
-        except requests.RequestException as e:
+        except REQUEST_ERRORS as e:
             print(f"Error fetching Dice jobs: {e}")
             return []
         except Exception as e:
@@ -0,0 +1,164 @@
+"""
+Concurrent fan-out across job sources.
+Queries every selected source at once on the event loop (asearch_page) under a
+global deadline and per-source timeouts, and stops waiting for stragglers once
+enough results are in hand; a timed-out or cancelled source's request is
+cancelled with it.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+from .base import JobSource, JobPosting
+from .health import source_health
+from .records import remember_jobs
+from ..skill_extractor import enrich_job_skills
+
+JOB_SEARCH_DEADLINE = float(os.getenv("JOB_SEARCH_DEADLINE", "8.0"))      # seconds, whole fan-out
+JOB_SOURCE_TIMEOUT = float(os.getenv("JOB_SOURCE_TIMEOUT", "6.0"))        # seconds, per source
+
+@dataclass
+class SourceTiming:
+    """Outcome of one source within a fan-out."""
+    source: str
+    status: str  # ok | error | timeout | cancelled | deadline | skipped
+    elapsed: float
+    results: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "status": self.status,
+            "elapsed_ms": round(self.elapsed * 1000, 1),
+            "results": self.results,
+            "error": self.error
+        }
+
+@dataclass
+class SourceBatch:
+    """Jobs returned by a single source, yielded as soon as it finishes."""
+    source: str
+    jobs: List[JobPosting]
+    timing: SourceTiming
+
+@dataclass
+class FanOutResult:
+    """Aggregated fan-out outcome."""
+    jobs_by_source: Dict[str, List[JobPosting]] = field(default_factory=dict)
+    timings: Dict[str, SourceTiming] = field(default_factory=dict)
+    partial: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def used_sources(self) -> List[str]:
+        return [name for name, timing in self.timings.items() if timing.status == "ok"]
+
+    def ordered_jobs(self, order: Optional[List[str]] = None) -> List[JobPosting]:
+        """Jobs grouped by source, preferred sources first, then completion order."""
+        names = [name for name in (order or []) if name in self.jobs_by_source]
+        names += [name for name in self.jobs_by_source if name not in names]
+        return [job for name in names for job in self.jobs_by_source[name]]
+
+class FanOutExecutor:
+    """Runs JobSource.asearch_page concurrently with deadlines and early stop."""
+
+    def __init__(self, deadline: float = JOB_SEARCH_DEADLINE, per_source_timeout: float = JOB_SOURCE_TIMEOUT):
+        self.deadline = deadline
+        self.per_source_timeout = per_source_timeout
+
+    async def _search_one(self, name: str, source: JobSource, query: str,
+                          location: Optional[str], limit: int, offset: int = 0) -> SourceBatch:
+        start = time.time()
+        try:
+            jobs = await asyncio.wait_for(source.asearch_page(query, location, limit, offset),
+                                          timeout=self.per_source_timeout)
+            # Skill tagging is CPU-bound; keep it off the event loop
+            await asyncio.to_thread(enrich_job_skills, jobs)
+            breaker = source_health.breaker(source.name)
+            if not jobs and breaker.last_failure_at >= start:
+                # Adapters swallow request errors and return []; surface them as failures
+                batch = SourceBatch(name, [], SourceTiming(name, "error", time.time() - start, error=breaker.last_error))
+            else:
+                batch = SourceBatch(name, jobs, SourceTiming(name, "ok", time.time() - start, len(jobs)))
+        except asyncio.TimeoutError:
+            batch = SourceBatch(name, [], SourceTiming(name, "timeout", time.time() - start))
+        except Exception as e:
+            print(f"Error searching {name}: {e}")
+            batch = SourceBatch(name, [], SourceTiming(name, "error", time.time() - start, error=str(e)))
+        source_health.record_search(source.name, batch.timing.status, batch.timing.elapsed * 1000, batch.timing.results)
+        # Every posting a search sees becomes available to /jobs/{job_id}
+        remember_jobs(batch.jobs)
+        return batch
+
+    async def stream(self, sources: Dict[str, JobSource], query: str, location: Optional[str] = None,
+                     limit: int = 10, stop_after: Optional[int] = None,
+                     offsets: Optional[Dict[str, int]] = None) -> AsyncIterator[SourceBatch]:
+        """Yield each source's batch as it completes.
+
+        limit is the page size asked of each source; offsets resumes sources
+        from where a previous page stopped (cursor pagination).
+
+        Sources whose circuit breaker is open are yielded first as "skipped"
+        without being called. Once stop_after unique jobs have been collected,
+        or the global deadline passes, remaining sources are cancelled and
+        yielded with an empty batch; their in-flight requests are cancelled.
+        """
+        start = time.time()
+        tasks = {}
+        for name, source in sources.items():
+            if not source_health.is_available(source.name):
+                source_health.record_search(source.name, "skipped", 0.0)
+                yield SourceBatch(name, [], SourceTiming(name, "skipped", 0.0, error="circuit open"))
+                continue
+            offset = (offsets or {}).get(name, 0)
+            tasks[asyncio.create_task(self._search_one(name, source, query, location, limit, offset))] = name
+        pending = set(tasks)
+        seen_ids = set()
+        stop_reason = None
+
+        try:
+            while pending:
+                remaining = self.deadline - (time.time() - start)
+                if remaining <= 0:
+                    stop_reason = "deadline"
+                    break
+
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    batch = task.result()
+                    seen_ids.update(job.id for job in batch.jobs)
+                    yield batch
+
+                if stop_after is not None and len(seen_ids) >= stop_after and pending:
+                    stop_reason = "cancelled"
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+        for task in pending:
+            name = tasks[task]
+            timing = SourceTiming(name, stop_reason or "cancelled", time.time() - start)
+            source_health.record_search(sources[name].name, timing.status, timing.elapsed * 1000)
+            yield SourceBatch(name, [], timing)
+
+    async def run(self, sources: Dict[str, JobSource], query: str, location: Optional[str] = None,
+                  limit: int = 10, stop_after: Optional[int] = None,
+                  offsets: Optional[Dict[str, int]] = None) -> FanOutResult:
+        """Collect every batch into a FanOutResult."""
+        start = time.time()
+        result = FanOutResult()
+        async for batch in self.stream(sources, query, location, limit, stop_after, offsets):
+            result.timings[batch.source] = batch.timing
+            if batch.jobs:
+                result.jobs_by_source[batch.source] = batch.jobs
+            if batch.timing.status != "ok":
+                result.partial = True
+        result.elapsed = time.time() - start
+        return result
+
+# Shared executor used by the job search endpoints
+fan_out_executor = FanOutExecutor()
@@ -2,20 +2,29 @@
 Glassdoor job source implementation via web scraping.
 """
 
-import requests
 from typing import List, Optional
 from datetime import datetime
-from bs4 import BeautifulSoup
-from .base import JobSource, JobPosting
+from .base import REQUEST_ERRORS, JobSource, JobPosting
+from .html_parse import CardSpec, aparse_cards
 
 class GlassdoorSource(JobSource):
     """Glassdoor job board integration via web scraping."""
 
+    # Result cards on the search page (compiled once per process)
+    CARD_SPEC = CardSpec.build(
+        'li.react-job-listing',
+        title='a.job-title',
+        href=('a.job-title', 'href'),
+        job_id=('a.job-title', 'data-job-id'),
+        company='div.employer-name',
+        location='div.location'
+    )
+
     def __init__(self, api_key: str = None):
         super().__init__("glassdoor", api_key, rate_limit=100)
         self.base_url = "https://www.glassdoor.com/Job/"
 
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search Glassdoor jobs via web scraping."""
         if not self._check_rate_limit():
             return []
@@ -31,34 +40,30 @@ class GlassdoorSource(JobSource):
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             }
 
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = await self._aget(search_url, headers=headers, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            job_cards = soup.find_all('li', class_='react-job-listing', limit=limit)
+            job_cards = await aparse_cards(response.content, self.CARD_SPEC, limit)
 
             jobs = []
             for card in job_cards:
                 try:
-                    title_elem = card.find('a', class_='job-title')
-                    company_elem = card.find('div', class_='employer-name')
-                    location_elem = card.find('div', class_='location')
-
-                    if not (title_elem and company_elem):
+                    title = card['title']
+                    if not (title and card['company']):
                         continue
 
-                    job_url = f"https://www.glassdoor.com{title_elem.get('href', '')}"
-                    job_id = title_elem.get('data-job-id', str(hash(title_elem.text)))
+                    job_url = f"https://www.glassdoor.com{card['href'] or ''}"
+                    job_id = card['job_id'] or str(hash(title))
 
                     job = {
                         "id": f"glassdoor_{job_id}",
-                        "title": title_elem.text.strip(),
-                        "company": company_elem.text.strip(),
-                        "location": location_elem.text.strip() if location_elem else "See description",
-                        "description": f"Glassdoor job: {title_elem.text.strip()}",
+                        "title": title,
+                        "company": card['company'],
+                        "location": card['location'] or "See description",
+                        "description": f"Glassdoor job: {title}",
                         "url": job_url,
                         "posted_date": datetime.now(),
-                        "remote": 'remote' in (location_elem.text.lower() if location_elem else ''),
+                        "remote": 'remote' in (card['location'] or '').lower(),
                         "skills": [],
                         "experience_level": "mid"
                     }
@@ -70,7 +75,7 @@ class GlassdoorSource(JobSource):
 
             return jobs
 
-        except requests.RequestException as e:
+        except REQUEST_ERRORS as e:
             print(f"Error fetching Glassdoor jobs: {e}")
             return []
         except Exception as e:
@@ -2,44 +2,101 @@
 Greenhouse job source implementation.
 """
 
-import requests
+import asyncio
+import html
 from typing import List, Optional
 from datetime import datetime
-from .base import JobSource, JobPosting
+from .base import REQUEST_ERRORS, JobSource, JobPosting
+from .http import run_sync
+from .job_index import job_index
+
+# Boards queried live when the local index has nothing for a query
+SEED_BOARD_TOKENS = ['stripe', 'airbnb', 'gitlab', 'automattic', 'shopify']
 
 class GreenhouseSource(JobSource):
     """Greenhouse job board integration."""
     
+    # Board job lists are re-read on every query; postings change slowly
+    feed_ttl = 600
+    
+    # The board crawler keeps this source's postings in the local index
+    self_indexed = True
+    
     def __init__(self, api_key: str = None):
-        super().__init__("greenhouse", api_key, rate_limit=60)
+        # The public board API is CDN-cached; the budget is sized for the board crawler
+        super().__init__("greenhouse", api_key, rate_limit=600)
         self.base_url = "https://boards-api.greenhouse.io/v1"
     
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
-        """Search Greenhouse jobs across multiple company boards."""
+    def board_url(self, board_token: str) -> str:
+        return f"{self.base_url}/boards/{board_token}/jobs?content=true"
+    
+    def to_posting(self, board_token: str, job_data: dict, company: str = None) -> JobPosting:
+        """Normalize one board job (content=true payload) into a JobPosting."""
+        job_location = (job_data.get('location') or {}).get('name', 'Unknown')
+        try:
+            posted_date = datetime.fromisoformat(job_data['updated_at'])
+        except (KeyError, TypeError, ValueError):
+            posted_date = datetime.now()
+        job = {
+            "id": f"greenhouse_{job_data.get('id')}",
+            "title": job_data.get('title', ''),
+            "company": company or board_token.capitalize(),
+            "location": job_location,
+            "description": html.unescape(job_data.get('content', '')),  # content=true returns entity-escaped HTML
+            "url": job_data.get('absolute_url', ''),
+            "posted_date": posted_date,
+            "remote": 'remote' in job_location.lower(),
+            "skills": [d.get('name', '') for d in job_data.get('departments', [])],
+            "experience_level": "mid",
+            "metadata": {"board_token": board_token}
+        }
+        return self._normalize_job_data(job)
+    
+    async def asearch_page(self, query: str, location: str = None, limit: int = 10,
+                           offset: int = 0) -> List[JobPosting]:
+        """Later pages come straight from the crawled index."""
+        if offset <= 0:
+            return await self.asearch_jobs(query, location, limit)
+        try:
+            indexed, total = await asyncio.to_thread(job_index.search, query, location, sources=[self.name],
+                                                     limit=limit, offset=offset)
+            if total:
+                return indexed
+        except Exception as e:
+            print(f"Greenhouse index lookup failed: {e}")
+        return await super().asearch_page(query, location, limit, offset)
+    
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+        """Search Greenhouse jobs: crawled boards in the local index, seed boards live on a miss."""
+        try:
+            # SQLite lookups run off the event loop
+            indexed, _ = await asyncio.to_thread(job_index.search, query, location, sources=[self.name], limit=limit)
+            if indexed:
+                return indexed
+        except Exception as e:
+            print(f"Greenhouse index lookup failed: {e}")
+        return await self.asearch_live(query, location, limit)
+
+    def search_live(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+        """Blocking wrapper around asearch_live."""
+        return run_sync(self.asearch_live(query, location, limit))
+
+    async def asearch_live(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+        """Fetch and filter the seed boards directly (index miss, fixture replay)."""
         if not self._check_rate_limit():
             return []
 
         try:
-            # Greenhouse requires board tokens - we'll search popular tech company boards
-            # In production, maintain a list of company board tokens
-            board_tokens = ['stripe', 'airbnb', 'gitlab', 'automattic', 'shopify']
-
             all_jobs = []
             query_lower = query.lower() if query else ''
 
-            for board_token in board_tokens:
+            for board_token in SEED_BOARD_TOKENS:
                 if len(all_jobs) >= limit:
                     break
 
                 try:
-                    url = f"{self.base_url}/boards/{board_token}/jobs"
-                    headers = {'User-Agent': 'Mosaic Career Platform (contact@whatismydelta.com)'}
-                    response = requests.get(url, headers=headers, timeout=5)
-
-                    if response.status_code != 200:
-                        continue
-
-                    jobs_data = response.json().get('jobs', [])
+                    jobs_data = await self._afetch_feed(self.board_url(board_token),
+                                                        lambda response: response.json().get('jobs', []), timeout=5)
 
                     for job_data in jobs_data:
                         if len(all_jobs) >= limit:
@@ -53,26 +110,13 @@ class GreenhouseSource(JobSource):
                             continue
 
                         # Filter by location if provided
-                        job_location = job_data.get('location', {}).get('name', 'Unknown')
+                        job_location = (job_data.get('location') or {}).get('name', 'Unknown')
                         if location and location.lower() not in job_location.lower():
                             continue
 
-                        job = {
-                            "id": f"greenhouse_{job_data.get('id')}",
-                            "title": title,
-                            "company": board_token.capitalize(),
-                            "location": job_location,
-                            "description": job_data.get('content', '')[:500],
-                            "url": job_data.get('absolute_url', ''),
-                            "posted_date": datetime.now(),
-                            "remote": 'remote' in job_location.lower(),
-                            "skills": departments,
-                            "experience_level": "mid"
-                        }
-
-                        all_jobs.append(self._normalize_job_data(job))
-
-                except requests.RequestException:
+                        all_jobs.append(self.to_posting(board_token, job_data))
+
+                except REQUEST_ERRORS:
                     continue
 
             return all_jobs
@@ -0,0 +1,326 @@
+"""
+Incremental Greenhouse board crawler.
+A persisted catalog of board tokens (seeded from data/greenhouse_boards.json,
+extendable at runtime) is crawled on a schedule with bounded concurrency.
+Each board is diffed against its previous snapshot by job id and updated_at,
+and only new or changed postings are written to the local job index; removed
+postings are deleted. GreenhouseSource queries then read the index.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+
+from .job_index import DATA_ROOT, JobIndex, job_index
+from .job_vectors import index_job_vectors, job_vectors
+from .rate_limits import BACKGROUND, crawl_priority
+from .records import remember_jobs
+from .saved_searches import percolate_jobs
+from ..skill_extractor import enrich_job_skills
+
+GREENHOUSE_CATALOG_PATH = Path(os.getenv("GREENHOUSE_CATALOG_PATH", DATA_ROOT / "greenhouse_catalog.db"))
+GREENHOUSE_SEED_FILE = Path(os.getenv("GREENHOUSE_SEED_FILE", DATA_ROOT / "greenhouse_boards.json"))
+GREENHOUSE_CRAWL_ENABLED = os.getenv("GREENHOUSE_CRAWL_ENABLED", "true").lower() in {"1", "true", "yes", "on"}
+GREENHOUSE_CRAWL_CONCURRENCY = int(os.getenv("GREENHOUSE_CRAWL_CONCURRENCY", "8"))  # boards fetched at once
+GREENHOUSE_BOARD_REFRESH = int(os.getenv("GREENHOUSE_BOARD_REFRESH", "3600"))      # seconds between crawls of a board
+GREENHOUSE_CRAWL_TICK = int(os.getenv("GREENHOUSE_CRAWL_TICK", "300"))             # scheduler wake-up interval
+GREENHOUSE_CRAWL_BATCH = int(os.getenv("GREENHOUSE_CRAWL_BATCH", "500"))           # max boards per tick
+GREENHOUSE_BOARDS_MAX_PER_REQUEST = int(os.getenv("GREENHOUSE_BOARDS_MAX_PER_REQUEST", "100"))  # runtime additions
+
+BOARD_TOKEN_RE = re.compile(r"^[a-z0-9_-]+$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS boards (
+    token TEXT PRIMARY KEY,
+    company TEXT,
+    status TEXT NOT NULL DEFAULT 'active',
+    etag TEXT,
+    last_modified TEXT,
+    last_crawled REAL,
+    last_changed REAL,
+    job_count INTEGER NOT NULL DEFAULT 0,
+    consecutive_errors INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_boards_due ON boards(status, last_crawled);
+
+CREATE TABLE IF NOT EXISTS board_snapshot (
+    token TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    updated_at TEXT,
+    PRIMARY KEY (token, job_id)
+);
+"""
+
+class BoardCatalog:
+    """Persisted board tokens plus per-board crawl state and job snapshots."""
+
+    def __init__(self, path: Path = GREENHOUSE_CATALOG_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _conn(self):
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.path, timeout=10)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_SCHEMA)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._initialized = True
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.row_factory = sqlite3.Row
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def add_boards(self, boards: Iterable[Dict[str, str]]) -> int:
+        """Add {token, company} entries; existing tokens are left untouched."""
+        rows = [
+            (board["token"].strip().lower(), board.get("company"))
+            for board in boards if board.get("token", "").strip()
+        ]
+        with self._conn() as conn:
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO boards (token, company) VALUES (?, ?)", rows)
+            return conn.total_changes - before
+
+    def seed_from_file(self, path: Path = GREENHOUSE_SEED_FILE) -> int:
+        if not Path(path).exists():
+            return 0
+        with open(path, "r") as f:
+            return self.add_boards(json.load(f).get("boards", []))
+
+    def due_boards(self, refresh: float, limit: int) -> List[sqlite3.Row]:
+        """Active boards never crawled or not crawled within `refresh` seconds, oldest first."""
+        with self._conn() as conn:
+            return conn.execute(
+                "SELECT * FROM boards WHERE status = 'active' AND (last_crawled IS NULL OR last_crawled < ?) "
+                "ORDER BY last_crawled IS NOT NULL, last_crawled LIMIT ?",
+                (time.time() - refresh, limit)
+            ).fetchall()
+
+    def snapshot(self, token: str) -> Dict[str, Optional[str]]:
+        with self._conn() as conn:
+            return {
+                row["job_id"]: row["updated_at"]
+                for row in conn.execute("SELECT job_id, updated_at FROM board_snapshot WHERE token = ?", (token,))
+            }
+
+    def apply_diff(self, token: str, changed: Dict[str, Optional[str]], removed: List[str],
+                   job_count: int, etag: Optional[str], last_modified: Optional[str]):
+        """Persist a crawled board's new snapshot rows and crawl state in one transaction."""
+        now = time.time()
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO board_snapshot (token, job_id, updated_at) VALUES (?, ?, ?)",
+                [(token, job_id, updated_at) for job_id, updated_at in changed.items()]
+            )
+            conn.executemany("DELETE FROM board_snapshot WHERE token = ? AND job_id = ?",
+                             [(token, job_id) for job_id in removed])
+            conn.execute(
+                "UPDATE boards SET last_crawled = ?, last_changed = CASE WHEN ? THEN ? ELSE last_changed END, "
+                "job_count = ?, etag = ?, last_modified = ?, consecutive_errors = 0, last_error = NULL "
+                "WHERE token = ?",
+                (now, bool(changed or removed), now, job_count, etag, last_modified, token)
+            )
+
+    def mark_unchanged(self, token: str):
+        with self._conn() as conn:
+            conn.execute("UPDATE boards SET last_crawled = ?, consecutive_errors = 0 WHERE token = ?",
+                         (time.time(), token))
+
+    def mark_error(self, token: str, error: str, missing: bool = False):
+        with self._conn() as conn:
+            conn.execute(
+                "UPDATE boards SET last_crawled = ?, consecutive_errors = consecutive_errors + 1, "
+                "last_error = ?, status = CASE WHEN ? THEN 'missing' ELSE status END WHERE token = ?",
+                (time.time(), error, missing, token)
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._conn() as conn:
+            by_status = {
+                row["status"]: row["n"]
+                for row in conn.execute("SELECT status, COUNT(*) AS n FROM boards GROUP BY status")
+            }
+            jobs = conn.execute("SELECT COALESCE(SUM(job_count), 0) FROM boards").fetchone()[0]
+        return {"boards": by_status, "jobs": jobs, "path": str(self.path)}
+
+class GreenhouseCrawler:
+    """Crawls due boards with bounded concurrency and writes only changed postings."""
+
+    def __init__(self, catalog: BoardCatalog, index: JobIndex = job_index,
+                 concurrency: int = GREENHOUSE_CRAWL_CONCURRENCY):
+        self.catalog = catalog
+        self.index = index
+        self.concurrency = concurrency
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._run_lock = threading.Lock()
+        self.last_run: Dict[str, Any] = {}
+
+    def _source(self):
+        from .registry import get_source
+        return get_source("greenhouse")
+
+    def crawl_board(self, board: sqlite3.Row) -> Dict[str, int]:
+        """Fetch one board, diff it against its snapshot and write the changes."""
+        source = self._source()
+        token = board["token"]
+        headers = {}
+        if board["etag"]:
+            headers["If-None-Match"] = board["etag"]
+        if board["last_modified"]:
+            headers["If-Modified-Since"] = board["last_modified"]
+
+        try:
+            response = source._get(source.board_url(token), headers=headers, timeout=15)
+            if response.status_code == 304:
+                self.catalog.mark_unchanged(token)
+                self.index.touch(self.catalog.snapshot(token))
+                return {"changed": 0, "removed": 0, "unchanged": board["job_count"]}
+            if response.status_code == 404:
+                self.catalog.mark_error(token, "board not found", missing=True)
+                return {"changed": 0, "removed": 0, "unchanged": 0}
+            response.raise_for_status()
+            jobs_data = response.json().get("jobs", [])
+        except (requests.RequestException, ValueError) as e:
+            self.catalog.mark_error(token, str(e))
+            raise
+
+        previous = self.catalog.snapshot(token)
+        current = {f"greenhouse_{job.get('id')}": job for job in jobs_data if job.get("id") is not None}
+        changed = {
+            job_id: job.get("updated_at")
+            for job_id, job in current.items()
+            if job_id not in previous or previous[job_id] != job.get("updated_at")
+        }
+        removed = [job_id for job_id in previous if job_id not in current]
+
+        postings = [source.to_posting(token, current[job_id], board["company"]) for job_id in changed]
+        enrich_job_skills(postings)
+        self.index.upsert(postings)
+        self.index.delete(removed)
+        index_job_vectors(postings)
+        percolate_jobs(posting for posting in postings if posting.id not in previous)
+        job_vectors.delete(removed)
+        # Unchanged postings only get their last_seen bumped so pruning keeps them
+        self.index.touch(job_id for job_id in current if job_id not in changed)
+        remember_jobs(postings)
+        self.catalog.apply_diff(token, changed, removed, len(current),
+                                response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return {"changed": len(changed), "removed": len(removed), "unchanged": len(current) - len(changed)}
+
+    def crawl_due(self, refresh: float = GREENHOUSE_BOARD_REFRESH, limit: int = GREENHOUSE_CRAWL_BATCH) -> Dict[str, Any]:
+        """Crawl every due board (up to limit) on a bounded thread pool."""
+        with self._run_lock:
+            start = time.time()
+            boards = self.catalog.due_boards(refresh, limit)
+            totals = {"boards": len(boards), "changed": 0, "removed": 0, "unchanged": 0, "errors": 0}
+
+            def crawl(board):
+                try:
+                    # Board fetches share greenhouse's bucket and yield to interactive requests
+                    with crawl_priority(BACKGROUND):
+                        return self.crawl_board(board)
+                except Exception as e:
+                    print(f"Greenhouse crawl failed for {board['token']}: {e}")
+                    return None
+
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="gh-crawl") as executor:
+                for result in executor.map(crawl, boards):
+                    if result is None:
+                        totals["errors"] += 1
+                        continue
+                    for key, value in result.items():
+                        totals[key] += value
+
+            totals["elapsed_s"] = round(time.time() - start, 2)
+            self.last_run = totals
+            return totals
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.crawl_due()
+            except Exception as e:
+                print(f"Greenhouse crawl run failed: {e}")
+            self._stop.wait(GREENHOUSE_CRAWL_TICK)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="greenhouse-crawler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def get_health_status(self) -> Dict[str, Any]:
+        try:
+            catalog_stats = self.catalog.stats()
+        except Exception as e:
+            catalog_stats = {"error": str(e)}
+        return {
+            "enabled": GREENHOUSE_CRAWL_ENABLED,
+            "running": bool(self._thread and self._thread.is_alive()),
+            "concurrency": self.concurrency,
+            "board_refresh_s": GREENHOUSE_BOARD_REFRESH,
+            "last_run": self.last_run,
+            "catalog": catalog_stats
+        }
+
+# Global catalog and crawler
+board_catalog = BoardCatalog()
+greenhouse_crawler = GreenhouseCrawler(board_catalog)
+
+def start_greenhouse_crawler() -> bool:
+    """Seed the catalog and start scheduled crawling if GREENHOUSE_CRAWL_ENABLED."""
+    if not GREENHOUSE_CRAWL_ENABLED:
+        return False
+    try:
+        board_catalog.seed_from_file()
+    except Exception as e:
+        print(f"Greenhouse catalog seed failed: {e}")
+    greenhouse_crawler.start()
+    return True
+
+def stop_greenhouse_crawler():
+    greenhouse_crawler.stop()
+
+def validate_board_tokens(tokens: List[str]) -> List[str]:
+    """Normalize runtime board tokens, raising ValueError on a bad or oversized batch."""
+    if not tokens:
+        raise ValueError("no board tokens given")
+    if len(tokens) > GREENHOUSE_BOARDS_MAX_PER_REQUEST:
+        raise ValueError(f"at most {GREENHOUSE_BOARDS_MAX_PER_REQUEST} board tokens per request")
+    normalized = [token.strip().lower() for token in tokens]
+    invalid = [token for token in normalized if not BOARD_TOKEN_RE.match(token)]
+    if invalid:
+        raise ValueError(f"invalid board tokens: {', '.join(invalid[:10])}")
+    return normalized
+
+def add_greenhouse_boards(boards: Iterable[Dict[str, str]]) -> int:
+    return board_catalog.add_boards(boards)
+
+def get_greenhouse_crawler_health() -> Dict[str, Any]:
+    return greenhouse_crawler.get_health_status()
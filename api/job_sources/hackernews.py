@@ -2,10 +2,15 @@
 Hacker News job source implementation for "Who is hiring" threads.
 """
 
-import requests
-from typing import List, Optional
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-from .base import JobSource, JobPosting
+from .base import REQUEST_ERRORS, JobSource, JobPosting, TTLCache
+
+HN_ITEM_CONCURRENCY = int(os.getenv("HN_ITEM_CONCURRENCY", "8"))        # parallel item fetches
+HN_ITEM_CACHE_TTL = int(os.getenv("HN_ITEM_CACHE_TTL", str(6 * 3600)))  # items are effectively immutable
+HN_ITEM_CACHE_SIZE = int(os.getenv("HN_ITEM_CACHE_SIZE", "5000"))
 
 class HackerNewsSource(JobSource):
     """Hacker News 'Who is hiring' thread integration."""
@@ -13,30 +18,65 @@ class HackerNewsSource(JobSource):
     def __init__(self, api_key: str = None):
         super().__init__("hackernews", api_key, rate_limit=60)
         self.base_url = "https://hacker-news.firebaseio.com/v0"
+        self.item_cache = TTLCache(max_entries=HN_ITEM_CACHE_SIZE, default_ttl=HN_ITEM_CACHE_TTL)
+
+    # The job-story id list turns over quickly; keep it only briefly
+    feed_ttl = 60
 
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    async def _fetch_item(self, job_id: int, slots: asyncio.Semaphore) -> Dict[str, Any]:
+        """Fetch one item, returning {} for missing items or failed requests."""
+        try:
+            async with slots:
+                response = await self._aget(f"{self.base_url}/item/{job_id}.json", throttle=False, timeout=5)
+            response.raise_for_status()
+            item = response.json() or {}
+        except REQUEST_ERRORS:
+            return {}  # Skip failed individual job fetches (not cached, retried next query)
+        self.item_cache.set(job_id, item)
+        return item
+
+    async def _fetch_items(self, job_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Cached items plus concurrent fetches (bounded by HN_ITEM_CONCURRENCY) for the rest.
+
+        The uncached batch costs one rate-limit token: a search is one logical
+        request to the board, and per-item tokens would drain the bucket in a
+        single search.
+        """
+        items = {}
+        missing = []
+        for job_id in job_ids:
+            cached = self.item_cache.get(job_id)
+            if cached is None:
+                missing.append(job_id)
+            else:
+                items[job_id] = cached
+        if missing:
+            await self._acquire_token()
+            slots = asyncio.Semaphore(HN_ITEM_CONCURRENCY)
+            fetched = await asyncio.gather(*(self._fetch_item(job_id, slots) for job_id in missing))
+            items.update(zip(missing, fetched))
+        return items
+
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search Hacker News job postings from Job Stories."""
         if not self._check_rate_limit():
             return []
 
         try:
-            # Get job story IDs
-            response = requests.get(f"{self.base_url}/jobstories.json", timeout=10)
-            response.raise_for_status()
-            job_ids = response.json()[:limit*2]  # Get extra for filtering
+            # Get job story IDs (short-TTL feed cache)
+            job_ids = (await self._afetch_feed(f"{self.base_url}/jobstories.json",
+                                               lambda response: response.json(), timeout=10))[:limit*2]  # Get extra for filtering
 
             jobs = []
             query_lower = query.lower() if query else ''
+            items = await self._fetch_items(job_ids)
 
             for job_id in job_ids:
                 if len(jobs) >= limit:
                     break
 
-                # Fetch job details
                 try:
-                    job_response = requests.get(f"{self.base_url}/item/{job_id}.json", timeout=5)
-                    job_response.raise_for_status()
-                    job_data = job_response.json()
+                    job_data = items.get(job_id)
 
                     if not job_data or job_data.get('dead') or job_data.get('deleted'):
                         continue
@@ -58,7 +98,7 @@ class HackerNewsSource(JobSource):
                         "title": title,
                         "company": company,
                         "location": "See description",
-                        "description": text[:500] if text else title,
+                        "description": text if text else title,
                         "url": f"https://news.ycombinator.com/item?id={job_id}",
                         "posted_date": datetime.fromtimestamp(job_data.get('time', 0)),
                         "job_type": "Full-time",
@@ -69,12 +109,13 @@ class HackerNewsSource(JobSource):
 
                     jobs.append(self._normalize_job_data(job))
 
-                except requests.RequestException:
-                    continue  # Skip failed individual job fetches
+                except Exception as e:
+                    print(f"Error parsing Hacker News item {job_id}: {e}")
+                    continue
 
             return jobs
 
-        except requests.RequestException as e:
+        except REQUEST_ERRORS as e:
             print(f"Error fetching Hacker News jobs: {e}")
             return []
         except Exception as e:
@@ -0,0 +1,210 @@
+"""
+Per-source circuit breakers and health scoring.
+Every upstream request made through JobSource._get feeds its source's
+breaker; when a source keeps failing or gets too slow the breaker opens and
+requests (and whole fan-out slots) fail instantly until a cooldown passes and
+a single half-open probe succeeds. Search-level outcomes are kept for the
+source health dashboard.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+import requests
+
+BREAKER_WINDOW = int(os.getenv("JOB_SOURCE_BREAKER_WINDOW", "20"))              # recent requests considered
+BREAKER_MIN_CALLS = int(os.getenv("JOB_SOURCE_BREAKER_MIN_CALLS", "5"))         # before the breaker may trip
+BREAKER_ERROR_RATE = float(os.getenv("JOB_SOURCE_BREAKER_ERROR_RATE", "0.5"))   # failure ratio that opens it
+BREAKER_SLOW_MS = float(os.getenv("JOB_SOURCE_BREAKER_SLOW_MS", "5000"))        # latency EWMA that opens it
+BREAKER_COOLDOWN = float(os.getenv("JOB_SOURCE_BREAKER_COOLDOWN", "30"))        # seconds open before a probe
+BREAKER_MAX_COOLDOWN = float(os.getenv("JOB_SOURCE_BREAKER_MAX_COOLDOWN", "300"))
+LATENCY_EWMA_ALPHA = 0.3
+SEARCH_HISTORY = 200
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class SourceUnavailable(requests.RequestException):
+    """Raised instead of contacting an upstream whose circuit is open."""
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by error rate and latency EWMA."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.state = CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=BREAKER_WINDOW)
+        self.latency_ewma_ms: Optional[float] = None
+        self.opened_at = 0.0
+        self.cooldown = BREAKER_COOLDOWN
+        self.probe_in_flight = False
+        self.trips = 0
+        self.last_error: Optional[str] = None
+        self.last_failure_at = 0.0
+        self._lock = threading.Lock()
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return 1 - sum(self.outcomes) / len(self.outcomes)
+
+    def is_open(self) -> bool:
+        """True while requests should be rejected without a probe."""
+        with self._lock:
+            return self.state == OPEN and time.time() - self.opened_at < self.cooldown
+
+    def before_request(self) -> bool:
+        """Admit a request or raise SourceUnavailable; True when it reserved the half-open probe."""
+        with self._lock:
+            if self.state == OPEN:
+                if time.time() - self.opened_at < self.cooldown:
+                    raise SourceUnavailable(f"{self.name} circuit open")
+                self.state = HALF_OPEN
+                self.probe_in_flight = False
+            if self.state == HALF_OPEN:
+                if self.probe_in_flight:
+                    raise SourceUnavailable(f"{self.name} circuit half-open, probe in flight")
+                self.probe_in_flight = True
+                return True
+            return False
+
+    def release_probe(self):
+        """Give up a reserved probe without an outcome (the request was cancelled)."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.probe_in_flight = False
+
+    def _trip(self):
+        if self.state == HALF_OPEN:
+            # Failed probe: back off further before the next one
+            self.cooldown = min(self.cooldown * 2, BREAKER_MAX_COOLDOWN)
+        self.state = OPEN
+        self.opened_at = time.time()
+        self.probe_in_flight = False
+        self.trips += 1
+
+    def record(self, success: bool, elapsed_ms: float, error: Optional[str] = None):
+        with self._lock:
+            self.outcomes.append(success)
+            if self.latency_ewma_ms is None:
+                self.latency_ewma_ms = elapsed_ms
+            else:
+                self.latency_ewma_ms += LATENCY_EWMA_ALPHA * (elapsed_ms - self.latency_ewma_ms)
+            if error:
+                self.last_error = error
+            if not success:
+                self.last_failure_at = time.time()
+
+            if self.state == HALF_OPEN:
+                if success and elapsed_ms < BREAKER_SLOW_MS:
+                    self.state = CLOSED
+                    self.cooldown = BREAKER_COOLDOWN
+                    self.outcomes.clear()
+                    self.latency_ewma_ms = elapsed_ms
+                    self.probe_in_flight = False
+                else:
+                    self._trip()
+                return
+
+            if self.state == CLOSED and len(self.outcomes) >= BREAKER_MIN_CALLS:
+                if self.error_rate() >= BREAKER_ERROR_RATE or self.latency_ewma_ms >= BREAKER_SLOW_MS:
+                    self._trip()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self.state
+            if state == OPEN and time.time() - self.opened_at >= self.cooldown:
+                state = HALF_OPEN  # next request will probe
+            return {
+                "state": state,
+                "error_rate": round(self.error_rate(), 3),
+                "latency_ewma_ms": round(self.latency_ewma_ms, 1) if self.latency_ewma_ms is not None else None,
+                "cooldown_s": self.cooldown,
+                "trips": self.trips,
+                "last_error": self.last_error
+            }
+
+class SourceStats:
+    """Search-level outcomes for one source (success rate, latency, yield)."""
+
+    def __init__(self):
+        self.searches: Deque[tuple] = deque(maxlen=SEARCH_HISTORY)  # (status, elapsed_ms, results)
+        self._lock = threading.Lock()
+
+    def record(self, status: str, elapsed_ms: float, results: int):
+        with self._lock:
+            self.searches.append((status, elapsed_ms, results))
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            searches = list(self.searches)
+        if not searches:
+            return {"searches": 0, "success_rate": None, "p95_ms": None, "avg_yield": None}
+        completed = [s for s in searches if s[0] != "skipped"]
+        ok = [s for s in completed if s[0] == "ok"]
+        latencies = sorted(s[1] for s in completed)
+        p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] if latencies else None
+        return {
+            "searches": len(searches),
+            "skipped": len(searches) - len(completed),
+            "success_rate": round(len(ok) / len(completed), 3) if completed else None,
+            "p95_ms": round(p95, 1) if p95 is not None else None,
+            "avg_yield": round(sum(s[2] for s in ok) / len(ok), 2) if ok else None,
+            "empty_rate": round(sum(1 for s in ok if s[2] == 0) / len(ok), 3) if ok else None
+        }
+
+class SourceHealthRegistry:
+    """Breakers and search stats for every source, created on first use."""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._stats: Dict[str, SourceStats] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name)
+            return self._breakers[name]
+
+    def stats(self, name: str) -> SourceStats:
+        with self._lock:
+            if name not in self._stats:
+                self._stats[name] = SourceStats()
+            return self._stats[name]
+
+    def is_available(self, name: str) -> bool:
+        return not self.breaker(name).is_open()
+
+    def record_search(self, name: str, status: str, elapsed_ms: float, results: int = 0):
+        self.stats(name).record(status, elapsed_ms, results)
+        if status == "timeout":
+            # The request was cancelled before the breaker saw an outcome; count the stall now
+            self.breaker(name).record(False, elapsed_ms, "search timeout")
+
+    def dashboard(self) -> Dict[str, Any]:
+        with self._lock:
+            names = sorted(set(self._breakers) | set(self._stats))
+        return {
+            name: {"circuit": self.breaker(name).snapshot(), **self.stats(name).snapshot()}
+            for name in names
+        }
+
+# Global source health registry
+source_health = SourceHealthRegistry()
+
+def get_source_health_dashboard() -> Dict[str, Any]:
+    return {
+        "sources": source_health.dashboard(),
+        "config": {
+            "window": BREAKER_WINDOW,
+            "min_calls": BREAKER_MIN_CALLS,
+            "error_rate": BREAKER_ERROR_RATE,
+            "slow_ms": BREAKER_SLOW_MS,
+            "cooldown_s": BREAKER_COOLDOWN
+        }
+    }
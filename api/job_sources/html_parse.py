@@ -0,0 +1,161 @@
+"""
+HTML card extraction for scraping sources.
+Each scraper declares a CardSpec (a card selector plus per-field selectors);
+specs are compiled once per process into lxml XPath expressions, with
+BeautifulSoup's html.parser kept as the fallback backend. Large pages are
+parsed on the shared compute pool so they do not hold the GIL on request
+threads or stall the event loop (aparse_cards).
+"""
+
+import asyncio
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "auto").lower()             # auto | lxml | bs4
+HTML_PARSE_OFFLOAD_BYTES = int(os.getenv("HTML_PARSE_OFFLOAD_BYTES", str(256 * 1024)))  # pages above this go to the compute pool
+
+_SELECTOR_RE = re.compile(r"^([a-z][a-z0-9]*)?(?:\.([A-Za-z0-9_-]+))?$")
+
+def parse_selector(selector: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split a 'tag.class' selector (either part optional) into (tag, class)."""
+    match = _SELECTOR_RE.match(selector.strip())
+    if not match or not any(match.groups()):
+        raise ValueError(f"unsupported selector: {selector!r} (use 'tag', '.class' or 'tag.class')")
+    return match.group(1), match.group(2)
+
+def selector_xpath(selector: str, descendant: bool = True) -> str:
+    tag, cls = parse_selector(selector)
+    path = f"{'.//' if descendant else '//'}{tag or '*'}"
+    if cls:
+        path += f"[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+    return path
+
+@dataclass(frozen=True)
+class CardSpec:
+    """What a results page looks like: card selector plus fields as (selector, attribute or None for text)."""
+    card: str
+    fields: Tuple[Tuple[str, str, Optional[str]], ...]   # (name, selector, attribute)
+
+    @classmethod
+    def build(cls, card: str, **fields) -> "CardSpec":
+        normalized = []
+        for name, spec in fields.items():
+            selector, attribute = spec if isinstance(spec, tuple) else (spec, None)
+            parse_selector(selector)
+            normalized.append((name, selector, attribute))
+        parse_selector(card)
+        return cls(card=card, fields=tuple(normalized))
+
+class _CompiledSpec:
+    """XPath expressions for one CardSpec (one per distinct field selector)."""
+
+    def __init__(self, spec: CardSpec):
+        self.card = etree.XPath(selector_xpath(spec.card, descendant=False))
+        self.selectors = {
+            selector: etree.XPath(f"({selector_xpath(selector)})[1]")
+            for _, selector, _ in spec.fields
+        }
+
+_compiled: Dict[CardSpec, _CompiledSpec] = {}
+
+def _compile(spec: CardSpec) -> _CompiledSpec:
+    compiled = _compiled.get(spec)
+    if compiled is None:
+        compiled = _compiled[spec] = _CompiledSpec(spec)
+    return compiled
+
+def _use_lxml() -> bool:
+    return LXML_AVAILABLE and HTML_PARSER_BACKEND != "bs4"
+
+def _parse_lxml(content: bytes, spec: CardSpec, limit: int) -> List[Dict[str, Optional[str]]]:
+    compiled = _compile(spec)
+    try:
+        root = lxml.html.fromstring(content)
+    except (etree.ParserError, ValueError):
+        return []
+    cards = []
+    for card in compiled.card(root)[:limit]:
+        found = {selector: (xpath(card) or [None])[0] for selector, xpath in compiled.selectors.items()}
+        values = {}
+        for name, selector, attribute in spec.fields:
+            element = found[selector]
+            if element is None:
+                values[name] = None
+            elif attribute:
+                values[name] = element.get(attribute)
+            else:
+                values[name] = element.text_content().strip()
+        cards.append(values)
+    return cards
+
+def _parse_bs4(content: bytes, spec: CardSpec, limit: int) -> List[Dict[str, Optional[str]]]:
+    soup = BeautifulSoup(content, 'html.parser')
+    card_tag, card_class = parse_selector(spec.card)
+    cards = []
+    for card in soup.find_all(card_tag or True, class_=card_class, limit=limit):
+        values = {}
+        for name, selector, attribute in spec.fields:
+            tag, cls = parse_selector(selector)
+            element = card.find(tag or True, class_=cls)
+            if element is None:
+                values[name] = None
+            elif attribute:
+                values[name] = element.get(attribute)
+            else:
+                values[name] = element.text.strip()
+        cards.append(values)
+    return cards
+
+def parse_cards_inline(content: bytes, spec: CardSpec, limit: int) -> List[Dict[str, Optional[str]]]:
+    """Extract up to limit cards as {field: text/attribute or None} on the calling thread."""
+    if _use_lxml():
+        return _parse_lxml(content, spec, limit)
+    return _parse_bs4(content, spec, limit)
+
+def parse_cards(content: bytes, spec: CardSpec, limit: int) -> List[Dict[str, Optional[str]]]:
+    """Extract cards, offloading large pages to the compute pool (inline when it is disabled).
+
+    A busy or overrunning pool yields no cards rather than a second parse on
+    the request thread; only an unexpected pool failure falls back inline.
+    """
+    if len(content) >= HTML_PARSE_OFFLOAD_BYTES:
+        from ..compute_pool import ComputePoolBusy, in_worker, run_cpu_bound
+
+        if not in_worker():
+            try:
+                return run_cpu_bound(parse_cards_inline, content, spec, limit)
+            except (ComputePoolBusy, TimeoutError) as e:
+                print(f"Compute pool HTML parse {'busy' if isinstance(e, ComputePoolBusy) else 'timed out'}, skipping page")
+                return []
+            except Exception as e:
+                print(f"Compute pool HTML parse failed, parsing inline: {e}")
+    return parse_cards_inline(content, spec, limit)
+
+async def aparse_cards(content: bytes, spec: CardSpec, limit: int) -> List[Dict[str, Optional[str]]]:
+    """parse_cards for async adapters: large pages are awaited on the compute pool, never parsed on the loop."""
+    if len(content) >= HTML_PARSE_OFFLOAD_BYTES:
+        from ..compute_pool import ComputePoolBusy, arun_cpu_bound
+
+        try:
+            return await arun_cpu_bound(parse_cards_inline, content, spec, limit)
+        except (ComputePoolBusy, TimeoutError) as e:
+            print(f"Compute pool HTML parse {'busy' if isinstance(e, ComputePoolBusy) else 'timed out'}, skipping page")
+            return []
+        except Exception as e:
+            print(f"Compute pool HTML parse failed, parsing inline: {e}")
+            return await asyncio.to_thread(parse_cards_inline, content, spec, limit)
+    return parse_cards_inline(content, spec, limit)
+
+def get_html_parser_backend() -> str:
+    return "lxml" if _use_lxml() else "bs4"
@@ -0,0 +1,176 @@
+"""
+Shared, pooled HTTP clients for job sources.
+Adapters are async: each event loop gets one keep-alive httpx.AsyncClient, so
+a search holds no thread while it waits on upstream boards and repeated
+requests to the same board reuse TCP+TLS connections. Blocking callers
+(ingestion workers, scripts) run adapters on a single background I/O loop.
+The requests session remains for the few synchronous callers.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Coroutine, Optional, TypeVar
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+HTTP_POOL_HOSTS = int(os.getenv("JOB_SOURCES_HTTP_POOL_HOSTS", "32"))          # hosts kept warm
+HTTP_POOL_PER_HOST = int(os.getenv("JOB_SOURCES_HTTP_POOL_PER_HOST", "8"))     # connections per host
+HTTP_MODE = os.getenv("JOB_SOURCES_HTTP_MODE", "live").lower()                 # live | record | replay
+HTTP_ASYNC_MAX_CONNECTIONS = int(os.getenv("JOB_SOURCES_HTTP_MAX_CONNECTIONS", "1000"))  # in-flight requests per event loop
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mosaic Career Platform (contact@whatismydelta.com)',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive'
+}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_mode = HTTP_MODE
+
+# httpx clients are bound to the loop they were first used on
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_io_loop: Optional[asyncio.AbstractEventLoop] = None
+_io_lock = threading.Lock()
+
+T = TypeVar("T")
+
+# Name of the job source issuing the current request (fixture lookup keys on it)
+request_source: ContextVar[str] = ContextVar("request_source", default="unknown")
+
+@contextmanager
+def source_context(name: str):
+    token = request_source.set(name)
+    try:
+        yield
+    finally:
+        request_source.reset(token)
+
+def _create_adapter(mode: str) -> HTTPAdapter:
+    # pool_block caps concurrent connections per host instead of opening extras
+    kwargs = dict(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_PER_HOST, pool_block=True)
+    if mode in ("record", "replay"):
+        from .replay import RecordingAdapter, ReplayAdapter
+        return RecordingAdapter(**kwargs) if mode == "record" else ReplayAdapter(**kwargs)
+    return HTTPAdapter(**kwargs)
+
+def create_http_session(mode: Optional[str] = None) -> requests.Session:
+    """Build a session with bounded per-host connection pools.
+
+    In record mode every response is also written to the fixture directory;
+    in replay mode responses come only from fixtures and nothing leaves the
+    process.
+    """
+    session = requests.Session()
+    adapter = _create_adapter(mode or _mode)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+def _create_async_transport(mode: str) -> httpx.AsyncBaseTransport:
+    limits = httpx.Limits(max_connections=HTTP_ASYNC_MAX_CONNECTIONS,
+                          max_keepalive_connections=HTTP_POOL_HOSTS * HTTP_POOL_PER_HOST)
+    if mode in ("record", "replay"):
+        from .replay import RecordingTransport, ReplayTransport
+        return RecordingTransport(limits=limits) if mode == "record" else ReplayTransport()
+    return httpx.AsyncHTTPTransport(limits=limits)
+
+def create_async_client(mode: Optional[str] = None) -> httpx.AsyncClient:
+    """An AsyncClient with the same headers, redirect handling and record/replay modes as the session."""
+    return httpx.AsyncClient(transport=_create_async_transport(mode or _mode), headers=DEFAULT_HEADERS,
+                             follow_redirects=True)
+
+def get_async_client() -> httpx.AsyncClient:
+    """The running event loop's shared client, created on first use."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _async_clients[loop] = create_async_client()
+    return client
+
+def _run_io_loop(loop: asyncio.AbstractEventLoop):
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+def get_io_loop() -> asyncio.AbstractEventLoop:
+    """Background event loop that runs adapter coroutines for blocking callers."""
+    global _io_loop
+    if _io_loop is None:
+        with _io_lock:
+            if _io_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=_run_io_loop, args=(loop,), name="job-sources-io", daemon=True).start()
+                _io_loop = loop
+    return _io_loop
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run an adapter coroutine from blocking code and return its result.
+
+    The coroutine runs on the background I/O loop in a copy of the caller's
+    context, so context variables such as the crawl priority carry over.
+    """
+    loop = get_io_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync called from the job source I/O loop; await the coroutine instead")
+    context = contextvars.copy_context()
+    result: "concurrent.futures.Future[T]" = concurrent.futures.Future()
+
+    def done(task: asyncio.Task):
+        if task.cancelled():
+            result.cancel()
+        elif task.exception() is not None:
+            result.set_exception(task.exception())
+        else:
+            result.set_result(task.result())
+
+    # Tasks copy the current context when created, so create this one inside the caller's
+    loop.call_soon_threadsafe(lambda: context.run(loop.create_task, coro).add_done_callback(done))
+    return result.result()
+
+def get_http_session() -> requests.Session:
+    """Process-wide shared session, created on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_http_session()
+    return _session
+
+def set_http_mode(mode: str):
+    """Switch live/record/replay; the shared session is rebuilt on next use."""
+    global _mode
+    if mode not in ("live", "record", "replay"):
+        raise ValueError(f"unknown HTTP mode: {mode}")
+    close_http_session()
+    _mode = mode
+
+def get_http_mode() -> str:
+    return _mode
+
+def close_http_session():
+    """Close pooled connections (app shutdown, mode switch)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+        clients = list(_async_clients.items())
+        _async_clients.clear()
+    for loop, client in clients:
+        # Each client can only be closed on its own loop
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
@@ -2,11 +2,11 @@
 Indeed job source implementation via XML feed.
 """
 
-import requests
 import xml.etree.ElementTree as ET
 from typing import List, Optional
 from datetime import datetime
-from .base import JobSource, JobPosting
+from .base import REQUEST_ERRORS, JobSource, JobPosting
+from .rss import aiter_rss_items
 
 class IndeedSource(JobSource):
     """Indeed job board integration via XML feed."""
@@ -15,7 +15,7 @@ class IndeedSource(JobSource):
         super().__init__("indeed", api_key, rate_limit=100)
         self.xml_url = "https://www.indeed.com/rss"
     
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search Indeed jobs via RSS feed."""
         if not self._check_rate_limit():
             return []
@@ -25,48 +25,48 @@ class IndeedSource(JobSource):
             if location:
                 params['l'] = location
 
-            headers = {'User-Agent': 'Mosaic Career Platform (contact@whatismydelta.com)'}
-            response = requests.get(self.xml_url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
             jobs = []
+            # Stream the feed and stop reading once the quota is met
+            async with self._astream(self.xml_url, params=params, timeout=10) as response:
+                response.raise_for_status()
+
+                async for item in aiter_rss_items(response):
+                    if len(jobs) >= limit:
+                        break
 
-            for item in root.findall('.//item')[:limit]:
-                title = item.find('title').text if item.find('title') is not None else ''
-                description = item.find('description').text if item.find('description') is not None else ''
-                link = item.find('link').text if item.find('link') is not None else ''
-                pub_date = item.find('pubDate').text if item.find('pubDate') is not None else ''
+                    title = item.get('title', '')
+                    description = item.get('description', '')
+                    link = item.get('link', '')
 
-                # Extract company from title (format: "Job Title - Company Name")
-                company = 'Company'
-                if ' - ' in title:
-                    parts = title.split(' - ', 1)
-                    if len(parts) > 1:
-                        company = parts[1].strip()
-                        title = parts[0].strip()
+                    # Extract company from title (format: "Job Title - Company Name")
+                    company = 'Company'
+                    if ' - ' in title:
+                        parts = title.split(' - ', 1)
+                        if len(parts) > 1:
+                            company = parts[1].strip()
+                            title = parts[0].strip()
 
-                # Extract job ID from link
-                job_id = link.split('jk=')[-1].split('&')[0] if 'jk=' in link else str(hash(title))
+                    # Extract job ID from link
+                    job_id = link.split('jk=')[-1].split('&')[0] if 'jk=' in link else str(hash(title))
 
-                job = {
-                    "id": f"indeed_{job_id}",
-                    "title": title,
-                    "company": company,
-                    "location": location or "See description",
-                    "description": description[:500],
-                    "url": link,
-                    "posted_date": datetime.now(),
-                    "remote": 'remote' in title.lower() or 'remote' in description.lower(),
-                    "skills": [],
-                    "experience_level": "mid"
-                }
+                    job = {
+                        "id": f"indeed_{job_id}",
+                        "title": title,
+                        "company": company,
+                        "location": location or "See description",
+                        "description": description,
+                        "url": link,
+                        "posted_date": datetime.now(),
+                        "remote": 'remote' in title.lower() or 'remote' in description.lower(),
+                        "skills": [],
+                        "experience_level": "mid"
+                    }
 
-                jobs.append(self._normalize_job_data(job))
+                    jobs.append(self._normalize_job_data(job))
 
             return jobs
 
-        except requests.RequestException as e:
+        except REQUEST_ERRORS as e:
             print(f"Error fetching Indeed jobs: {e}")
             return []
         except ET.ParseError as e:
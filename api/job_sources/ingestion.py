@@ -0,0 +1,195 @@
+"""
+Background ingestion into the local job index.
+A daemon thread keeps a persistent crawl queue of (source, seed query) tasks
+and drains it on a fixed interval through the rate-limit-aware crawl
+scheduler, upserting the normalized postings into the job index, matching
+new ones against saved searches and pruning postings that have not been
+seen for JOB_INDEX_MAX_AGE. Searches that miss
+the index queue hot tasks that wake the loop and run ahead of the seeds.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .base import JobPosting, JobSource
+from .crawl_queue import CrawlQueue, CrawlScheduler
+from .job_index import JobIndex, job_index
+from .job_vectors import index_job_vectors, job_vectors
+from .rate_limits import BACKGROUND, HOT, rate_limiter
+from .records import remember_jobs
+from .saved_searches import percolate_jobs
+from ..skill_extractor import enrich_job_skills
+
+JOB_INGEST_ENABLED = os.getenv("JOB_INGEST_ENABLED", "true").lower() in {"1", "true", "yes", "on"}
+JOB_INGEST_INTERVAL = int(os.getenv("JOB_INGEST_INTERVAL", "900"))       # seconds between runs
+JOB_INGEST_LIMIT = int(os.getenv("JOB_INGEST_LIMIT", "50"))              # postings per source per query
+JOB_INGEST_QUERIES = [
+    query.strip()
+    for query in os.getenv(
+        "JOB_INGEST_QUERIES",
+        "software engineer,developer,python,javascript,data,product manager,designer,devops,marketing,sales"
+    ).split(",")
+    if query.strip()
+]
+
+class IngestionScheduler:
+    """Drains the crawl queue on a fixed interval (and on demand) in a daemon thread."""
+
+    def __init__(self, index: JobIndex = job_index, interval: int = JOB_INGEST_INTERVAL,
+                 queries: Optional[List[str]] = None, limit: int = JOB_INGEST_LIMIT,
+                 queue: Optional[CrawlQueue] = None):
+        self.index = index
+        self.interval = interval
+        self.queries = queries or JOB_INGEST_QUERIES
+        self.limit = limit
+        self.queue = queue or CrawlQueue()
+        self.crawler = CrawlScheduler(self.queue)
+        self._sources_provider: Optional[Callable[[], Dict[str, JobSource]]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._run_lock = threading.Lock()
+        self.last_run: Dict[str, Any] = {}
+        self.last_drain: Dict[str, Any] = {}
+
+    def _process(self, source_name: str, jobs: List[JobPosting]) -> int:
+        """Write one task's postings through to records, the index and the vector index."""
+        new_jobs = self.index.unseen(jobs)
+        enrich_job_skills(jobs)
+        remember_jobs(jobs)
+        written = self.index.upsert(jobs)
+        index_job_vectors(jobs)
+        percolate_jobs(new_jobs)
+        return written
+
+    def _crawlable(self, sources: Dict[str, JobSource]) -> Dict[str, JobSource]:
+        return {name: source for name, source in sources.items() if not source.self_indexed}
+
+    def drain(self, sources: Dict[str, JobSource]) -> Dict[str, Dict[str, Any]]:
+        """Run whatever is due in the crawl queue (hot tasks first)."""
+        with self._run_lock:
+            start = time.time()
+            # Reschedule slightly early so tasks finished late in a pass are due at the next one
+            summary = self.crawler.drain(self._crawlable(sources), self._process, self.limit,
+                                         self.interval * 0.9, self._stop)
+            self.last_drain = {"started_at": start, "elapsed_s": round(time.time() - start, 2),
+                               "tasks": sum(entry["tasks"] for entry in summary.values())}
+            return summary
+
+    def ingest_once(self, sources: Dict[str, JobSource]) -> Dict[str, Any]:
+        """Make sure every source has its seed tasks, drain the queue, then prune."""
+        start = time.time()
+        crawlable = self._crawlable(sources)
+        # Existing seed tasks keep their schedule and backoff; new sources or queries join the queue
+        self.queue.enqueue(((name, query, None) for name in crawlable for query in self.queries),
+                           priority=BACKGROUND, recurring=True)
+        per_source = self.drain(sources)
+
+        with self._run_lock:
+            try:
+                pruned = self.index.prune()
+            except Exception as e:
+                print(f"Ingestion prune failed: {e}")
+                pruned = 0
+
+            # Keep the vector index in step: drop pruned postings, embed ones indexed elsewhere
+            try:
+                job_vectors.prune()
+                embedded = job_vectors.backfill()
+            except Exception as e:
+                print(f"Job vector backfill failed: {e}")
+                embedded = 0
+
+            self.last_run = {
+                "started_at": start,
+                "elapsed_s": round(time.time() - start, 2),
+                "sources": per_source,
+                "pruned": pruned,
+                "vectors_backfilled": embedded
+            }
+            return self.last_run
+
+    def request_crawl(self, source_names: List[str], query: str, location: Optional[str] = None) -> int:
+        """Queue a hot, one-shot crawl of query on these sources and wake the loop."""
+        queued = self.queue.enqueue(((name, query, location) for name in source_names),
+                                    priority=HOT, expedite=True)
+        if queued:
+            self._wake.set()
+        return queued
+
+    def _loop(self):
+        next_run = 0.0
+        while not self._stop.is_set():
+            try:
+                if time.time() >= next_run:
+                    self.ingest_once(self._sources_provider())
+                    next_run = time.time() + self.interval
+                else:
+                    self.drain(self._sources_provider())
+            except Exception as e:
+                print(f"Ingestion run failed: {e}")
+                next_run = time.time() + self.interval
+            self._wake.wait(max(0.0, next_run - time.time()))
+            self._wake.clear()
+
+    def start(self, sources_provider: Callable[[], Dict[str, JobSource]]):
+        """Start the background loop; sources_provider is re-read every run."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._sources_provider = sources_provider
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="job-ingestion", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def get_health_status(self) -> Dict[str, Any]:
+        try:
+            index_stats = self.index.stats()
+        except Exception as e:
+            index_stats = {"error": str(e)}
+        try:
+            queue_stats = self.queue.stats()
+        except Exception as e:
+            queue_stats = {"error": str(e)}
+        return {
+            "enabled": JOB_INGEST_ENABLED,
+            "running": bool(self._thread and self._thread.is_alive()),
+            "interval_s": self.interval,
+            "queries": len(self.queries),
+            "last_run": self.last_run,
+            "last_drain": self.last_drain,
+            "crawl_queue": queue_stats,
+            "rate_limits": rate_limiter.stats(),
+            "index": index_stats
+        }
+
+# Global ingestion scheduler
+ingestion_scheduler = IngestionScheduler()
+
+def start_ingestion(sources_provider: Callable[[], Dict[str, JobSource]]) -> bool:
+    """Start scheduled ingestion if JOB_INGEST_ENABLED."""
+    if not JOB_INGEST_ENABLED:
+        return False
+    ingestion_scheduler.start(sources_provider)
+    return True
+
+def request_crawl(source_names: List[str], query: str, location: Optional[str] = None) -> bool:
+    """Ask the running ingestion loop to crawl a query soon; False when ingestion is off."""
+    if not (ingestion_scheduler._thread and ingestion_scheduler._thread.is_alive()):
+        return False
+    try:
+        return ingestion_scheduler.request_crawl(source_names, query, location) > 0
+    except Exception as e:
+        print(f"Could not queue crawl for {query!r}: {e}")
+        return False
+
+def stop_ingestion():
+    ingestion_scheduler.stop()
+
+def get_ingestion_health() -> Dict[str, Any]:
+    return ingestion_scheduler.get_health_status()
@@ -0,0 +1,401 @@
+"""
+Local full-text job index.
+Postings pulled from every source are upserted into a SQLite FTS5 index so
+/jobs/search can answer with ranked, filtered, paginated results in
+milliseconds without waiting on upstream sites.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .base import JobPosting
+from .normalize import haversine_km, normalize_posting, parse_location, radius_cells
+
+DATA_ROOT = Path(os.getenv("DATA_ROOT", "data"))
+JOB_INDEX_PATH = Path(os.getenv("JOB_INDEX_PATH", DATA_ROOT / "job_index.db"))
+JOB_INDEX_MAX_AGE = int(os.getenv("JOB_INDEX_MAX_AGE", str(7 * 24 * 3600)))  # seconds before a posting is pruned
+
+_TERM_RE = re.compile(r"[A-Za-z0-9+#]+")
+
+# bm25 column weights: title, company, location, description, skills
+_BM25_WEIGHTS = (10.0, 3.0, 1.0, 1.0, 4.0)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    company TEXT,
+    location TEXT,
+    description TEXT,
+    url TEXT,
+    source TEXT NOT NULL,
+    posted_date TEXT,
+    salary_range TEXT,
+    job_type TEXT,
+    remote INTEGER NOT NULL DEFAULT 0,
+    skills TEXT,
+    experience_level TEXT,
+    metadata TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    city TEXT,
+    region TEXT,
+    country TEXT,
+    lat REAL,
+    lon REAL,
+    geohash TEXT,
+    salary_min REAL,
+    salary_max REAL,
+    salary_currency TEXT,
+    salary_period TEXT,
+    salary_min_annual REAL,
+    salary_max_annual REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs(last_seen);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, description, skills,
+    content='jobs', content_rowid='rowid', tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, company, location, description, skills)
+    VALUES (new.rowid, new.title, new.company, new.location, new.description, new.skills);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description, skills)
+    VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description, old.skills);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE OF title, company, location, description, skills ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description, skills)
+    VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description, old.skills);
+    INSERT INTO jobs_fts(rowid, title, company, location, description, skills)
+    VALUES (new.rowid, new.title, new.company, new.location, new.description, new.skills);
+END;
+"""
+
+# Normalized location/salary columns (added to existing databases on startup)
+_NORMALIZED_COLUMNS = (
+    ("city", "TEXT"), ("region", "TEXT"), ("country", "TEXT"), ("lat", "REAL"), ("lon", "REAL"),
+    ("geohash", "TEXT"), ("salary_min", "REAL"), ("salary_max", "REAL"), ("salary_currency", "TEXT"),
+    ("salary_period", "TEXT"), ("salary_min_annual", "REAL"), ("salary_max_annual", "REAL")
+)
+
+_NORMALIZED_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_jobs_place ON jobs(country, region, city);
+CREATE INDEX IF NOT EXISTS idx_jobs_geohash ON jobs(geohash);
+CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs(salary_currency, salary_max_annual);
+"""
+
+_UPSERT = """
+INSERT INTO jobs (id, title, company, location, description, url, source, posted_date, salary_range,
+                  job_type, remote, skills, experience_level, metadata, first_seen, last_seen,
+                  city, region, country, lat, lon, geohash, salary_min, salary_max, salary_currency,
+                  salary_period, salary_min_annual, salary_max_annual)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    description = excluded.description,
+    url = excluded.url,
+    posted_date = COALESCE(excluded.posted_date, jobs.posted_date),
+    salary_range = excluded.salary_range,
+    job_type = excluded.job_type,
+    remote = excluded.remote,
+    skills = excluded.skills,
+    experience_level = excluded.experience_level,
+    metadata = excluded.metadata,
+    last_seen = excluded.last_seen,
+    city = excluded.city,
+    region = excluded.region,
+    country = excluded.country,
+    lat = excluded.lat,
+    lon = excluded.lon,
+    geohash = excluded.geohash,
+    salary_min = excluded.salary_min,
+    salary_max = excluded.salary_max,
+    salary_currency = excluded.salary_currency,
+    salary_period = excluded.salary_period,
+    salary_min_annual = excluded.salary_min_annual,
+    salary_max_annual = excluded.salary_max_annual
+"""
+
+def _normalized_values(job: JobPosting) -> Tuple[bool, tuple]:
+    """(remote, column values) from the location/salary normalizers."""
+    place, salary = normalize_posting(job)
+    values = (place.city, place.region, place.country, place.lat, place.lon, place.geohash)
+    if salary is None:
+        values += (None,) * 6
+    else:
+        values += (salary.min, salary.max, salary.currency, salary.period, salary.annual_min, salary.annual_max)
+    return bool(job.remote) or place.remote, values
+
+def build_match_query(query: str) -> Optional[str]:
+    """Turn free text into an FTS5 MATCH expression (all terms, prefix match).
+
+    Terms are quoted so user input can never inject FTS syntax.
+    """
+    terms = _TERM_RE.findall(query or "")
+    if not terms:
+        return None
+    return " AND ".join(f'"{term}"*' for term in terms)
+
+def _row_to_posting(row: sqlite3.Row) -> JobPosting:
+    posted_date = None
+    if row["posted_date"]:
+        try:
+            posted_date = datetime.fromisoformat(row["posted_date"])
+        except ValueError:
+            posted_date = None
+    return JobPosting(
+        id=row["id"],
+        title=row["title"],
+        company=row["company"] or "",
+        location=row["location"] or "",
+        description=row["description"] or "",
+        url=row["url"] or "",
+        source=row["source"],
+        posted_date=posted_date,
+        salary_range=row["salary_range"],
+        job_type=row["job_type"],
+        remote=bool(row["remote"]),
+        skills=json.loads(row["skills"]) if row["skills"] else [],
+        experience_level=row["experience_level"],
+        metadata=json.loads(row["metadata"]) if row["metadata"] else {}
+    )
+
+def _location_clause(location: str, radius_km: Optional[float]) -> Tuple[str, List[Any]]:
+    """SQL filter for a location string, most specific indexed form first."""
+    place = parse_location(location)
+    if place.remote and not (place.city or place.region):
+        if place.country:
+            return "(jobs.remote = 1 AND (jobs.country = ? OR jobs.country IS NULL))", [place.country]
+        return "jobs.remote = 1", []
+    if radius_km and place.lat is not None:
+        # Geohash prefix ranges narrow to a 3x3 block of cells, distance_km trims it to the circle
+        cells = radius_cells(place.lat, place.lon, radius_km)
+        ranges = " OR ".join("(jobs.geohash >= ? AND jobs.geohash < ?)" for _ in cells)
+        params: List[Any] = [bound for cell in cells for bound in (cell, cell + "~")]
+        return (f"(({ranges}) AND distance_km(jobs.lat, jobs.lon, ?, ?) <= ?)",
+                params + [place.lat, place.lon, radius_km])
+    if place.city:
+        return "(jobs.city = ? AND jobs.country = ?)", [place.city, place.country]
+    if place.region:
+        return "(jobs.region = ? AND jobs.country = ?)", [place.region, place.country]
+    if place.country:
+        return "jobs.country = ?", [place.country]
+    return "jobs.location LIKE ?", [f"%{location.strip()}%"]
+
+class JobIndex:
+    """SQLite FTS5 index of normalized JobPosting rows."""
+
+    def __init__(self, path: Path = JOB_INDEX_PATH):
+        self.path = Path(path)
+        self._write_lock = threading.Lock()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    @contextmanager
+    def _conn(self):
+        self._ensure_schema()
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.row_factory = sqlite3.Row
+            conn.create_function("distance_km", 4, haversine_km, deterministic=True)
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _ensure_schema(self):
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10)
+            try:
+                # WAL lets searches read while ingestion writes
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._migrate_normalized(conn)
+                conn.executescript(_NORMALIZED_INDEXES)
+                conn.commit()
+            finally:
+                conn.close()
+            self._initialized = True
+
+    @staticmethod
+    def _migrate_normalized(conn: sqlite3.Connection):
+        """Add the normalized columns to an index created before they existed, and fill them."""
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        missing = [(name, kind) for name, kind in _NORMALIZED_COLUMNS if name not in existing]
+        if not missing:
+            return
+        for name, kind in missing:
+            conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {kind}")
+        conn.row_factory = sqlite3.Row
+        updates = []
+        for row in conn.execute("SELECT * FROM jobs"):
+            remote, normalized = _normalized_values(_row_to_posting(row))
+            updates.append((int(remote),) + normalized + (row["rowid"],))
+        conn.executemany(
+            "UPDATE jobs SET remote = ?, " + ", ".join(f"{name} = ?" for name, _ in _NORMALIZED_COLUMNS)
+            + " WHERE rowid = ?",
+            updates
+        )
+        print(f"Job index: normalized location/salary for {len(updates)} existing postings")
+
+    def upsert(self, jobs: Iterable[JobPosting]) -> int:
+        """Normalize and insert or refresh postings; returns the number of rows written."""
+        now = time.time()
+        rows = []
+        for job in jobs:
+            if not job.id:
+                continue
+            remote, normalized = _normalized_values(job)
+            rows.append((
+                job.id, job.title, job.company, job.location, job.description, job.url, job.source,
+                job.posted_date.isoformat() if isinstance(job.posted_date, datetime) else job.posted_date,
+                job.salary_range, job.job_type, int(remote),
+                json.dumps(job.skills or []), job.experience_level,
+                json.dumps(job.metadata or {}, default=str), now, now
+            ) + normalized)
+        if not rows:
+            return 0
+        with self._write_lock, self._conn() as conn:
+            conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def unseen(self, jobs: Iterable[JobPosting]) -> List[JobPosting]:
+        """Postings not in the index yet; call before upsert to find new arrivals."""
+        jobs = [job for job in jobs if job.id]
+        known = set()
+        with self._conn() as conn:
+            for start in range(0, len(jobs), 500):
+                chunk = [job.id for job in jobs[start:start + 500]]
+                known.update(
+                    row["id"] for row in
+                    conn.execute(f"SELECT id FROM jobs WHERE id IN ({','.join('?' * len(chunk))})", chunk)
+                )
+        return [job for job in jobs if job.id not in known]
+
+    def search(self, query: str, location: Optional[str] = None, remote: Optional[bool] = None,
+               sources: Optional[List[str]] = None, limit: int = 10, offset: int = 0,
+               max_age: Optional[float] = None, radius_km: Optional[float] = None,
+               salary_min: Optional[float] = None, salary_max: Optional[float] = None,
+               currency: str = "USD") -> Tuple[List[JobPosting], int]:
+        """Ranked full-text search. Returns (page of postings, total matches).
+
+        Locations filter on the normalized city/region/country columns (or a
+        geohash radius when radius_km is given and the place resolves to a
+        city); salary bounds are annual amounts in `currency`.
+        """
+        match = build_match_query(query)
+        if match is None:
+            return [], 0
+
+        where = ["jobs_fts MATCH ?"]
+        params: List[Any] = [match]
+        if location:
+            clause, values = _location_clause(location, radius_km)
+            where.append(clause)
+            params.extend(values)
+        if salary_min is not None or salary_max is not None:
+            where.append("jobs.salary_currency = ?")
+            params.append(currency.upper())
+            if salary_min is not None:
+                where.append("jobs.salary_max_annual >= ?")
+                params.append(salary_min)
+            if salary_max is not None:
+                where.append("jobs.salary_min_annual <= ?")
+                params.append(salary_max)
+        if remote is not None:
+            where.append("jobs.remote = ?")
+            params.append(int(remote))
+        if sources:
+            where.append(f"jobs.source IN ({', '.join('?' for _ in sources)})")
+            params.extend(sources)
+        if max_age is not None:
+            where.append("jobs.last_seen >= ?")
+            params.append(time.time() - max_age)
+
+        clause = " AND ".join(where)
+        weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+        with self._conn() as conn:
+            total = conn.execute(
+                f"SELECT COUNT(*) FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid WHERE {clause}",
+                params
+            ).fetchone()[0]
+            if total == 0 or offset >= total:
+                return [], total
+            rows = conn.execute(
+                f"SELECT jobs.* FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid WHERE {clause} "
+                f"ORDER BY bm25(jobs_fts, {weights}), jobs.last_seen DESC LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+        return [_row_to_posting(row) for row in rows], total
+
+    def touch(self, job_ids: Iterable[str]) -> int:
+        """Mark postings as still live without rewriting them (no FTS churn)."""
+        now = time.time()
+        rows = [(now, job_id) for job_id in job_ids]
+        if not rows:
+            return 0
+        with self._write_lock, self._conn() as conn:
+            conn.executemany("UPDATE jobs SET last_seen = ? WHERE id = ?", rows)
+        return len(rows)
+
+    def delete(self, job_ids: Iterable[str]) -> int:
+        """Remove postings that disappeared upstream."""
+        rows = [(job_id,) for job_id in job_ids]
+        if not rows:
+            return 0
+        with self._write_lock, self._conn() as conn:
+            conn.executemany("DELETE FROM jobs WHERE id = ?", rows)
+        return len(rows)
+
+    def get(self, job_id: str) -> Optional[JobPosting]:
+        with self._conn() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_posting(row) if row else None
+
+    def prune(self, max_age: float = JOB_INDEX_MAX_AGE) -> int:
+        """Drop postings no source has returned within max_age seconds."""
+        with self._write_lock, self._conn() as conn:
+            cursor = conn.execute("DELETE FROM jobs WHERE last_seen < ?", (time.time() - max_age,))
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._conn() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+            by_source = {
+                row["source"]: row["n"]
+                for row in conn.execute("SELECT source, COUNT(*) AS n FROM jobs GROUP BY source")
+            }
+            newest = conn.execute("SELECT MAX(last_seen) FROM jobs").fetchone()[0]
+            located, geocoded, with_salary = conn.execute(
+                "SELECT COUNT(country), COUNT(geohash), COUNT(salary_currency) FROM jobs"
+            ).fetchone()
+        return {
+            "path": str(self.path),
+            "postings": total,
+            "by_source": by_source,
+            "normalized": {"country": located, "geohash": geocoded, "salary": with_salary},
+            "last_ingested": datetime.utcfromtimestamp(newest).isoformat() + "Z" if newest else None
+        }
+
+# Shared index used by ingestion and the search endpoints
+job_index = JobIndex()
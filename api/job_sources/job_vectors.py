@@ -0,0 +1,311 @@
+"""
+Precomputed job vector index.
+Every posting in the local job index is embedded once (re-embedded only when
+its text changes) and the normalized vectors are kept in the same SQLite file
+and mirrored into an in-memory float32 matrix, so ranking tens of thousands of
+postings against a profile vector is a single matrix-vector product.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .base import JobPosting
+from .job_index import JOB_INDEX_PATH, _row_to_posting
+
+JOB_EMBEDDING_BACKEND = os.getenv("JOB_EMBEDDING_BACKEND", "auto").lower()    # auto | openai | hashing
+JOB_EMBEDDING_MODEL = os.getenv("JOB_EMBEDDING_MODEL", "text-embedding-3-small")
+JOB_EMBEDDING_DIM = int(os.getenv("JOB_EMBEDDING_DIM", "512"))               # 512 floats = 2 KB per posting
+JOB_EMBEDDING_BATCH = int(os.getenv("JOB_EMBEDDING_BATCH", "100"))           # texts per embeddings API call
+JOB_EMBEDDING_MAX_CHARS = int(os.getenv("JOB_EMBEDDING_MAX_CHARS", "4000"))  # description text embedded per posting
+JOB_VECTOR_BACKFILL_LIMIT = int(os.getenv("JOB_VECTOR_BACKFILL_LIMIT", "2000"))  # postings embedded per ingestion run
+EMBEDDING_COST_PER_TEXT = 0.00002
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_vectors (
+    id TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    embedded_at REAL NOT NULL
+);
+"""
+
+def posting_text(job: JobPosting) -> str:
+    """The text a posting is embedded from: title and skills first, then the description."""
+    parts = [job.title, job.company, job.location, ", ".join(job.skills or []), job.description or ""]
+    return "\n".join(part for part in parts if part)[:JOB_EMBEDDING_MAX_CHARS]
+
+def content_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+class JobEmbedder:
+    """Batched text embeddings; OpenAI when configured, otherwise local feature hashing."""
+
+    def __init__(self, backend: str = JOB_EMBEDDING_BACKEND, dim: int = JOB_EMBEDDING_DIM):
+        self.dim = dim
+        if backend == "auto":
+            backend = "openai" if self._openai_key() else "hashing"
+        self.backend = backend
+        self.model = f"{JOB_EMBEDDING_MODEL}@{dim}" if backend == "openai" else f"hashing@{dim}"
+        self.texts_embedded = 0
+
+    @staticmethod
+    def _openai_key() -> Optional[str]:
+        try:
+            from ..settings import get_settings
+            return get_settings().OPENAI_API_KEY or os.getenv("OPENAI_API_KEY")
+        except Exception:
+            return os.getenv("OPENAI_API_KEY")
+
+    def _embed_openai(self, texts: List[str]) -> np.ndarray:
+        import openai
+        from ..cost_controls import check_cost_limits, record_usage
+
+        cost = EMBEDDING_COST_PER_TEXT * len(texts)
+        cost_check = check_cost_limits("embedding", cost)
+        if not cost_check["allowed"]:
+            raise RuntimeError(f"Cost limit exceeded: {cost_check['reason']}")
+        client = openai.OpenAI(api_key=self._openai_key())
+        try:
+            response = client.embeddings.create(model=JOB_EMBEDDING_MODEL, input=texts, dimensions=self.dim)
+        except Exception:
+            record_usage("embedding", cost, False)
+            raise
+        record_usage("embedding", cost, True)
+        return np.array([item.embedding for item in response.data], dtype=np.float32)
+
+    def _embed_hashing(self, texts: List[str]) -> np.ndarray:
+        # Signed feature hashing over skill-aware tokens and token bigrams
+        from ..skill_extractor import tokenize
+
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = tokenize(text)
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            for feature in features:
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                vectors[row, value % self.dim] += 1.0 if value >> 63 else -1.0
+        return vectors
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Unit-normalized (len(texts), dim) float32 matrix."""
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        chunks = []
+        for start in range(0, len(texts), JOB_EMBEDDING_BATCH):
+            batch = texts[start:start + JOB_EMBEDDING_BATCH]
+            chunks.append(self._embed_openai(batch) if self.backend == "openai" else self._embed_hashing(batch))
+        vectors = np.vstack(chunks)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.texts_embedded += len(texts)
+        return vectors / norms
+
+class JobVectorIndex:
+    """Persisted job vectors plus an in-memory matrix for brute-force cosine top-k."""
+
+    def __init__(self, path: Path = JOB_INDEX_PATH, embedder: Optional[JobEmbedder] = None):
+        self.path = Path(path)
+        self.embedder = embedder or JobEmbedder()
+        self._lock = threading.RLock()
+        self._initialized = False
+        self._loaded = False
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix = np.zeros((0, self.embedder.dim), dtype=np.float32)
+        self.last_backfill: Dict[str, Any] = {}
+
+    @contextmanager
+    def _conn(self):
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.path, timeout=10)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_SCHEMA)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._initialized = True
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.row_factory = sqlite3.Row
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _load(self):
+        """Read every vector for the current model into the in-memory matrix."""
+        with self._conn() as conn:
+            rows = conn.execute("SELECT id, vector FROM job_vectors WHERE model = ?",
+                                (self.embedder.model,)).fetchall()
+        matrix = np.zeros((max(len(rows), 1024), self.embedder.dim), dtype=np.float32)
+        for i, row in enumerate(rows):
+            matrix[i] = np.frombuffer(row["vector"], dtype=np.float32)
+        self._ids = [row["id"] for row in rows]
+        self._rows = {job_id: i for i, job_id in enumerate(self._ids)}
+        self._matrix = matrix
+        self._loaded = True
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load()
+
+    def _put(self, job_id: str, vector: np.ndarray):
+        row = self._rows.get(job_id)
+        if row is None:
+            row = len(self._ids)
+            if row >= self._matrix.shape[0]:
+                grown = np.zeros((self._matrix.shape[0] * 2, self.embedder.dim), dtype=np.float32)
+                grown[:row] = self._matrix[:row]
+                self._matrix = grown
+            self._ids.append(job_id)
+            self._rows[job_id] = row
+        self._matrix[row] = vector
+
+    def _drop(self, job_id: str):
+        # Swap the last row into the hole so the matrix stays dense
+        row = self._rows.pop(job_id, None)
+        if row is None:
+            return
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+        self._ids.pop()
+
+    def index_jobs(self, jobs: Iterable[JobPosting]) -> int:
+        """Embed postings that are new or whose text changed; returns how many were embedded."""
+        texts = {job.id: posting_text(job) for job in jobs if job.id}
+        if not texts:
+            return 0
+        hashes = {job_id: content_hash(text) for job_id, text in texts.items()}
+        with self._conn() as conn:
+            stored = {}
+            ids = list(hashes)
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                stored.update(
+                    (row["id"], (row["model"], row["content_hash"]))
+                    for row in conn.execute(
+                        f"SELECT id, model, content_hash FROM job_vectors WHERE id IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    )
+                )
+        pending = [job_id for job_id, digest in hashes.items()
+                   if stored.get(job_id) != (self.embedder.model, digest)]
+        if not pending:
+            return 0
+
+        vectors = self.embedder.embed([texts[job_id] for job_id in pending])
+        now = time.time()
+        self._ensure_loaded()
+        with self._lock:
+            with self._conn() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO job_vectors (id, model, content_hash, vector, embedded_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(job_id, self.embedder.model, hashes[job_id], vectors[i].tobytes(), now)
+                     for i, job_id in enumerate(pending)]
+                )
+            for i, job_id in enumerate(pending):
+                self._put(job_id, vectors[i])
+        return len(pending)
+
+    def backfill(self, limit: int = JOB_VECTOR_BACKFILL_LIMIT) -> int:
+        """Embed indexed postings that have no vector for the current model yet."""
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT j.* FROM jobs j LEFT JOIN job_vectors v ON v.id = j.id "
+                "WHERE v.id IS NULL OR v.model != ? ORDER BY j.last_seen DESC LIMIT ?",
+                (self.embedder.model, limit)
+            ).fetchall()
+        embedded = self.index_jobs(_row_to_posting(row) for row in rows)
+        self.last_backfill = {"at": time.time(), "embedded": embedded}
+        return embedded
+
+    def delete(self, job_ids: Iterable[str]) -> int:
+        ids = list(job_ids)
+        if not ids:
+            return 0
+        with self._lock:
+            with self._conn() as conn:
+                conn.executemany("DELETE FROM job_vectors WHERE id = ?", [(job_id,) for job_id in ids])
+            if self._loaded:
+                for job_id in ids:
+                    self._drop(job_id)
+        return len(ids)
+
+    def prune(self) -> int:
+        """Drop vectors whose posting was pruned from the job index."""
+        with self._lock:
+            with self._conn() as conn:
+                removed = conn.execute("DELETE FROM job_vectors WHERE id NOT IN (SELECT id FROM jobs)").rowcount
+            if removed and self._loaded:
+                self._load()
+        return removed
+
+    def search(self, vector: np.ndarray, k: int = 50,
+               exclude: Optional[Iterable[str]] = None) -> List[Tuple[str, float]]:
+        """Top-k (job_id, cosine similarity) for a unit-normalized query vector."""
+        self._ensure_loaded()
+        excluded = set(exclude or [])
+        with self._lock:
+            count = len(self._ids)
+            if count == 0:
+                return []
+            scores = self._matrix[:count] @ vector.astype(np.float32)
+            ids = list(self._ids)
+        take = min(count, k + len(excluded))
+        top = np.argpartition(-scores, take - 1)[:take] if take < count else np.arange(count)
+        top = top[np.argsort(-scores[top])]
+        results = [(ids[i], float(scores[i])) for i in top if ids[i] not in excluded]
+        return results[:k]
+
+    def vectors(self, job_ids: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Stored vectors for these postings (ids without one are left out)."""
+        self._ensure_loaded()
+        with self._lock:
+            return {job_id: self._matrix[self._rows[job_id]].copy() for job_id in job_ids if job_id in self._rows}
+
+    def embed_query(self, text: str) -> np.ndarray:
+        return self.embedder.embed([text[:JOB_EMBEDDING_MAX_CHARS]])[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            loaded = len(self._ids) if self._loaded else None
+        return {
+            "backend": self.embedder.backend,
+            "model": self.embedder.model,
+            "dim": self.embedder.dim,
+            "vectors_in_memory": loaded,
+            "texts_embedded": self.embedder.texts_embedded,
+            "last_backfill": self.last_backfill
+        }
+
+# Shared vector index over the local job index
+job_vectors = JobVectorIndex()
+
+def index_job_vectors(jobs: Iterable[JobPosting]) -> int:
+    """Best-effort embedding of new or changed postings; failures never break ingestion."""
+    try:
+        return job_vectors.index_jobs(jobs)
+    except Exception as e:
+        print(f"Job vector indexing failed: {e}")
+        return 0
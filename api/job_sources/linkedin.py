@@ -2,20 +2,28 @@
 LinkedIn job source implementation via web scraping.
 """
 
-import requests
 from typing import List, Optional
 from datetime import datetime
-from bs4 import BeautifulSoup
-from .base import JobSource, JobPosting
+from .base import REQUEST_ERRORS, JobSource, JobPosting
+from .html_parse import CardSpec, aparse_cards
 
 class LinkedInSource(JobSource):
     """LinkedIn job board integration via web scraping."""
 
+    # Result cards on the search page (compiled once per process)
+    CARD_SPEC = CardSpec.build(
+        'div.base-card',
+        title='h3.base-search-card__title',
+        company='h4.base-search-card__subtitle',
+        location='span.job-search-card__location',
+        href=('a.base-card__full-link', 'href')
+    )
+
     def __init__(self, api_key: str = None):
         super().__init__("linkedin", api_key, rate_limit=100)
         self.base_url = "https://www.linkedin.com/jobs/search/"
 
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search LinkedIn jobs via web scraping."""
         if not self._check_rate_limit():
             return []
@@ -32,35 +40,30 @@ class LinkedInSource(JobSource):
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             }
 
-            response = requests.get(self.base_url, params=params, headers=headers, timeout=10)
+            response = await self._aget(self.base_url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            job_cards = soup.find_all('div', class_='base-card', limit=limit)
+            job_cards = await aparse_cards(response.content, self.CARD_SPEC, limit)
 
             jobs = []
             for card in job_cards:
                 try:
-                    title_elem = card.find('h3', class_='base-search-card__title')
-                    company_elem = card.find('h4', class_='base-search-card__subtitle')
-                    location_elem = card.find('span', class_='job-search-card__location')
-                    link_elem = card.find('a', class_='base-card__full-link')
-
-                    if not (title_elem and company_elem and link_elem):
+                    title = card['title']
+                    if not (title and card['company'] and card['href'] is not None):
                         continue
 
-                    job_url = link_elem.get('href', '')
-                    job_id = job_url.split('/')[-1].split('?')[0] if job_url else str(hash(title_elem.text))
+                    job_url = card['href']
+                    job_id = job_url.split('/')[-1].split('?')[0] if job_url else str(hash(title))
 
                     job = {
                         "id": f"linkedin_{job_id}",
-                        "title": title_elem.text.strip(),
-                        "company": company_elem.text.strip(),
-                        "location": location_elem.text.strip() if location_elem else "See description",
-                        "description": f"LinkedIn job: {title_elem.text.strip()}",
+                        "title": title,
+                        "company": card['company'],
+                        "location": card['location'] or "See description",
+                        "description": f"LinkedIn job: {title}",
                         "url": job_url,
                         "posted_date": datetime.now(),
-                        "remote": 'remote' in (location_elem.text.lower() if location_elem else ''),
+                        "remote": 'remote' in (card['location'] or '').lower(),
                         "skills": [],
                         "experience_level": "mid"
                     }
@@ -72,7 +75,7 @@ class LinkedInSource(JobSource):
 
             return jobs
 
-        except requests.RequestException as e:
+        except REQUEST_ERRORS as e:
             print(f"Error fetching LinkedIn jobs: {e}")
             return []
         except Exception as e:
@@ -0,0 +1,431 @@
+"""
+Location and salary normalization for job postings.
+Free-text locations are resolved against a small offline gazetteer
+(data/locations.json) into city/region/country, a remote flag and a geohash;
+salary strings become numeric min/max/currency/period plus annualized bounds.
+The job index stores these as columns so radius and salary-range filters are
+indexed lookups instead of LIKE scans over the raw text.
+"""
+
+import json
+import math
+import os
+import re
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .base import JobPosting
+
+LOCATIONS_PATH = Path(os.getenv(
+    "LOCATIONS_PATH",
+    Path(__file__).resolve().parents[2] / "data" / "locations.json"
+))
+GEOHASH_PRECISION = int(os.getenv("GEOHASH_PRECISION", "7"))   # ~150m cells for stored postings
+
+EARTH_RADIUS_KM = 6371.0088
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+# Cell (width at the equator, height) in km per geohash precision
+_GEOHASH_CELL_KM = {1: (5009.4, 4992.6), 2: (1252.3, 624.1), 3: (156.5, 156.0), 4: (39.1, 19.5),
+                    5: (4.89, 4.87), 6: (1.22, 0.61), 7: (0.153, 0.152)}
+
+# Hours, days, weeks and months in a working year
+_ANNUAL_FACTORS = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+_ANNUAL_BOUNDS = (5000, 5_000_000)        # annualized pay outside this is a parse error
+
+_REMOTE_RE = re.compile(r"\b(remote|anywhere|wfh|work from home|distributed|telecommute|worldwide)\b", re.I)
+_MODE_NOISE_RE = re.compile(r"\b(hybrid|on-?site|in[- ]office|office|flexible|metro(?:politan)?|greater|area|only|based)\b", re.I)
+_ALTERNATIVES_RE = re.compile(r"\s*(?:/|\||;|\bor\b|\band\b|&)\s*", re.I)
+_PARTS_RE = re.compile(r"\s*(?:,|\(|\)|\[|\]|\s-\s|\s–\s|:)\s*")
+_POSTCODE_RE = re.compile(r"\b\d{4,6}(?:-\d{4})?\b")
+
+_CURRENCY_MARKERS = [
+    (re.compile(r"(?:c\$|ca\$|\bcad\b)", re.I), "CAD"),
+    (re.compile(r"(?:a\$|au\$|\baud\b)", re.I), "AUD"),
+    (re.compile(r"(?:£|\bgbp\b)", re.I), "GBP"),
+    (re.compile(r"(?:€|\beur\b|\beuros?\b)", re.I), "EUR"),
+    (re.compile(r"(?:₹|\binr\b)", re.I), "INR"),
+    (re.compile(r"\bchf\b", re.I), "CHF"),
+    (re.compile(r"(?:\$|\busd\b|\bdollars?\b)", re.I), "USD"),
+]
+# Currency assumed when a salary has no marker but the posting's country is known
+_COUNTRY_CURRENCY = {
+    "US": "USD", "CA": "CAD", "GB": "GBP", "AU": "AUD", "IN": "INR", "CH": "CHF",
+    "DE": "EUR", "FR": "EUR", "NL": "EUR", "ES": "EUR", "PT": "EUR", "IT": "EUR", "IE": "EUR",
+    "AT": "EUR", "BE": "EUR", "FI": "EUR", "GR": "EUR", "EE": "EUR", "LT": "EUR",
+}
+_PERIOD_PATTERNS = [
+    (re.compile(r"(?:/\s*h(?:ou)?r\b|/\s*h\b|per\s+hour|an\s+hour|hourly|\bph\b)", re.I), "hour"),
+    (re.compile(r"(?:/\s*day\b|per\s+day|a\s+day|daily|day\s+rate)", re.I), "day"),
+    (re.compile(r"(?:/\s*w(?:ee)?k\b|per\s+week|a\s+week|weekly)", re.I), "week"),
+    (re.compile(r"(?:/\s*mo(?:nth)?\b|per\s+month|a\s+month|monthly)", re.I), "month"),
+    (re.compile(r"(?:/\s*y(?:ea)?r\b|per\s+(?:year|annum)|a\s+year|annual(?:ly)?|yearly|\bp\.?a\.?\b)", re.I), "year"),
+]
+_AMOUNT = r"(\d{1,3}(?:[,.\s]\d{3})+(?:[.,]\d{1,2}(?!\d))?|\d+(?:\.\d+)?)\s*([km])?\b"
+_RANGE_RE = re.compile(_AMOUNT + r"\s*(?:-|–|—|to)\s*(?:[^\d\s]{0,4}\s*)?" + _AMOUNT, re.I)
+_SINGLE_RE = re.compile(_AMOUNT, re.I)
+
+@dataclass(frozen=True)
+class LocationInfo:
+    """A resolved location; lat/lon/geohash are only set at city precision."""
+    city: Optional[str] = None
+    region: Optional[str] = None
+    country: Optional[str] = None
+    remote: bool = False
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    geohash: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(frozen=True)
+class SalaryInfo:
+    """Numeric salary range in its own currency and period, plus annualized bounds."""
+    min: Optional[float]
+    max: Optional[float]
+    currency: Optional[str]
+    period: str
+    annual_min: Optional[float]
+    annual_max: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+# --- geohash -----------------------------------------------------------------
+
+def geohash_encode(lat: float, lon: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        rng, coord = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_ALPHABET[value])
+            bits, value = 0, 0
+    return "".join(chars)
+
+def geohash_bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """(min_lat, max_lat, min_lon, max_lon) of a geohash cell."""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        value = _GEOHASH_ALPHABET.index(char)
+        for shift in range(4, -1, -1):
+            rng = lon_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if value >> shift & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    return lat_range[0], lat_range[1], lon_range[0], lon_range[1]
+
+def radius_cells(lat: float, lon: float, radius_km: float) -> List[str]:
+    """Geohash prefixes whose union covers the circle: the cell holding the point plus its 8 neighbours.
+
+    The precision is the finest one whose cells are at least radius_km across,
+    so the 3x3 block always contains the whole circle.
+    """
+    shrink = max(math.cos(math.radians(lat)), 0.01)
+    precision = 1
+    for p in range(GEOHASH_PRECISION, 0, -1):
+        width, height = _GEOHASH_CELL_KM[p]
+        if min(width * shrink, height) >= radius_km:
+            precision = p
+            break
+    center = geohash_encode(lat, lon, precision)
+    min_lat, max_lat, min_lon, max_lon = geohash_bounds(center)
+    dlat, dlon = max_lat - min_lat, max_lon - min_lon
+    mid_lat, mid_lon = (min_lat + max_lat) / 2, (min_lon + max_lon) / 2
+    cells = set()
+    for i in (-1, 0, 1):
+        for j in (-1, 0, 1):
+            cell_lat = mid_lat + i * dlat
+            if not -90.0 <= cell_lat <= 90.0:
+                continue
+            cell_lon = (mid_lon + j * dlon + 180.0) % 360.0 - 180.0
+            cells.add(geohash_encode(cell_lat, cell_lon, precision))
+    return sorted(cells)
+
+def haversine_km(lat1: Optional[float], lon1: Optional[float], lat2: float, lon2: float) -> Optional[float]:
+    if lat1 is None or lon1 is None:
+        return None
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+# --- gazetteer -----------------------------------------------------------------
+
+class Gazetteer:
+    """Name/alias lookups over data/locations.json."""
+
+    def __init__(self, path: Path = LOCATIONS_PATH):
+        self.path = Path(path)
+        self.cities: Dict[str, List[Dict[str, Any]]] = {}
+        self.regions: Dict[str, List[Dict[str, Any]]] = {}
+        self.region_codes: Dict[str, List[Dict[str, Any]]] = {}
+        self.countries: Dict[str, Dict[str, Any]] = {}
+        self.country_codes: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Location gazetteer unavailable ({self.path}): {e}")
+            data = {}
+        for country in data.get("countries", []):
+            self.country_codes[country["code"].lower()] = country
+            for name in [country["name"], *country.get("aliases", [])]:
+                self.countries[_key(name)] = country
+        for region in data.get("regions", []):
+            self.regions.setdefault(_key(region["name"]), []).append(region)
+            self.region_codes.setdefault(region["code"].lower(), []).append(region)
+        for city in data.get("cities", []):
+            for name in [city["name"], *city.get("aliases", [])]:
+                entries = self.cities.setdefault(_key(name), [])
+                if city not in entries:
+                    entries.append(city)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "cities": len({id(city) for entries in self.cities.values() for city in entries}),
+            "regions": sum(len(entries) for entries in self.region_codes.values()),
+            "countries": len(self.country_codes)
+        }
+
+_gazetteer: Optional[Gazetteer] = None
+
+def get_gazetteer() -> Gazetteer:
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = Gazetteer()
+    return _gazetteer
+
+def _key(text: str) -> str:
+    """Lookup key shared by gazetteer names and location parts ('St. Louis' -> 'st louis')."""
+    text = _POSTCODE_RE.sub(" ", _MODE_NOISE_RE.sub(" ", text.replace(".", " ")))
+    return " ".join(text.lower().split()).strip(" -")
+
+def _resolve(parts: List[str], gazetteer: Gazetteer) -> Tuple[Optional[Dict], Optional[Dict], Optional[str]]:
+    """Pick (city, region, country code) for one alternative's comma/dash separated parts."""
+    city_candidates: List[Dict[str, Any]] = []
+    region = None
+    country = None
+    for i, part in enumerate(parts):
+        if not part:
+            continue
+        if i == 0 and part in gazetteer.cities:
+            city_candidates = gazetteer.cities[part]
+            continue
+        if part in gazetteer.countries and part not in gazetteer.cities:
+            country = gazetteer.countries[part]["code"]
+            continue
+        if len(part) == 2:
+            # Two-letter codes: a region of the city we found wins over a country with the same code
+            if any((c.get("region") or "").lower() == part for c in city_candidates):
+                region = next(r for r in gazetteer.region_codes[part]
+                              if any(r["country"] == c["country"] for c in city_candidates))
+            elif part in gazetteer.country_codes and (
+                    i == 0 or not city_candidates or any(c["country"] == part.upper() for c in city_candidates)):
+                country = part.upper()
+            elif part in gazetteer.region_codes:
+                region = gazetteer.region_codes[part][0]
+            continue
+        if part in gazetteer.regions and (i > 0 or part not in gazetteer.cities):
+            region = gazetteer.regions[part][0]
+            continue
+        if not city_candidates and part in gazetteer.cities:
+            city_candidates = gazetteer.cities[part]
+
+    city = None
+    for candidate in city_candidates:
+        if region and (candidate.get("region") != region["code"] or candidate["country"] != region["country"]):
+            continue
+        if country and candidate["country"] != country:
+            continue
+        city = candidate
+        break
+    if city is None and region is None and country is None and city_candidates:
+        city = city_candidates[0]
+    if region is None and city is not None and city.get("region"):
+        region = next((r for r in gazetteer.region_codes.get(city["region"].lower(), [])
+                       if r["country"] == city["country"]), None)
+    country = country or (city or {}).get("country") or (region or {}).get("country")
+    return city, region, country
+
+@lru_cache(maxsize=8192)
+def parse_location(text: Optional[str]) -> LocationInfo:
+    """Resolve free-text like 'Austin, TX', 'Remote - US' or 'London (Hybrid)'.
+
+    Multi-location strings ('NYC / SF') resolve to the first place found.
+    """
+    if not text or not text.strip():
+        return LocationInfo()
+    remote = bool(_REMOTE_RE.search(text))
+    rest = _REMOTE_RE.sub(" ", text)
+    gazetteer = get_gazetteer()
+    for alternative in _ALTERNATIVES_RE.split(rest):
+        parts = [_key(part) for part in _PARTS_RE.split(alternative)]
+        parts = [part for part in parts if part]
+        if not parts:
+            continue
+        city, region, country = _resolve(parts, gazetteer)
+        if city or region or country:
+            lat = city["lat"] if city else None
+            lon = city["lon"] if city else None
+            return LocationInfo(
+                city=city["name"] if city else None,
+                region=region["code"] if region else (city or {}).get("region"),
+                country=country,
+                remote=remote,
+                lat=lat,
+                lon=lon,
+                geohash=geohash_encode(lat, lon) if city else None
+            )
+    return LocationInfo(remote=remote)
+
+# --- salary --------------------------------------------------------------------
+
+# Thousands grouped by ',', '.' or space, with optional cents: 45,000 / 45 000 / 1.234,56 / 1,234.56
+_GROUPED_RE = re.compile(r"(\d{1,3}(?:[,.\s]\d{3})+)(?:[.,](\d{1,2}))?")
+
+def _number(number: str) -> float:
+    grouped = _GROUPED_RE.fullmatch(number)
+    if grouped:
+        return float(re.sub(r"[,.\s]", "", grouped.group(1)) + "." + (grouped.group(2) or "0"))
+    return float(number)
+
+def _amount(number: str, suffix: Optional[str]) -> float:
+    value = _number(number)
+    if suffix:
+        value *= 1000 if suffix.lower() == "k" else 1_000_000
+    return value
+
+def _infer_period(value: float) -> str:
+    if value <= 300:
+        return "hour"
+    if value <= 1500:
+        return "day"
+    if value <= 15000:
+        return "month"
+    return "year"
+
+@lru_cache(maxsize=8192)
+def parse_salary(text: Optional[str], default_currency: Optional[str] = None,
+                 require_currency: bool = False) -> Optional[SalaryInfo]:
+    """Parse '$120k - $150k', '£45,000 per annum', '$60/hr', 'CAD 90-110K'.
+
+    require_currency=True is for free text (descriptions) where a bare number is
+    more likely a year or headcount than pay.
+    """
+    if not text:
+        return None
+    currency = next((code for pattern, code in _CURRENCY_MARKERS if pattern.search(text)), None)
+    if currency is None and require_currency:
+        return None
+    match = _RANGE_RE.search(text)
+    if match:
+        low_suffix, high_suffix = match.group(2), match.group(4)
+        # "120-150k" and "120k-150" share the suffix
+        low = _amount(match.group(1), low_suffix or (high_suffix if _number(match.group(1)) < 1000 else None))
+        high = _amount(match.group(3), high_suffix or (low_suffix if _number(match.group(3)) < 1000 else None))
+    else:
+        match = _SINGLE_RE.search(text)
+        if not match:
+            return None
+        low = high = _amount(match.group(1), match.group(2))
+    if low > high:
+        low, high = high, low
+    if high <= 0:
+        return None
+
+    period = next((name for pattern, name in _PERIOD_PATTERNS if pattern.search(text)), None) or _infer_period(high)
+    factor = _ANNUAL_FACTORS[period]
+    annual_min, annual_max = low * factor, high * factor
+    if not (_ANNUAL_BOUNDS[0] <= annual_min and annual_max <= _ANNUAL_BOUNDS[1]):
+        return None
+    return SalaryInfo(
+        min=low,
+        max=high,
+        currency=currency or default_currency,
+        period=period,
+        annual_min=annual_min,
+        annual_max=annual_max
+    )
+
+# --- postings --------------------------------------------------------------------
+
+def normalize_posting(job: JobPosting) -> Tuple[LocationInfo, Optional[SalaryInfo]]:
+    """Location and salary for a posting (salary from salary_range, else the description)."""
+    location = parse_location(job.location)
+    default_currency = _COUNTRY_CURRENCY.get(location.country or "")
+    try:
+        salary = parse_salary(job.salary_range, default_currency) if job.salary_range else None
+        if salary is None and job.description:
+            salary = parse_salary(_salary_snippet(job.description), default_currency, require_currency=True)
+    except (ValueError, OverflowError) as e:
+        # One unparseable salary must not fail a whole ingest batch or search
+        print(f"Error parsing salary for {job.id}: {e}")
+        salary = None
+    return location, salary
+
+_SNIPPET_RE = re.compile(r"(?:[$£€]|\b(?:usd|eur|gbp|cad|aud)\b)\s*\d[\d,.]*\s*[km]?\s*"
+                         r"(?:(?:-|–|—|to)\s*(?:[$£€]|\b(?:usd|eur|gbp|cad|aud)\b)?\s*\d[\d,.]*\s*[km]?)?"
+                         r"(?:\s*(?:/\s*\w+|per\s+\w+|an?\s+(?:hour|year)|annually|hourly))?", re.I)
+
+def _salary_snippet(description: str) -> Optional[str]:
+    """The first currency-marked amount in a description, so parse_salary never sees unrelated numbers."""
+    match = _SNIPPET_RE.search(description[:20000])
+    return match.group(0) if match else None
+
+def posting_filter(location: Optional[str] = None, radius_km: Optional[float] = None,
+                   salary_min: Optional[float] = None, salary_max: Optional[float] = None,
+                   currency: str = "USD") -> Optional[Callable[[JobPosting], bool]]:
+    """Predicate mirroring JobIndex.search's radius and salary filters, for live results."""
+    center = parse_location(location) if location and radius_km else None
+    if center is not None and center.lat is None:
+        center = None
+    if center is None and salary_min is None and salary_max is None:
+        return None
+
+    def keep(job: JobPosting) -> bool:
+        place, salary = normalize_posting(job)
+        if center is not None:
+            distance = haversine_km(place.lat, place.lon, center.lat, center.lon)
+            if distance is None or distance > radius_km:
+                return False
+        if salary_min is not None or salary_max is not None:
+            if salary is None or salary.currency != currency:
+                return False
+            if salary_min is not None and salary.annual_max < salary_min:
+                return False
+            if salary_max is not None and salary.annual_min > salary_max:
+                return False
+        return True
+    return keep
+
+def posting_facets(job: JobPosting) -> Dict[str, Any]:
+    """Normalized fields for API responses."""
+    location, salary = normalize_posting(job)
+    return {
+        "location": {key: value for key, value in location.to_dict().items() if key != "geohash"},
+        "salary": salary.to_dict() if salary else None
+    }
+
+def get_normalizer_health() -> Dict[str, Any]:
+    return {
+        "gazetteer": get_gazetteer().stats(),
+        "locations_cached": parse_location.cache_info()._asdict(),
+        "salaries_cached": parse_salary.cache_info()._asdict()
+    }
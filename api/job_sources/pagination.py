@@ -0,0 +1,144 @@
+"""
+Cursor pagination for federated job search.
+A cursor is an opaque token that records where each source (or the local
+index) stopped and which postings were already returned, so the next page
+resumes every source from its own offset instead of re-running page one.
+"""
+
+import base64
+import hashlib
+import json
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .base import JobPosting
+from .dedupe import (
+    canonical_company, cluster_jobs, collapse_cluster, normalize_location, normalize_title, unique_by_id
+)
+
+CURSOR_VERSION = 1
+MAX_SEEN_HASHES = 500        # dedupe state carried between pages (most recent kept)
+MAX_OFFSET = 10000
+LIVE_OVERFETCH = 1.5         # per-source page size = ceil(limit * LIVE_OVERFETCH / sources)
+
+class InvalidCursor(ValueError):
+    """The cursor is malformed or belongs to a different query."""
+
+def query_key(*parts: Optional[object]) -> str:
+    """Stable short hash of the search parameters a cursor is bound to."""
+    raw = json.dumps([str(part).strip().lower() if part is not None else None for part in parts])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+def posting_hash(job: JobPosting) -> str:
+    """Short hash identifying a posting across pages (fingerprint key, else id)."""
+    title, company = normalize_title(job.title), canonical_company(job.company)
+    basis = f"{title}|{company}|{normalize_location(job.location)}" if title and company else job.id
+    return hashlib.blake2b(basis.encode("utf-8"), digest_size=6).hexdigest()
+
+@dataclass
+class SearchCursor:
+    """Decoded cursor state."""
+    query_key: str
+    mode: str                                     # index | live
+    offset: int = 0                               # index mode
+    source_offsets: Dict[str, int] = field(default_factory=dict)  # live mode; absent = exhausted
+    seen: List[str] = field(default_factory=list)
+
+    def encode(self) -> str:
+        payload = {
+            "v": CURSOR_VERSION,
+            "q": self.query_key,
+            "m": self.mode,
+            "o": self.offset,
+            "s": self.source_offsets,
+            "d": self.seen[-MAX_SEEN_HASHES:]
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, expected_query_key: str) -> "SearchCursor":
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            payload = json.loads(raw)
+            cursor = cls(
+                query_key=str(payload["q"]),
+                mode=str(payload["m"]),
+                offset=int(payload.get("o", 0)),
+                source_offsets={str(name): int(offset) for name, offset in payload.get("s", {}).items()},
+                seen=[str(item) for item in payload.get("d", [])]
+            )
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise InvalidCursor(f"malformed cursor: {e}")
+        if payload.get("v") != CURSOR_VERSION or cursor.mode not in ("index", "live"):
+            raise InvalidCursor("unsupported cursor")
+        if cursor.query_key != expected_query_key:
+            raise InvalidCursor("cursor does not match this query")
+        offsets = [cursor.offset] + list(cursor.source_offsets.values())
+        if any(offset < 0 or offset > MAX_OFFSET for offset in offsets):
+            raise InvalidCursor("cursor offset out of range")
+        return cursor
+
+def per_source_limit(limit: int, source_count: int) -> int:
+    """Page size to request from each source so the merged page fills without over-fetching."""
+    return max(2, math.ceil(limit * LIVE_OVERFETCH / max(1, source_count)))
+
+def paginate_live(jobs_by_source: Dict[str, List[JobPosting]], order: List[str], limit: int,
+                  source_offsets: Dict[str, int], requested: Dict[str, int],
+                  completed: List[str], seen: List[str],
+                  keep: Optional[Callable[[JobPosting], bool]] = None
+                  ) -> Tuple[List[JobPosting], Dict[str, int], List[str]]:
+    """Merge one round of per-source pages into a result page.
+
+    Walks postings in source order, skipping anything already returned on an
+    earlier page (by posting hash) or in this page (by near-duplicate
+    cluster) or rejected by `keep`, until `limit` postings are taken. Each
+    source's offset only advances past postings that were actually consumed,
+    so nothing is lost when the page fills. Sources that returned a short page
+    are exhausted and drop out of the next cursor; sources that did not
+    complete (timeout, skipped) keep their offset and are retried.
+
+    Returns (page, next source offsets, updated seen hashes).
+    """
+    names = [name for name in order if name in jobs_by_source]
+    names += [name for name in jobs_by_source if name not in names]
+    walk = [(name, job) for name in names for job in jobs_by_source[name]]
+
+    unique = unique_by_id(job for _, job in walk)
+    position = {job.id: i for i, job in enumerate(unique)}
+    clusters = cluster_jobs(unique)
+    cluster_of = {i: c for c, members in enumerate(clusters) for i in members}
+
+    seen_set = set(seen)
+    seen = list(seen)
+    taken_clusters = set()
+    consumed = {name: 0 for name in names}
+    page: List[JobPosting] = []
+
+    for name, job in walk:
+        cluster = cluster_of[position[job.id]]
+        if cluster in taken_clusters or posting_hash(job) in seen_set or (keep and not keep(job)):
+            consumed[name] += 1
+            continue
+        if len(page) >= limit:
+            break
+        members = clusters[cluster]
+        page.append(collapse_cluster(unique, members))
+        taken_clusters.add(cluster)
+        for i in members:
+            digest = posting_hash(unique[i])
+            if digest not in seen_set:
+                seen_set.add(digest)
+                seen.append(digest)
+        consumed[name] += 1
+
+    next_offsets = {}
+    for name, offset in source_offsets.items():
+        if name not in completed:
+            next_offsets[name] = offset
+            continue
+        returned = len(jobs_by_source.get(name, []))
+        if consumed.get(name, 0) < returned or returned >= requested.get(name, 0):
+            next_offsets[name] = offset + consumed.get(name, 0)
+    return page, next_offsets, seen[-MAX_SEEN_HASHES:]
@@ -0,0 +1,226 @@
+"""
+Process-wide per-source rate limiting.
+Every upstream request made through JobSource._get or _aget takes a token from its
+source's bucket (refilled at the source's rate_limit per minute, with a short
+burst allowance). Requests carry a priority class: interactive searches may
+drain a bucket, while queued crawls only take tokens above a reserve and
+never while a user request is waiting, so background ingestion runs at full
+speed without starving searches or exceeding what an upstream board allows.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+# Priority classes, most urgent first
+INTERACTIVE = 0     # user-facing searches
+HOT = 1             # crawls queued because users are searching for something
+BACKGROUND = 2      # scheduled seed crawls
+PRIORITY_NAMES = {INTERACTIVE: "interactive", HOT: "hot", BACKGROUND: "background"}
+
+JOB_SOURCE_BURST_SECONDS = float(os.getenv("JOB_SOURCE_BURST_SECONDS", "10"))       # burst = this many seconds of rate
+JOB_SOURCE_INTERACTIVE_WAIT = float(os.getenv("JOB_SOURCE_INTERACTIVE_WAIT", "2"))  # max seconds a search waits for a token
+# Share of a bucket each class must leave untouched for more urgent ones
+RESERVES = {
+    INTERACTIVE: 0.0,
+    HOT: float(os.getenv("JOB_SOURCE_HOT_RESERVE", "0.25")),
+    BACKGROUND: float(os.getenv("JOB_SOURCE_BACKGROUND_RESERVE", "0.5")),
+}
+
+def _parse_overrides(raw: str) -> Dict[str, float]:
+    overrides = {}
+    for item in raw.split(","):
+        name, _, value = item.partition("=")
+        try:
+            if name.strip() and value.strip():
+                overrides[name.strip()] = float(value)
+        except ValueError:
+            print(f"Ignoring bad JOB_SOURCE_RATE_LIMITS entry: {item!r}")
+    return overrides
+
+# Per-source requests/minute overrides, e.g. "reddit=30,remoteok=20"
+RATE_OVERRIDES = _parse_overrides(os.getenv("JOB_SOURCE_RATE_LIMITS", ""))
+
+request_priority: ContextVar[int] = ContextVar("job_source_request_priority", default=INTERACTIVE)
+
+@contextmanager
+def crawl_priority(priority: int):
+    """Run upstream requests made inside the block at the given priority class."""
+    token = request_priority.set(priority)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+class RateLimited(requests.RequestException):
+    """No token became available within the caller's wait budget."""
+
+class TokenBucket:
+    """Token bucket with per-priority reserves; waiting interactive callers block lower classes."""
+
+    def __init__(self, name: str, rate_per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.clock = clock
+        self._cond = threading.Condition()
+        self.interactive_waiting = 0
+        self.granted = {priority: 0 for priority in PRIORITY_NAMES}
+        self.denied = 0
+        self.configure(rate_per_minute)
+        self.tokens = self.capacity
+        self.updated = clock()
+
+    def configure(self, rate_per_minute: float):
+        self.rate_per_minute = max(float(rate_per_minute), 1e-6)
+        self.rate = self.rate_per_minute / 60.0
+        self.capacity = max(1.0, self.rate * JOB_SOURCE_BURST_SECONDS)
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _floor(self, priority: int) -> float:
+        """Tokens that must remain after a grant at this priority."""
+        return self.capacity * RESERVES.get(priority, 0.0)
+
+    def _admissible(self, priority: int) -> bool:
+        if priority != INTERACTIVE and self.interactive_waiting:
+            return False
+        return self.tokens - 1.0 >= self._floor(priority) - 1e-9
+
+    def wait_time(self, priority: int) -> float:
+        """Seconds until a token could be granted at this priority (ignoring other waiters)."""
+        with self._cond:
+            self._refill()
+            missing = self._floor(priority) + 1.0 - self.tokens
+            return max(0.0, missing / self.rate)
+
+    def try_acquire(self, priority: int = INTERACTIVE) -> bool:
+        with self._cond:
+            return self._take(priority)
+
+    def _take(self, priority: int) -> bool:
+        """Grant a token if admissible (caller holds the condition)."""
+        self._refill()
+        if not self._admissible(priority):
+            return False
+        self.tokens -= 1.0
+        self.granted[priority] += 1
+        return True
+
+    def _retry_after(self, priority: int) -> float:
+        return max((self._floor(priority) + 1.0 - self.tokens) / self.rate, 0.005)
+
+    def acquire(self, priority: int = INTERACTIVE, timeout: Optional[float] = None) -> bool:
+        """Block until a token is granted or timeout passes (None waits indefinitely)."""
+        deadline = None if timeout is None else self.clock() + timeout
+        with self._cond:
+            if priority == INTERACTIVE:
+                self.interactive_waiting += 1
+            try:
+                while True:
+                    if self._take(priority):
+                        return True
+                    wait = self._retry_after(priority)
+                    if deadline is not None:
+                        remaining = deadline - self.clock()
+                        if remaining <= 0:
+                            self.denied += 1
+                            return False
+                        wait = min(wait, remaining)
+                    self._cond.wait(min(wait, 1.0))
+            finally:
+                if priority == INTERACTIVE:
+                    self.interactive_waiting -= 1
+                    self._cond.notify_all()
+
+    async def aacquire(self, priority: int = INTERACTIVE, timeout: Optional[float] = None) -> bool:
+        """acquire() for coroutines: waits with asyncio.sleep instead of holding a thread."""
+        deadline = None if timeout is None else self.clock() + timeout
+        with self._cond:
+            if priority == INTERACTIVE:
+                self.interactive_waiting += 1
+        try:
+            while True:
+                with self._cond:
+                    if self._take(priority):
+                        return True
+                    wait = self._retry_after(priority)
+                    if deadline is not None:
+                        remaining = deadline - self.clock()
+                        if remaining <= 0:
+                            self.denied += 1
+                            return False
+                        wait = min(wait, remaining)
+                await asyncio.sleep(min(wait, 1.0))
+        finally:
+            if priority == INTERACTIVE:
+                with self._cond:
+                    self.interactive_waiting -= 1
+                    self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            self._refill()
+            return {
+                "rate_per_minute": self.rate_per_minute,
+                "capacity": round(self.capacity, 2),
+                "tokens": round(self.tokens, 2),
+                "interactive_waiting": self.interactive_waiting,
+                "granted": {PRIORITY_NAMES[p]: n for p, n in self.granted.items()},
+                "denied": self.denied
+            }
+
+class RateLimiter:
+    """One bucket per source name, shared by every instance of that source."""
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, name: str, rate_per_minute: float) -> TokenBucket:
+        rate = RATE_OVERRIDES.get(name, rate_per_minute)
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(name)
+                if bucket is None:
+                    bucket = self._buckets[name] = TokenBucket(name, rate)
+        elif bucket.rate_per_minute != rate:
+            with bucket._cond:
+                bucket.configure(rate)
+        return bucket
+
+    def acquire(self, name: str, rate_per_minute: float, priority: Optional[int] = None):
+        """Take a token for one upstream request; raises RateLimited when an interactive wait runs out."""
+        priority = request_priority.get() if priority is None else priority
+        timeout = JOB_SOURCE_INTERACTIVE_WAIT if priority == INTERACTIVE else None
+        if not self.bucket(name, rate_per_minute).acquire(priority, timeout):
+            raise RateLimited(f"{name} rate limit: no token within {timeout}s")
+
+    async def aacquire(self, name: str, rate_per_minute: float, priority: Optional[int] = None):
+        """acquire() for coroutines."""
+        priority = request_priority.get() if priority is None else priority
+        timeout = JOB_SOURCE_INTERACTIVE_WAIT if priority == INTERACTIVE else None
+        if not await self.bucket(name, rate_per_minute).aacquire(priority, timeout):
+            raise RateLimited(f"{name} rate limit: no token within {timeout}s")
+
+    def has_capacity(self, name: str, rate_per_minute: float, priority: Optional[int] = None) -> bool:
+        """Whether a request at this priority would get a token within its wait budget (consumes nothing)."""
+        priority = request_priority.get() if priority is None else priority
+        budget = JOB_SOURCE_INTERACTIVE_WAIT if priority == INTERACTIVE else 0.0
+        return self.bucket(name, rate_per_minute).wait_time(priority) <= budget
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {name: bucket.stats() for name, bucket in sorted(buckets.items())}
+
+# Shared limiter used by JobSource._get/_aget and the crawl scheduler
+rate_limiter = RateLimiter()
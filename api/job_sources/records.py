@@ -0,0 +1,55 @@
+"""
+Job record store backing /jobs/{job_id}.
+Every posting seen by a search or by ingestion is remembered under its job.id
+with its full description, so detail views are a dictionary lookup instead of
+a walk over sources that mostly cannot fetch a single job.
+"""
+
+import os
+from typing import Any, Dict, Iterable, Optional
+
+from .base import JobPosting, TTLCache
+from .job_index import job_index
+
+JOB_RECORD_TTL = int(os.getenv("JOB_RECORD_TTL", str(24 * 3600)))     # seconds a record stays in memory
+JOB_RECORD_MAX = int(os.getenv("JOB_RECORD_MAX", "5000"))             # full descriptions, so bounded tightly
+
+class JobRecordStore:
+    """In-memory TTL/LRU store of postings, falling back to the local job index."""
+
+    def __init__(self, ttl: int = JOB_RECORD_TTL, max_entries: int = JOB_RECORD_MAX):
+        self._cache = TTLCache(max_entries=max_entries, default_ttl=ttl)
+
+    def remember(self, jobs: Iterable[JobPosting]) -> int:
+        count = 0
+        for job in jobs:
+            if job.id:
+                self._cache.set(job.id, job)
+                count += 1
+        return count
+
+    def get(self, job_id: str) -> Optional[JobPosting]:
+        job = self._cache.get(job_id)
+        if job is not None:
+            return job
+        # Evicted or from before a restart: the index keeps every ingested posting
+        try:
+            job = job_index.get(job_id)
+        except Exception as e:
+            print(f"Job index lookup failed for {job_id}: {e}")
+            return None
+        if job is not None:
+            self._cache.set(job_id, job)
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+# Global job record store
+job_records = JobRecordStore()
+
+def remember_jobs(jobs: Iterable[JobPosting]) -> int:
+    return job_records.remember(jobs)
+
+def get_job_record(job_id: str) -> Optional[JobPosting]:
+    return job_records.get(job_id)
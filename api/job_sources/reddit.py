@@ -2,19 +2,21 @@
 Reddit job source implementation for r/forhire and r/remotejs.
 """
 
-import requests
 from typing import List, Optional
 from datetime import datetime
-from .base import JobSource, JobPosting
+from .base import REQUEST_ERRORS, JobSource, JobPosting
 
 class RedditSource(JobSource):
     """Reddit job posting integration via JSON API."""
 
+    # Short TTL: later result pages reuse the listing instead of refetching it
+    feed_ttl = 60
+
     def __init__(self, api_key: str = None):
         super().__init__("reddit", api_key, rate_limit=60)
         self.subreddits = ["forhire", "remotejs", "jobs", "jobsearch"]
 
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search Reddit job postings via JSON API."""
         if not self._check_rate_limit():
             return []
@@ -28,12 +30,8 @@ class RedditSource(JobSource):
                     break
 
                 try:
-                    url = f"https://www.reddit.com/r/{subreddit}/new.json"
-                    headers = {'User-Agent': 'Mosaic Career Platform (contact@whatismydelta.com)'}
-                    response = requests.get(url, headers=headers, params={'limit': 25}, timeout=10)
-                    response.raise_for_status()
-
-                    data = response.json()
+                    url = f"https://www.reddit.com/r/{subreddit}/new.json?limit=25"
+                    data = await self._afetch_feed(url, lambda response: response.json(), timeout=10)
                     posts = data.get('data', {}).get('children', [])
 
                     for post in posts:
@@ -63,7 +61,7 @@ class RedditSource(JobSource):
                             "title": title.replace('[HIRING]', '').replace('[Hiring]', '').strip(),
                             "company": company,
                             "location": "Remote" if 'remote' in title.lower() else "See description",
-                            "description": selftext[:500] if selftext else title,
+                            "description": selftext if selftext else title,
                             "url": f"https://reddit.com{post_data.get('permalink', '')}",
                             "posted_date": datetime.fromtimestamp(post_data.get('created_utc', 0)),
                             "remote": 'remote' in title.lower() or 'remote' in selftext.lower(),
@@ -73,7 +71,7 @@ class RedditSource(JobSource):
 
                         all_jobs.append(self._normalize_job_data(job))
 
-                except requests.RequestException:
+                except REQUEST_ERRORS:
                     continue
 
             return all_jobs
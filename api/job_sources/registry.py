@@ -0,0 +1,74 @@
+"""
+Long-lived job source instances.
+Sources are created once at app startup so rate-limit counters and pooled
+connections survive across requests.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from .base import JobSource
+from .greenhouse import GreenhouseSource
+from .serpapi import SerpApiSource
+from .reddit import RedditSource
+from .indeed import IndeedSource
+from .linkedin import LinkedInSource
+from .glassdoor import GlassdoorSource
+from .remoteok import RemoteOKSource
+from .weworkremotely import WeWorkRemotelySource
+from .dice import DiceSource
+from .monster import MonsterSource
+from .ziprecruiter import ZipRecruiterSource
+from .careerbuilder import CareerBuilderSource
+from .hackernews import HackerNewsSource
+
+# Production-ready sources (no API key required)
+PRODUCTION_SOURCES = {
+    "greenhouse": GreenhouseSource,
+    "serpapi": SerpApiSource,
+    "reddit": RedditSource,
+    "remoteok": RemoteOKSource,
+    "weworkremotely": WeWorkRemotelySource,
+    "hackernews": HackerNewsSource
+}
+
+# Scraping/RSS sources gated behind JOB_SOURCES_STUBBED_ENABLED
+STUBBED_SOURCES = {
+    "indeed": IndeedSource,
+    "linkedin": LinkedInSource,
+    "glassdoor": GlassdoorSource,
+    "dice": DiceSource,
+    "monster": MonsterSource,
+    "ziprecruiter": ZipRecruiterSource,
+    "careerbuilder": CareerBuilderSource
+}
+
+_instances: Dict[str, JobSource] = {}
+_lock = threading.Lock()
+
+def init_sources() -> Dict[str, JobSource]:
+    """Create every source singleton (idempotent)."""
+    with _lock:
+        for name, source_class in {**PRODUCTION_SOURCES, **STUBBED_SOURCES}.items():
+            if name not in _instances:
+                _instances[name] = source_class()
+    return dict(_instances)
+
+def get_source(name: str) -> Optional[JobSource]:
+    """Return the singleton for a source name, creating sources on first use."""
+    if not _instances:
+        init_sources()
+    return _instances.get(name)
+
+def get_sources(names: List[str]) -> Dict[str, JobSource]:
+    """Singletons for the given names, in order, skipping unknown names."""
+    if not _instances:
+        init_sources()
+    return {name: _instances[name] for name in names if name in _instances}
+
+def get_enabled_sources(include_stubbed: bool = False) -> Dict[str, JobSource]:
+    """Production sources, plus scraping/RSS sources when enabled."""
+    names = list(PRODUCTION_SOURCES)
+    if include_stubbed:
+        names += list(STUBBED_SOURCES)
+    return get_sources(names)
@@ -2,28 +2,26 @@
 RemoteOK job source implementation.
 """
 import json
-import requests
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
-from .base import JobSource, JobPosting
+from .base import REQUEST_ERRORS, JobSource, JobPosting
 
 class RemoteOKSource(JobSource):
     """RemoteOK job board integration."""
     
+    # The whole board is one JSON document; queries filter the cached copy
+    feed_ttl = 300
+    
     def __init__(self, api_key: str = None, rate_limit: int = 60):
         super().__init__("remoteok", api_key, rate_limit)
         self.base_url = "https://remoteok.io/api"
     
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search RemoteOK jobs via public API."""
         try:
-            headers = {'User-Agent': 'Mosaic Career Platform (contact@whatismydelta.com)'}
-            response = requests.get(self.base_url, headers=headers, timeout=10)
-            response.raise_for_status()
-
             # RemoteOK returns JSON array, first item is metadata
-            data = response.json()
+            data = await self._afetch_feed(self.base_url, lambda response: response.json(), timeout=10)
             if not data or len(data) <= 1:
                 return []
 
@@ -56,7 +54,7 @@ class RemoteOKSource(JobSource):
                     title=job_data.get('position', 'Remote Position'),
                     company=job_data.get('company', 'Company'),
                     location='Remote',
-                    description=job_data.get('description', '')[:500],
+                    description=job_data.get('description', ''),
                     url=job_data.get('url', f"https://remoteok.io/remote-jobs/{job_data.get('id', '')}"),
                     source='remoteok',
                     remote=True,
@@ -68,7 +66,7 @@ class RemoteOKSource(JobSource):
 
             return jobs
 
-        except requests.RequestException as e:
+        except REQUEST_ERRORS as e:
             print(f"Error fetching RemoteOK jobs: {e}")
             return []
         except Exception as e:
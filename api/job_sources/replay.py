@@ -0,0 +1,267 @@
+"""
+Record/replay for the shared job-source HTTP client.
+In record mode each upstream response is saved as a JSON fixture under
+tests/fixtures/job_sources/<source>/; in replay mode the session and the
+async clients answer from those fixtures only, so adapter parsing can be regression-tested and
+benchmarked offline. Secrets in query strings are never written or keyed on.
+
+Record a case (live network), or accept replay output after a parser change:
+    python -m api.job_sources.replay record remoteok "python" --limit 10
+    python -m api.job_sources.replay approve remoteok
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .http import request_source
+
+FIXTURES_DIR = Path(os.getenv(
+    "JOB_SOURCES_FIXTURES_DIR",
+    Path(__file__).resolve().parents[2] / "tests" / "fixtures" / "job_sources"
+))
+CASES_FILE = "cases.json"
+
+# Query parameters that carry credentials: dropped from fixture keys and files
+SECRET_PARAMS = {"api_key", "apikey", "key", "token", "access_token", "app_key", "app_id", "secret", "signature"}
+# Response headers worth keeping (validators drive the feed cache's 304 path)
+KEPT_HEADERS = {"content-type", "etag", "last-modified"}
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+class FixtureMissing(requests.ConnectionError):
+    """Replay mode found no recorded response for a request."""
+
+def canonical_url(url: str) -> str:
+    """URL with sorted query parameters and secrets removed."""
+    parts = urlsplit(url)
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if key.lower() not in SECRET_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+def fixture_path(source: str, method: str, url: str, root: Path = FIXTURES_DIR) -> Path:
+    """Readable, stable file name: path slug plus a hash of method and canonical URL."""
+    canonical = canonical_url(url)
+    digest = hashlib.sha1(f"{method.upper()} {canonical}".encode("utf-8")).hexdigest()[:10]
+    slug = _SLUG_RE.sub("-", urlsplit(canonical).path.lower()).strip("-")[-40:] or "root"
+    return Path(root) / source / f"{slug}-{digest}.json"
+
+def _encode_body(content: bytes) -> Dict[str, str]:
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(content).decode("ascii")}
+
+def _decode_body(fixture: Dict[str, Any]) -> bytes:
+    if "body_b64" in fixture:
+        return base64.b64decode(fixture["body_b64"])
+    return fixture.get("body", "").encode("utf-8")
+
+@lru_cache(maxsize=1024)
+def _load_fixture(path: str) -> Dict[str, Any]:
+    # Replays re-read the same files constantly (benchmarks); fixtures are immutable while replaying
+    with open(path, "r") as f:
+        return json.load(f)
+
+def _write_fixture(method: str, url: str, status: int, reason: str, headers, content: bytes, root: Path):
+    path = fixture_path(request_source.get(), method, url, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fixture = {
+        "request": {"method": method, "url": canonical_url(url)},
+        "status": status,
+        "reason": reason,
+        "headers": {k: v for k, v in headers.items() if k.lower() in KEPT_HEADERS},
+        # Bodies are stored decompressed, so Content-Encoding is intentionally not kept
+        **_encode_body(content)
+    }
+    with open(path, "w") as f:
+        json.dump(fixture, f, indent=1)
+    _load_fixture.cache_clear()
+
+def _find_fixture(method: str, url: str, root: Path, request=None) -> Dict[str, Any]:
+    source = request_source.get()
+    path = fixture_path(source, method, url, root)
+    if not path.exists():
+        raise FixtureMissing(f"No fixture for {source} {method} {canonical_url(url)}", request=request)
+    return _load_fixture(str(path))
+
+class RecordingAdapter(HTTPAdapter):
+    """Sends requests for real and writes each response to the fixture tree."""
+
+    root = FIXTURES_DIR
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        _write_fixture(request.method, request.url, response.status_code, response.reason,
+                       response.headers, response.content, self.root)
+        return response
+
+class ReplayAdapter(HTTPAdapter):
+    """Answers every request from the fixture tree; a miss raises FixtureMissing."""
+
+    root = FIXTURES_DIR
+
+    def send(self, request, **kwargs):
+        fixture = _find_fixture(request.method, request.url, self.root, request)
+
+        response = requests.Response()
+        response.status_code = fixture.get("status", 200)
+        response.reason = fixture.get("reason", "OK")
+        response.headers = CaseInsensitiveDict(fixture.get("headers", {}))
+        response._content = _decode_body(fixture)
+        response._content_consumed = True
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+class RecordingTransport(httpx.AsyncHTTPTransport):
+    """Async counterpart of RecordingAdapter for the httpx clients."""
+
+    root = FIXTURES_DIR
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await super().handle_async_request(request)
+        content = await response.aread()
+        _write_fixture(request.method, str(request.url), response.status_code, response.reason_phrase,
+                       response.headers, content, self.root)
+        # aread() drained the stream; hand back a response with the decoded body
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() not in ("content-encoding", "content-length")]
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ReplayAdapter: fixtures only, a miss raises FixtureMissing."""
+
+    root = FIXTURES_DIR
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        fixture = _find_fixture(request.method, str(request.url), self.root)
+        return httpx.Response(fixture.get("status", 200), headers=fixture.get("headers", {}),
+                              content=_decode_body(fixture), request=request,
+                              extensions={"reason_phrase": fixture.get("reason", "OK").encode("ascii", "replace")})
+
+def load_cases(source: str, root: Path = FIXTURES_DIR) -> List[Dict[str, Any]]:
+    path = Path(root) / source / CASES_FILE
+    if not path.exists():
+        return []
+    with open(path, "r") as f:
+        return json.load(f).get("cases", [])
+
+def fixture_sources(root: Path = FIXTURES_DIR) -> List[str]:
+    """Sources that have at least one recorded case."""
+    if not Path(root).exists():
+        return []
+    return sorted(path.parent.name for path in Path(root).glob(f"*/{CASES_FILE}"))
+
+def create_source(name: str):
+    """A fresh, unthrottled source instance (its own caches) for replay runs."""
+    from .registry import PRODUCTION_SOURCES, STUBBED_SOURCES
+
+    source = {**PRODUCTION_SOURCES, **STUBBED_SOURCES}[name]()
+    source.rate_limit = 10 ** 9
+    return source
+
+def reset_source_caches(source) -> None:
+    """Drop the feed cache and the source's own caches so the next run parses again."""
+    from .base import TTLCache, feed_cache
+
+    feed_cache.clear()
+    for value in vars(source).values():
+        if isinstance(value, TTLCache):
+            value.clear()
+
+def run_case(source, case: Dict[str, Any]) -> list:
+    """Run a source's parse path for one case; self-indexed sources use their live path."""
+    search = getattr(source, "search_live", source.search_jobs)
+    return search(case["query"], case.get("location"), case.get("limit", 10))
+
+def record_case(name: str, query: str, location: Optional[str] = None, limit: int = 10,
+                root: Path = FIXTURES_DIR) -> Dict[str, Any]:
+    """Run one live search in record mode and append it to the source's cases.json."""
+    from .http import get_http_mode, set_http_mode
+
+    previous = get_http_mode()
+    RecordingAdapter.root = RecordingTransport.root = Path(root)
+    set_http_mode("record")
+    try:
+        source = create_source(name)
+        reset_source_caches(source)
+        jobs = run_case(source, {"query": query, "location": location, "limit": limit})
+    finally:
+        set_http_mode(previous)
+
+    case = {
+        "query": query,
+        "location": location,
+        "limit": limit,
+        "expected": {"count": len(jobs), "ids": [job.id for job in jobs]}
+    }
+    cases = [c for c in load_cases(name, root) if (c["query"], c.get("location"), c.get("limit")) != (query, location, limit)]
+    path = Path(root) / name / CASES_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"cases": cases + [case]}, f, indent=1)
+    return case
+
+def replay_cases(name: str, root: Path = FIXTURES_DIR) -> List[Dict[str, Any]]:
+    """Replay every recorded case for a source; returns [{case, jobs}]."""
+    from .http import get_http_mode, set_http_mode
+
+    previous = get_http_mode()
+    ReplayAdapter.root = ReplayTransport.root = Path(root)
+    set_http_mode("replay")
+    try:
+        source = create_source(name)
+        results = []
+        for case in load_cases(name, root):
+            reset_source_caches(source)
+            results.append({"case": case, "jobs": run_case(source, case)})
+        return results
+    finally:
+        set_http_mode(previous)
+
+def approve_cases(name: str, root: Path = FIXTURES_DIR) -> int:
+    """Accept the current replay output as the expected result (after an intended parser change)."""
+    cases = []
+    for result in replay_cases(name, root):
+        jobs = result["jobs"]
+        cases.append({**result["case"], "expected": {"count": len(jobs), "ids": [job.id for job in jobs]}})
+    with open(Path(root) / name / CASES_FILE, "w") as f:
+        json.dump({"cases": cases}, f, indent=1)
+    return len(cases)
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Record job source fixtures")
+    sub = parser.add_subparsers(dest="command", required=True)
+    record = sub.add_parser("record", help="run a live search and save its responses")
+    record.add_argument("source")
+    record.add_argument("query")
+    record.add_argument("--location")
+    record.add_argument("--limit", type=int, default=10)
+    approve = sub.add_parser("approve", help="accept current replay output as expected")
+    approve.add_argument("sources", nargs="*")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        case = record_case(args.source, args.query, args.location, args.limit)
+        print(f"Recorded {args.source}: {case['expected']['count']} postings for {args.query!r}")
+        return
+    for name in args.sources or fixture_sources():
+        print(f"Approved {approve_cases(name)} case(s) for {name}")
+
+if __name__ == "__main__":
+    main()
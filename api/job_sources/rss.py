@@ -0,0 +1,66 @@
+"""
+Streaming RSS item reader.
+Feeds are parsed incrementally with iterparse: each <item> is turned into a
+dict of its child elements' text, then cleared and detached from the tree,
+so memory stays proportional to one item and callers can stop reading as
+soon as they have enough postings. aiter_rss_items does the same for a
+streamed httpx response with a pull parser fed as chunks arrive.
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from typing import AsyncIterator, Dict, Iterator, Union
+
+import httpx
+import requests
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+def _open_body(body: Union[bytes, requests.Response]):
+    if isinstance(body, (bytes, bytearray)):
+        return io.BytesIO(body)
+    # stream=True responses are read straight off the socket (gzip decoded)
+    if getattr(body, 'raw', None) is not None and not body._content_consumed:
+        body.raw.decode_content = True
+        return body.raw
+    return io.BytesIO(body.content)
+
+def _finished_item(event: str, elem: ET.Element, stack: list, item_tag: str):
+    """Track open elements; returns the item dict when an <item> closes, else None."""
+    if event == 'start':
+        stack.append(elem)
+        return None
+    stack.pop()
+    if _local_name(elem.tag) != item_tag:
+        return None
+    item = {_local_name(child.tag): (child.text or '') for child in elem}
+    # Drop the finished item from its parent so the tree never grows
+    elem.clear()
+    if stack:
+        stack[-1].remove(elem)
+    return item
+
+def iter_rss_items(body: Union[bytes, requests.Response], item_tag: str = 'item') -> Iterator[Dict[str, str]]:
+    """Yield {child tag: text} per item; raises ET.ParseError on malformed XML as it is reached."""
+    stack = []
+    for event, elem in ET.iterparse(_open_body(body), events=('start', 'end')):
+        item = _finished_item(event, elem, stack, item_tag)
+        if item is not None:
+            yield item
+
+async def aiter_rss_items(response: httpx.Response, item_tag: str = 'item') -> AsyncIterator[Dict[str, str]]:
+    """iter_rss_items for a streamed httpx response, fed chunk by chunk as it arrives."""
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    stack = []
+    async for chunk in response.aiter_bytes():
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            item = _finished_item(event, elem, stack, item_tag)
+            if item is not None:
+                yield item
+    parser.close()
+    for event, elem in parser.read_events():
+        item = _finished_item(event, elem, stack, item_tag)
+        if item is not None:
+            yield item
@@ -0,0 +1,387 @@
+"""
+Saved searches and new-posting alerts.
+A saved search is compiled once into its match terms and filters, plus an
+optional query embedding with a similarity threshold. Compiled searches sit
+in an in-memory percolator: an inverted index from each search's anchor term
+(its longest, usually rarest, term) to the searches that need it. A newly
+ingested posting is therefore only tested against searches whose anchor it
+contains. Matches are queued as alerts for delivery, so a user's daily
+re-run of the same search becomes incremental matching of the new postings.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .base import JobPosting
+from .job_index import DATA_ROOT
+from .job_vectors import JobVectorIndex, job_vectors
+from .normalize import normalize_posting, parse_location, posting_filter
+
+JOB_SAVED_SEARCHES_PATH = Path(os.getenv("JOB_SAVED_SEARCHES_PATH", DATA_ROOT / "saved_searches.db"))
+SAVED_SEARCHES_PER_USER = int(os.getenv("SAVED_SEARCHES_PER_USER", "25"))
+JOB_ALERT_MAX_AGE = int(os.getenv("JOB_ALERT_MAX_AGE", str(14 * 24 * 3600)))  # seconds an undelivered alert is kept
+
+# Same tokenization as the FTS index; query terms match as prefixes, like JobIndex.search
+_TERM_RE = re.compile(r"[a-z0-9+#]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saved_searches (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    name TEXT,
+    query TEXT NOT NULL,
+    filters TEXT NOT NULL DEFAULT '{}',
+    min_similarity REAL,
+    vector BLOB,
+    vector_model TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_saved_searches_user ON saved_searches(user_id);
+
+CREATE TABLE IF NOT EXISTS job_alerts (
+    id INTEGER PRIMARY KEY,
+    search_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    url TEXT,
+    score REAL,
+    matched_at REAL NOT NULL,
+    delivered_at REAL,
+    UNIQUE (search_id, job_id)
+);
+CREATE INDEX IF NOT EXISTS idx_job_alerts_pending ON job_alerts(user_id, delivered_at);
+"""
+
+def query_terms(query: str) -> Tuple[str, ...]:
+    """Distinct lowercase match terms; a plural 's' is dropped so the prefix still matches the singular."""
+    terms = []
+    for term in _TERM_RE.findall((query or "").lower()):
+        if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+            term = term[:-1]
+        if term not in terms:
+            terms.append(term)
+    return tuple(terms)
+
+def posting_tokens(job: JobPosting) -> Set[str]:
+    """Tokens of the fields JobIndex searches: title, company, location, description, skills."""
+    text = " ".join([job.title or "", job.company or "", job.location or "", job.description or "",
+                     " ".join(job.skills or [])])
+    return set(_TERM_RE.findall(text.lower()))
+
+def _place_filter(location: str) -> Callable[[JobPosting], bool]:
+    """Predicate mirroring the index's non-radius location clause."""
+    wanted = parse_location(location)
+    needle = location.strip().lower()
+
+    def keep(job: JobPosting) -> bool:
+        place, _ = normalize_posting(job)
+        if wanted.remote and not (wanted.city or wanted.region):
+            return (job.remote or place.remote) and (not wanted.country or place.country in (None, wanted.country))
+        if wanted.city:
+            return (place.city, place.country) == (wanted.city, wanted.country)
+        if wanted.region:
+            return (place.region, place.country) == (wanted.region, wanted.country)
+        if wanted.country:
+            return place.country == wanted.country
+        return needle in (job.location or "").lower()
+    return keep
+
+@dataclass
+class SavedSearch:
+    """A user's search, compiled for percolation."""
+    id: str
+    user_id: str
+    query: str
+    name: Optional[str] = None
+    location: Optional[str] = None
+    remote: Optional[bool] = None
+    sources: Optional[List[str]] = None
+    radius_km: Optional[float] = None
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    currency: str = "USD"
+    min_similarity: Optional[float] = None
+    created_at: float = field(default_factory=time.time)
+    vector: Optional[np.ndarray] = field(default=None, repr=False)
+    terms: Tuple[str, ...] = field(init=False)
+    anchor: str = field(init=False)
+
+    def __post_init__(self):
+        self.terms = query_terms(self.query)
+        if not self.terms:
+            raise ValueError("Saved search query has no searchable terms")
+        self.anchor = max(self.terms, key=len)
+        self._filters: List[Callable[[JobPosting], bool]] = []
+        if self.location and not self.radius_km:
+            self._filters.append(_place_filter(self.location))
+        normalized = posting_filter(self.location, self.radius_km, self.salary_min, self.salary_max, self.currency)
+        if normalized is not None:
+            self._filters.append(normalized)
+
+    @property
+    def filters(self) -> Dict[str, Any]:
+        values = {"location": self.location, "remote": self.remote, "sources": self.sources,
+                  "radius_km": self.radius_km, "salary_min": self.salary_min, "salary_max": self.salary_max,
+                  "currency": self.currency}
+        return {key: value for key, value in values.items() if value is not None}
+
+    def matches(self, job: JobPosting, prefixes: Set[str]) -> bool:
+        """Every term is a prefix of some posting token, and every filter passes."""
+        if any(term not in prefixes for term in self.terms):
+            return False
+        if self.remote is not None and (bool(job.remote) or normalize_posting(job)[0].remote) != self.remote:
+            return False
+        if self.sources and job.source not in self.sources:
+            return False
+        return all(keep(job) for keep in self._filters)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "query": self.query,
+            "filters": self.filters,
+            "min_similarity": self.min_similarity,
+            "created_at": self.created_at
+        }
+
+class SavedSearchStore:
+    """Persisted saved searches, their percolator index and the alert queue."""
+
+    def __init__(self, path: Path = JOB_SAVED_SEARCHES_PATH, vectors: JobVectorIndex = job_vectors):
+        self.path = Path(path)
+        self.vectors = vectors
+        self._lock = threading.RLock()
+        self._initialized = False
+        self._loaded = False
+        self._searches: Dict[str, SavedSearch] = {}
+        self._by_anchor: Dict[str, Set[str]] = {}
+        self._term_lengths: Dict[int, int] = {}     # query term length -> terms of that length
+        self.postings_checked = 0
+        self.candidates_tested = 0
+        self.alerts_queued = 0
+
+    @contextmanager
+    def _conn(self):
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(self.path, timeout=10)
+                    try:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_SCHEMA)
+                        conn.commit()
+                    finally:
+                        conn.close()
+                    self._initialized = True
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.row_factory = sqlite3.Row
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _index(self, search: SavedSearch):
+        self._searches[search.id] = search
+        self._by_anchor.setdefault(search.anchor, set()).add(search.id)
+        for term in search.terms:
+            self._term_lengths[len(term)] = self._term_lengths.get(len(term), 0) + 1
+
+    def _unindex(self, search: SavedSearch):
+        self._searches.pop(search.id, None)
+        ids = self._by_anchor.get(search.anchor)
+        if ids is not None:
+            ids.discard(search.id)
+            if not ids:
+                del self._by_anchor[search.anchor]
+        for term in search.terms:
+            self._term_lengths[len(term)] -= 1
+            if not self._term_lengths[len(term)]:
+                del self._term_lengths[len(term)]
+
+    def _from_row(self, row: sqlite3.Row) -> SavedSearch:
+        vector = None
+        if row["vector"] is not None and row["vector_model"] == self.vectors.embedder.model:
+            vector = np.frombuffer(row["vector"], dtype=np.float32)
+        return SavedSearch(id=row["id"], user_id=row["user_id"], query=row["query"], name=row["name"],
+                           min_similarity=row["min_similarity"], created_at=row["created_at"], vector=vector,
+                           **json.loads(row["filters"] or "{}"))
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            with self._conn() as conn:
+                rows = conn.execute("SELECT * FROM saved_searches").fetchall()
+            for row in rows:
+                try:
+                    self._index(self._from_row(row))
+                except (ValueError, TypeError) as e:
+                    print(f"Skipping unreadable saved search {row['id']}: {e}")
+            self._loaded = True
+
+    def _query_vector(self, search: SavedSearch) -> Optional[np.ndarray]:
+        """The search's embedding, re-embedded after an embedding model change."""
+        if search.vector is None:
+            search.vector = self.vectors.embed_query(search.query)
+            with self._conn() as conn:
+                conn.execute("UPDATE saved_searches SET vector = ?, vector_model = ? WHERE id = ?",
+                             (search.vector.tobytes(), self.vectors.embedder.model, search.id))
+        return search.vector
+
+    def create(self, user_id: str, query: str, name: Optional[str] = None,
+               min_similarity: Optional[float] = None, **filters) -> SavedSearch:
+        """Compile and store a search; raises ValueError for an empty query or a full quota."""
+        self._ensure_loaded()
+        search = SavedSearch(id=uuid.uuid4().hex, user_id=user_id, query=query.strip(), name=name,
+                             min_similarity=min_similarity, **filters)
+        if min_similarity is not None:
+            search.vector = self.vectors.embed_query(search.query)
+        with self._lock:
+            owned = sum(1 for existing in self._searches.values() if existing.user_id == user_id)
+            if owned >= SAVED_SEARCHES_PER_USER:
+                raise ValueError(f"At most {SAVED_SEARCHES_PER_USER} saved searches per user")
+            with self._conn() as conn:
+                conn.execute(
+                    "INSERT INTO saved_searches (id, user_id, name, query, filters, min_similarity, vector, "
+                    "vector_model, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (search.id, user_id, name, search.query, json.dumps(search.filters), min_similarity,
+                     search.vector.tobytes() if search.vector is not None else None,
+                     self.vectors.embedder.model if search.vector is not None else None, search.created_at)
+                )
+            self._index(search)
+        return search
+
+    def list(self, user_id: str) -> List[SavedSearch]:
+        self._ensure_loaded()
+        with self._lock:
+            searches = [search for search in self._searches.values() if search.user_id == user_id]
+        return sorted(searches, key=lambda search: search.created_at)
+
+    def delete(self, user_id: str, search_id: str) -> bool:
+        """Remove a search and its undelivered alerts."""
+        self._ensure_loaded()
+        with self._lock:
+            search = self._searches.get(search_id)
+            if search is None or search.user_id != user_id:
+                return False
+            with self._conn() as conn:
+                conn.execute("DELETE FROM saved_searches WHERE id = ?", (search_id,))
+                conn.execute("DELETE FROM job_alerts WHERE search_id = ? AND delivered_at IS NULL", (search_id,))
+            self._unindex(search)
+        return True
+
+    def percolate(self, jobs: Iterable[JobPosting]) -> int:
+        """Match new postings against every saved search and queue alerts; returns alerts queued."""
+        self._ensure_loaded()
+        alerts = []
+        now = time.time()
+        with self._lock:
+            if not self._searches:
+                return 0
+            lengths = sorted(self._term_lengths)
+            anchors = self._by_anchor
+            for job in jobs:
+                if not job.id:
+                    continue
+                self.postings_checked += 1
+                # Every prefix of this posting's tokens that some query term could be
+                prefixes = {token[:n] for token in posting_tokens(job) for n in lengths if n <= len(token)}
+                candidates = [search_id for anchor in prefixes & anchors.keys() for search_id in anchors[anchor]]
+                vector = None
+                for search_id in candidates:
+                    search = self._searches[search_id]
+                    self.candidates_tested += 1
+                    if not search.matches(job, prefixes):
+                        continue
+                    score = None
+                    if search.min_similarity is not None:
+                        if vector is None:
+                            vector = self.vectors.vectors([job.id]).get(job.id, False)
+                        if vector is False:
+                            continue  # not embedded: only keyword-only searches can match
+                        score = float(vector @ self._query_vector(search))
+                        if score < search.min_similarity:
+                            continue
+                    alerts.append((search.id, search.user_id, job.id, job.title, job.company, job.location,
+                                   job.url, score, now))
+        if not alerts:
+            return 0
+        with self._conn() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO job_alerts (search_id, user_id, job_id, title, company, location, url, "
+                "score, matched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                alerts
+            )
+            queued = conn.total_changes - before
+            conn.execute("DELETE FROM job_alerts WHERE matched_at < ?", (now - JOB_ALERT_MAX_AGE,))
+        self.alerts_queued += queued
+        return queued
+
+    def pending_alerts(self, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Undelivered alerts for a user, oldest first."""
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT * FROM job_alerts WHERE user_id = ? AND delivered_at IS NULL ORDER BY matched_at, id LIMIT ?",
+                (user_id, limit)
+            ).fetchall()
+        return [{key: row[key] for key in row.keys() if key not in ("user_id", "delivered_at")} for row in rows]
+
+    def mark_delivered(self, user_id: str, alert_ids: Iterable[int]) -> int:
+        rows = [(time.time(), user_id, alert_id) for alert_id in alert_ids]
+        if not rows:
+            return 0
+        with self._conn() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "UPDATE job_alerts SET delivered_at = ? WHERE user_id = ? AND id = ? AND delivered_at IS NULL", rows
+            )
+            return conn.total_changes - before
+
+    def stats(self) -> Dict[str, Any]:
+        self._ensure_loaded()
+        with self._conn() as conn:
+            pending = conn.execute("SELECT COUNT(*) FROM job_alerts WHERE delivered_at IS NULL").fetchone()[0]
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "saved_searches": len(self._searches),
+                "anchor_terms": len(self._by_anchor),
+                "postings_checked": self.postings_checked,
+                "candidates_tested": self.candidates_tested,
+                "alerts_queued": self.alerts_queued,
+                "alerts_pending": pending
+            }
+
+# Shared saved-search store fed by ingestion, the board crawler and search write-through
+saved_searches = SavedSearchStore()
+
+def percolate_jobs(jobs: Iterable[JobPosting]) -> int:
+    """Best-effort alert matching for newly indexed postings; failures never break ingestion."""
+    try:
+        return saved_searches.percolate(jobs)
+    except Exception as e:
+        print(f"Saved search percolation failed: {e}")
+        return 0
+
+def get_saved_search_health() -> Dict[str, Any]:
+    return saved_searches.stats()
@@ -14,7 +14,7 @@ class SerpApiSource(JobSource):
         super().__init__("serpapi", api_key, rate_limit=100)
         self.base_url = "https://serpapi.com/search"
     
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search jobs using SerpApi - REQUIRES PAID API KEY."""
         if not self._check_rate_limit():
             return []
@@ -2,12 +2,12 @@
 WeWorkRemotely job source implementation.
 """
 import json
-import requests
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import xml.etree.ElementTree as ET
 
-from .base import JobSource, JobPosting
+from .base import REQUEST_ERRORS, JobSource, JobPosting
+from .rss import iter_rss_items
 
 class WeWorkRemotelySource(JobSource):
     """WeWorkRemotely job board integration."""
@@ -16,25 +16,24 @@ class WeWorkRemotelySource(JobSource):
         super().__init__("weworkremotely", api_key, rate_limit)
         self.rss_url = "https://weworkremotely.com/categories/remote-programming-jobs.rss"
 
-    def search_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
+    # The RSS feed changes a few times an hour at most
+    feed_ttl = 900
+
+    async def asearch_jobs(self, query: str, location: str = None, limit: int = 10) -> List[JobPosting]:
         """Search WeWorkRemotely jobs via RSS feed."""
         try:
-            headers = {'User-Agent': 'Mosaic Career Platform (contact@whatismydelta.com)'}
-            response = requests.get(self.rss_url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            # Parse RSS XML
-            root = ET.fromstring(response.content)
+            # The cache keeps the raw feed bytes; each query streams only the items it needs
+            body = await self._afetch_feed(self.rss_url, lambda response: response.content, timeout=10)
             jobs = []
             query_lower = query.lower()
 
-            for item in root.findall('.//item')[:limit+20]:  # Get extra for filtering
-                if len(jobs) >= limit:
+            for scanned, item in enumerate(iter_rss_items(body)):
+                if len(jobs) >= limit or scanned >= limit + 20:  # Get extra for filtering
                     break
 
-                title = item.find('title').text if item.find('title') is not None else ''
-                description = item.find('description').text if item.find('description') is not None else ''
-                link = item.find('link').text if item.find('link') is not None else ''
+                title = item.get('title', '')
+                description = item.get('description', '')
+                link = item.get('link', '')
 
                 # Filter by query match
                 if query_lower not in title.lower() and query_lower not in description.lower():
@@ -55,7 +54,7 @@ class WeWorkRemotelySource(JobSource):
                     title=title,
                     company=company,
                     location='Remote',
-                    description=description[:500],  # Limit description
+                    description=description,
                     url=link,
                     source='weworkremotely',
                     remote=True,
@@ -66,7 +65,7 @@ class WeWorkRemotelySource(JobSource):
 
             return jobs
 
-        except requests.RequestException as e:
+        except REQUEST_ERRORS as e:
             print(f"Error fetching WeWorkRemotely jobs: {e}")
             return []
         except ET.ParseError as e:
@@ -0,0 +1,20 @@
+-- Migration 007: Add source router statistics
+-- Created: 2026-10-19
+-- Purpose: Persist per-source search outcomes by query-class feature so the
+-- source router can rank job sources without per-search LLM calls
+
+-- Exponentially decayed counters; one row per (source, feature)
+CREATE TABLE IF NOT EXISTS source_route_stats (
+    source_name TEXT NOT NULL,
+    feature TEXT NOT NULL, -- '*' (all searches), 'skill:python', 'cat:language', 'kw:nurse', 'remote:yes', 'loc:US'
+    calls REAL DEFAULT 0.0,
+    successes REAL DEFAULT 0.0,
+    results REAL DEFAULT 0.0, -- postings returned by successful calls
+    latency_total REAL DEFAULT 0.0, -- summed seconds
+    updated_at REAL NOT NULL, -- unix time the counters were last decayed
+    PRIMARY KEY (source_name, feature)
+);
+
+-- Indexes for performance
+CREATE INDEX IF NOT EXISTS idx_source_route_stats_feature ON source_route_stats (feature);
+CREATE INDEX IF NOT EXISTS idx_source_route_stats_updated_at ON source_route_stats (updated_at);
@@ -7,8 +7,14 @@ passion opportunities, and cultural fit for Mosaic users.
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import json
+import os
 from dataclasses import dataclass
 
+from .compute_pool import COMPUTE_POOL_TASK_TIMEOUT, ComputePoolBusy, run_cpu_bound
+from .cpu_kernels import analyze_job_postings
+
+OSINT_POOL_WAIT = float(os.getenv("OSINT_POOL_WAIT", "5"))  # seconds to wait for a compute-pool slot
+
 @dataclass
 class JobPostingAnalysis:
     """Analysis of individual job postings for values alignment."""
@@ -116,8 +122,19 @@ class OSINTForensicsEngine:
                             user_values: List[str] = None, user_passions: List[str] = None) -> CompanyOSINTReport:
         """Generate comprehensive OSINT report for values-driven job search."""
         
-        # Analyze all job postings
-        analyses = [self.analyze_job_posting(posting) for posting in job_postings]
+        # Analyze all job postings (keyword scans run on the shared compute pool)
+        try:
+            analyses = run_cpu_bound(analyze_job_postings, job_postings, acquire_timeout=OSINT_POOL_WAIT)
+        except ComputePoolBusy:
+            # Scanning inline would put the load back on the request thread
+            print(f"Compute pool busy for {OSINT_POOL_WAIT}s, skipping OSINT scan")
+            raise
+        except TimeoutError:
+            print(f"Compute pool OSINT scan exceeded {COMPUTE_POOL_TASK_TIMEOUT}s, not rescanning inline")
+            raise RuntimeError("OSINT scan timed out")
+        except Exception as e:
+            print(f"Compute pool OSINT scan failed, scanning inline: {e}")
+            analyses = [self.analyze_job_posting(posting) for posting in job_postings]
         
         # Generate values alignment analysis
         values_alignment = self._analyze_values_alignment(analyses, user_values)
@@ -17,6 +17,8 @@ from .ai_clients import get_ai_fallback_response
 from .cost_controls import check_cost_limits, check_resource_limits, record_usage
 from .domain_adjacent_search import discover_domain_adjacent_opportunities
 from .reranker import rerank_documents
+from .compute_pool import ComputePoolBusy, run_cpu_bound
+from .cpu_kernels import cosine_similarity_with_boost, score_embedding_rows
 
 @dataclass
 class EmbeddingResult:
@@ -256,42 +258,46 @@ class RAGEngine:
                     "SELECT text, embedding, metadata FROM embeddings ORDER BY created_at DESC LIMIT 100"
                 ).fetchall()
             
-            matches = []
-            for row in rows:
-                try:
-                    stored_embedding = json.loads(row[1])
-                    similarity = self._cosine_similarity(query_embedding.embedding, stored_embedding)
-                    
-                    if similarity >= min_similarity:
-                        matches.append({
-                            "text": row[0],
-                            "similarity": similarity,
-                            "metadata": json.loads(row[2]) if row[2] else {}
-                        })
-                except Exception as e:
-                    print(f"Error processing embedding: {e}")
-                    continue
+            # Decode and score stored embeddings off the request thread
+            rows = [tuple(row) for row in rows]
+            try:
+                matches = run_cpu_bound(score_embedding_rows, query_embedding.embedding, rows, min_similarity)
+            except (ComputePoolBusy, TimeoutError) as e:
+                # Don't score again inline under load; callers already handle the fallback result
+                print(f"Compute pool scoring {'busy' if isinstance(e, ComputePoolBusy) else 'timed out'}, skipping retrieval")
+                return RetrievalResult(
+                    query=query,
+                    matches=[],
+                    confidence=0.0,
+                    fallback_used=True,
+                    retrieval_time=time.time() - start_time
+                )
+            except Exception as e:
+                print(f"Compute pool scoring failed, scoring inline: {e}")
+                matches = score_embedding_rows(query_embedding.embedding, rows, min_similarity)
             
             # Sort by similarity and limit results
             matches.sort(key=lambda x: x["similarity"], reverse=True)
             
-            # Apply reranking if we have enough candidates
-            if len(matches) > 5:
+            # Apply reranking; the reranker's budget policy decides whether it is worth it
+            if matches:
                 try:
                     rerank_result = rerank_documents(query, matches)
                     matches = rerank_result.reranked_documents
-                    # Log reranking improvement
-                    print(f"Reranking improvement: {rerank_result.improvement_pct:.1f}%")
                     
-                    # Record analytics for telemetry
-                    from .analytics import log_match_analytics
-                    log_match_analytics(
-                        query=query,
-                        pre_scores=rerank_result.pre_rerank_scores,
-                        post_scores=rerank_result.post_rerank_scores,
-                        improvement_pct=rerank_result.improvement_pct,
-                        processing_time=rerank_result.processing_time
-                    )
+                    if not rerank_result.skipped:
+                        # Log reranking improvement
+                        print(f"Reranking improvement: {rerank_result.improvement_pct:.1f}%")
+                        
+                        # Record analytics for telemetry
+                        from .analytics import log_match_analytics
+                        log_match_analytics(
+                            query=query,
+                            pre_scores=rerank_result.pre_rerank_scores,
+                            post_scores=rerank_result.post_rerank_scores,
+                            improvement_pct=rerank_result.improvement_pct,
+                            processing_time=rerank_result.processing_time
+                        )
                 except Exception as e:
                     print(f"Reranking failed, using original results: {e}")
             
@@ -323,38 +329,7 @@ class RAGEngine:
     
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate normalized cosine similarity between two vectors."""
-        try:
-            # Calculate dot product
-            dot_product = sum(a * b for a, b in zip(vec1, vec2))
-            
-            # Calculate norms
-            norm1 = sum(a * a for a in vec1) ** 0.5
-            norm2 = sum(b * b for b in vec2) ** 0.5
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            # Normalized cosine similarity
-            similarity = dot_product / (norm1 * norm2)
-            
-            # Apply keyword boost if available
-            return self._apply_keyword_boost(similarity, vec1, vec2)
-        except Exception:
-            return 0.0
-    
-    def _apply_keyword_boost(self, similarity: float, vec1: List[float], vec2: List[float]) -> float:
-        """Apply simple keyword boost to similarity score."""
-        try:
-            # Simple keyword boost based on vector magnitude
-            magnitude1 = sum(a * a for a in vec1) ** 0.5
-            magnitude2 = sum(b * b for b in vec2) ** 0.5
-            
-            # Boost factor based on vector magnitudes (simple heuristic)
-            boost_factor = min(1.2, 1.0 + (magnitude1 + magnitude2) / 1000.0)
-            
-            return min(1.0, similarity * boost_factor)
-        except Exception:
-            return similarity
+        return cosine_similarity_with_boost(vec1, vec2)
     
     def get_rag_response(self, query: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Get RAG response with retrieval and fallback logic."""
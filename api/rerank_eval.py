@@ -0,0 +1,279 @@
+"""
+Offline Reranker Evaluation for Mosaic 2.0
+Runs a labeled query/document set through first-stage retrieval with and
+without cross-encoder reranking and reports ranking quality (NDCG@k, MRR),
+per-stage latency percentiles and throughput as a diffable JSON report.
+Without a loaded cross-encoder the reranker falls back to random boosts, so
+evaluation refuses to run unless allow_mock is set, and then labels the
+configuration "reranked_mock".
+"""
+
+import json
+import math
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_K_VALUES = (5, 10)
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+@dataclass
+class EvalQuery:
+    """One labeled query: candidate documents and graded relevance by doc id"""
+    query_id: str
+    query: str
+    documents: List[Dict[str, Any]]
+    relevance: Dict[str, float]
+
+@dataclass
+class EvalRun:
+    """Per-query ranking plus stage timings for one configuration"""
+    query_id: str
+    ranking: List[str]
+    stage_ms: Dict[str, float]
+    decision: str = ""
+    extras: Dict[str, Any] = field(default_factory=dict)
+
+def load_eval_set(path: str) -> List[EvalQuery]:
+    """Load a labeled set: {"queries": [{"id", "query", "documents": [{"id", "text"}], "relevance": {id: grade}}]}"""
+    with open(path, "r") as f:
+        raw = json.load(f)
+
+    queries = []
+    for i, item in enumerate(raw.get("queries", [])):
+        queries.append(EvalQuery(
+            query_id=str(item.get("id", i)),
+            query=item["query"],
+            documents=item["documents"],
+            relevance={str(doc_id): float(grade) for doc_id, grade in item.get("relevance", {}).items()}
+        ))
+    return queries
+
+# Metrics
+
+def dcg_at_k(gains: List[float], k: int) -> float:
+    """Discounted cumulative gain with exponential gain (2^rel - 1)."""
+    return sum((2 ** gain - 1) / math.log2(rank + 2) for rank, gain in enumerate(gains[:k]))
+
+def ndcg_at_k(ranking: List[str], relevance: Dict[str, float], k: int) -> float:
+    """NDCG@k of a ranked list of doc ids against graded relevance."""
+    ideal = dcg_at_k(sorted(relevance.values(), reverse=True), k)
+    if ideal == 0:
+        return 0.0
+    return dcg_at_k([relevance.get(doc_id, 0.0) for doc_id in ranking], k) / ideal
+
+def reciprocal_rank(ranking: List[str], relevance: Dict[str, float]) -> float:
+    """1 / rank of the first relevant document (0 if none retrieved)."""
+    for rank, doc_id in enumerate(ranking, start=1):
+        if relevance.get(doc_id, 0.0) > 0:
+            return 1.0 / rank
+    return 0.0
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100.0
+    lower = int(math.floor(position))
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+# First-stage retrievers
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall((text or "").lower())
+
+def lexical_first_stage(query: str, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """BM25 over the query's candidate set; works offline without API keys."""
+    k1, b = 1.2, 0.75
+    doc_tokens = [_tokenize(doc.get("text", "")) for doc in documents]
+    avg_len = sum(len(tokens) for tokens in doc_tokens) / max(1, len(doc_tokens))
+    doc_freq = Counter(term for tokens in doc_tokens for term in set(tokens))
+    n_docs = len(documents)
+
+    scored = []
+    for doc, tokens in zip(documents, doc_tokens):
+        term_freq = Counter(tokens)
+        score = 0.0
+        for term in set(_tokenize(query)):
+            if term not in term_freq:
+                continue
+            idf = math.log(1 + (n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+            tf = term_freq[term]
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(tokens) / (avg_len or 1)))
+        scored.append((doc, score))
+
+    # Normalize to [0, 1] so the reranker's 70/30 blend sees a similarity-like scale
+    top = max((score for _, score in scored), default=0.0) or 1.0
+    results = [{**doc, "similarity": score / top} for doc, score in scored]
+    results.sort(key=lambda doc: doc["similarity"], reverse=True)
+    return results
+
+def embedding_first_stage(query: str, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Cosine similarity over text-embedding-3-small vectors (production path)."""
+    from .rag_engine import compute_embedding
+    from .cpu_kernels import cosine_similarity_with_boost
+
+    query_embedding = compute_embedding(query)
+    if not query_embedding:
+        raise RuntimeError("query embedding unavailable (RAG_BASELINE off or OpenAI key missing)")
+
+    results = []
+    for doc in documents:
+        vector = doc.get("embedding")
+        if vector is None:
+            embedded = compute_embedding(doc.get("text", ""))
+            vector = embedded.embedding if embedded else []
+        results.append({**doc, "similarity": cosine_similarity_with_boost(query_embedding.embedding, vector)})
+    results.sort(key=lambda doc: doc["similarity"], reverse=True)
+    return results
+
+FIRST_STAGES: Dict[str, Callable[[str, List[Dict[str, Any]]], List[Dict[str, Any]]]] = {
+    "lexical": lexical_first_stage,
+    "embedding": embedding_first_stage,
+}
+
+class RerankEvaluator:
+    """Evaluates first-stage retrieval with and without reranking."""
+
+    def __init__(self, first_stage: str = "lexical", k_values=DEFAULT_K_VALUES,
+                 budget_ms: Optional[float] = None, force_rerank: bool = False, allow_mock: bool = False):
+        if first_stage not in FIRST_STAGES:
+            raise ValueError(f"unknown first stage '{first_stage}' (choose from {sorted(FIRST_STAGES)})")
+        self.first_stage_name = first_stage
+        self.first_stage = FIRST_STAGES[first_stage]
+        self.k_values = tuple(k_values)
+        self.budget_ms = budget_ms
+        self.force_rerank = force_rerank
+        self.allow_mock = allow_mock
+        self.rerank_config = "reranked"
+
+    def _run_query(self, item: EvalQuery, reranker) -> Dict[str, EvalRun]:
+        start = time.perf_counter()
+        candidates = self.first_stage(item.query, item.documents)
+        first_stage_ms = (time.perf_counter() - start) * 1000
+        baseline = [str(doc["id"]) for doc in candidates]
+
+        runs = {"first_stage": EvalRun(item.query_id, baseline, {"first_stage": first_stage_ms,
+                                                                   "total": first_stage_ms})}
+        if reranker is None:
+            return runs
+
+        start = time.perf_counter()
+        result = reranker.rerank_documents(item.query, candidates, self.budget_ms)
+        rerank_ms = (time.perf_counter() - start) * 1000
+
+        # The reranker returns its top-k; unreturned candidates keep first-stage order behind them
+        reranked = [str(doc["id"]) for doc in result.reranked_documents]
+        reranked += [doc_id for doc_id in baseline if doc_id not in set(reranked)]
+        runs[self.rerank_config] = EvalRun(
+            item.query_id,
+            reranked,
+            {"first_stage": first_stage_ms, "rerank": rerank_ms, "total": first_stage_ms + rerank_ms},
+            decision="skipped:" + result.decision if result.skipped else result.decision,
+            extras={"partial": result.partial, "candidates_scored": result.candidates_scored}
+        )
+        return runs
+
+    def _summarize(self, runs: List[EvalRun], queries: Dict[str, EvalQuery], stage_seconds: float) -> Dict[str, Any]:
+        quality = {}
+        for k in self.k_values:
+            quality[f"ndcg@{k}"] = sum(
+                ndcg_at_k(run.ranking, queries[run.query_id].relevance, k) for run in runs
+            ) / max(1, len(runs))
+        quality["mrr"] = sum(
+            reciprocal_rank(run.ranking, queries[run.query_id].relevance) for run in runs
+        ) / max(1, len(runs))
+
+        latency = {}
+        for stage in sorted({stage for run in runs for stage in run.stage_ms}):
+            values = [run.stage_ms[stage] for run in runs if stage in run.stage_ms]
+            latency[stage] = {
+                "p50_ms": round(percentile(values, 50), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+                "p99_ms": round(percentile(values, 99), 3),
+                "mean_ms": round(sum(values) / len(values), 3),
+            }
+
+        summary = {
+            "queries": len(runs),
+            "quality": {name: round(value, 4) for name, value in quality.items()},
+            "latency": latency,
+            # Queries per second of this configuration's own stage time, run serially
+            "stage_qps": round(len(runs) / stage_seconds, 2) if stage_seconds > 0 else None,
+        }
+        decisions = Counter(run.decision for run in runs if run.decision)
+        if decisions:
+            summary["decisions"] = dict(decisions)
+            summary["partial_reranks"] = sum(1 for run in runs if run.extras.get("partial"))
+        return summary
+
+    def evaluate(self, eval_set: List[EvalQuery], with_rerank: bool = True) -> Dict[str, Any]:
+        """Run every query and return the JSON-serializable report."""
+        reranker = None
+        self.rerank_config = "reranked"
+        if with_rerank:
+            from .reranker import reranker as global_reranker
+            reranker = global_reranker
+            if not reranker.initialized:
+                if not self.allow_mock:
+                    raise RuntimeError("cross-encoder not initialized; reranked results would be mock scores "
+                                       "(pass allow_mock to evaluate anyway)")
+                self.rerank_config = "reranked_mock"
+
+        queries = {item.query_id: item for item in eval_set}
+        per_config: Dict[str, List[EvalRun]] = {}
+        stage_seconds = Counter()
+
+        # The reranker is process-wide: override the margin skip only for this run
+        margin_skip_threshold = reranker.margin_skip_threshold if reranker is not None else None
+        if reranker is not None and self.force_rerank:
+            reranker.margin_skip_threshold = float("inf")
+        start = time.perf_counter()
+        try:
+            for item in eval_set:
+                runs = self._run_query(item, reranker)
+                for name, run in runs.items():
+                    per_config.setdefault(name, []).append(run)
+                    stage_seconds[name] += run.stage_ms["total"] / 1000
+        finally:
+            if reranker is not None:
+                reranker.margin_skip_threshold = margin_skip_threshold
+        wall_seconds = time.perf_counter() - start
+
+        report = {
+            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "first_stage": self.first_stage_name,
+            "k_values": list(self.k_values),
+            "wall_clock_s": round(wall_seconds, 3),
+            "configurations": {
+                name: self._summarize(runs, queries, stage_seconds[name]) for name, runs in per_config.items()
+            },
+        }
+        if reranker is not None:
+            health = reranker.get_health_status()
+            report["reranker"] = {
+                key: health.get(key)
+                for key in ("model_name", "backend", "quantized", "max_candidates", "final_top_k",
+                            "budget_ms", "max_time_ms", "margin_skip_threshold", "status")
+            }
+            report["reranker"]["force_rerank"] = self.force_rerank
+            report["reranker"]["mock"] = self.rerank_config == "reranked_mock"
+            if "first_stage" in report["configurations"] and self.rerank_config in report["configurations"]:
+                base = report["configurations"]["first_stage"]["quality"]
+                reranked = report["configurations"][self.rerank_config]["quality"]
+                report["delta"] = {name: round(reranked[name] - base[name], 4) for name in base}
+        return report
+
+def write_report(report: Dict[str, Any], path: str):
+    """Write the report with stable key order so runs diff cleanly."""
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
@@ -3,12 +3,18 @@ Cross-Encoder Reranker for Mosaic 2.0
 Implements CPU-hosted cross-encoder reranking using sentence-transformers
 """
 
+import os
 import time
 import json
-from typing import List, Dict, Any, Tuple
+import hashlib
+import logging
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
+from .compute_pool import ComputePoolBusy, compute_pool
+from .cpu_kernels import predict_rerank_pairs, score_pairs_in_chunks
+
 # Import sentence-transformers (will be added to requirements.txt)
 try:
     from sentence_transformers import CrossEncoder
@@ -17,6 +23,17 @@ except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     print("Warning: sentence-transformers not available, using mock reranker")
 
+# Inference backend: "torch" (sentence-transformers) or "onnx" (onnxruntime, CPU-optimized)
+RERANKER_BACKEND = os.getenv("RERANKER_BACKEND", "torch").lower()
+RERANKER_ONNX_QUANTIZE = os.getenv("RERANKER_ONNX_QUANTIZE", "true").lower() in {"1", "true", "yes", "on"}
+
+# Latency-budgeted rerank policy
+RERANK_BUDGET_MS = float(os.getenv("RERANK_BUDGET_MS", "250"))        # per-request scoring budget
+RERANK_MAX_TIME_MS = float(os.getenv("RERANK_MAX_TIME_MS", "400"))    # hard cap, returns partial reranks
+RERANK_MARGIN_SKIP = float(os.getenv("RERANK_MARGIN_SKIP", "0.15"))   # top-1/top-2 margin that skips reranking
+
+logger = logging.getLogger(__name__)
+
 @dataclass
 class RerankResult:
     """Result of reranking operation"""
@@ -26,6 +43,20 @@ class RerankResult:
     post_rerank_scores: List[float]
     improvement_pct: float
     processing_time: float
+    skipped: bool = False
+    partial: bool = False
+    candidates_scored: int = 0
+    decision: str = ""
+
+@dataclass
+class RerankPlan:
+    """Budget decision for a single rerank request"""
+    action: str  # "rerank" or "skip"
+    candidates: int
+    reason: str
+    margin: float
+    budget_ms: float
+    estimated_ms: float
 
 class CrossEncoderReranker:
     """CPU-hosted cross-encoder reranker for semantic matching."""
@@ -33,12 +64,25 @@ class CrossEncoderReranker:
     def __init__(self):
         self.model_name = "cross-encoder/ms-marco-MiniLM-L-6-v2"
         self.model = None
+        self.backend = RERANKER_BACKEND
+        self.quantized = False
         self.initialized = False
         self.max_candidates = 50  # Rerank top 50 candidates
         self.final_top_k = 12     # Return top 12 results
+        self.min_candidates = 6   # Below this, first-stage order is kept
+        self.chunk_size = 8       # Pairs per predict call; time cap is checked between chunks
+        
+        # Latency budget policy
+        self.budget_ms = RERANK_BUDGET_MS
+        self.max_time_ms = RERANK_MAX_TIME_MS
+        self.margin_skip_threshold = RERANK_MARGIN_SKIP
+        self.per_pair_cost_ms = 4.0  # Initial estimate, refined by observed cost
+        self.cost_smoothing = 0.2
         
         # Performance tracking
         self.total_reranks = 0
+        self.total_skipped = 0
+        self.total_partial = 0
         self.total_processing_time = 0.0
         self.average_latency = 0.0
         
@@ -47,6 +91,12 @@ class CrossEncoderReranker:
     
     def _initialize_model(self):
         """Initialize the cross-encoder model."""
+        if self.backend == "onnx":
+            if self._initialize_onnx_model():
+                return
+            print("Falling back to PyTorch cross-encoder backend")
+            self.backend = "torch"
+
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             print("sentence-transformers not available - installing...")
             try:
@@ -74,16 +124,119 @@ class CrossEncoderReranker:
             print("Falling back to mock reranker")
             self.initialized = False
     
-    def rerank_documents(self, query: str, documents: List[Dict[str, Any]]) -> RerankResult:
-        """Rerank documents using cross-encoder."""
+    def _initialize_onnx_model(self) -> bool:
+        """Initialize the ONNX Runtime cross-encoder backend."""
+        from .reranker_onnx import load_onnx_cross_encoder
+
+        print(f"Initializing ONNX cross-encoder model: {self.model_name} (int8={RERANKER_ONNX_QUANTIZE})")
+        model = load_onnx_cross_encoder(self.model_name, quantize=RERANKER_ONNX_QUANTIZE)
+        if model is None:
+            return False
+
+        self.model = model
+        self.quantized = RERANKER_ONNX_QUANTIZE
+        self.initialized = True
+        print("ONNX cross-encoder model initialized successfully")
+        return True
+    
+    def plan_rerank(self, documents: List[Dict[str, Any]], budget_ms: Optional[float] = None) -> RerankPlan:
+        """Decide whether to rerank and how many candidates fit the latency budget."""
+        budget_ms = self.budget_ms if budget_ms is None else budget_ms
+        scores = [doc.get("similarity", 0.0) for doc in documents[:2]]
+        margin = scores[0] - scores[1] if len(scores) == 2 else 0.0
+
+        if len(documents) < self.min_candidates:
+            return RerankPlan("skip", 0, "too_few_candidates", margin, budget_ms, 0.0)
+
+        if margin >= self.margin_skip_threshold:
+            return RerankPlan("skip", 0, "decisive_margin", margin, budget_ms, 0.0)
+
+        affordable = int(budget_ms / self.per_pair_cost_ms) if self.per_pair_cost_ms > 0 else self.max_candidates
+        candidates = min(self.max_candidates, len(documents), affordable)
+        if candidates < self.min_candidates:
+            return RerankPlan("skip", 0, "budget_exhausted", margin, budget_ms, 0.0)
+
+        reason = "full" if candidates == min(self.max_candidates, len(documents)) else "budget_shrunk"
+        return RerankPlan("rerank", candidates, reason, margin, budget_ms, candidates * self.per_pair_cost_ms)
+
+    def _log_decision(self, query: str, plan: RerankPlan, scored: int, partial: bool, elapsed_ms: float):
+        """Emit one structured line per rerank decision for p99/quality tuning."""
+        logger.info("rerank_decision %s", json.dumps({
+            "query_hash": hashlib.sha256(query.encode()).hexdigest()[:12],
+            "action": plan.action,
+            "reason": plan.reason,
+            "margin": round(plan.margin, 4),
+            "budget_ms": plan.budget_ms,
+            "planned_candidates": plan.candidates,
+            "scored_candidates": scored,
+            "partial": partial,
+            "estimated_ms": round(plan.estimated_ms, 2),
+            "elapsed_ms": round(elapsed_ms, 2),
+            "per_pair_cost_ms": round(self.per_pair_cost_ms, 3),
+        }))
+
+    def _score_pairs(self, query_doc_pairs: List[Tuple[str, str]], start_time: float) -> Tuple[List[float], bool]:
+        """Score pairs in chunks, stopping early when the time cap is reached."""
+        deadline = start_time + self.max_time_ms / 1000
+        try:
+            scores, partial, model_ms = self._predict(query_doc_pairs, deadline)
+        except ComputePoolBusy:
+            # Back-pressure: the candidates stay in first-stage order
+            return [], True
+
+        # EWMA of observed per-pair model cost (IPC excluded) drives future candidate counts
+        if scores:
+            observed = model_ms / len(scores)
+            self.per_pair_cost_ms = (
+                self.cost_smoothing * observed + (1 - self.cost_smoothing) * self.per_pair_cost_ms
+            )
+        return scores, partial
+
+    def _predict(self, pairs: List[Tuple[str, str]], deadline: float) -> Tuple[List[float], bool, float]:
+        """Score the batch as one compute-pool task (the worker enforces the time cap), or inline."""
+        if compute_pool.enabled:
+            future = compute_pool.submit(predict_rerank_pairs, pairs, self.chunk_size, deadline,
+                                         self.per_pair_cost_ms)
+            # The worker checks the cap between chunks, so allow one chunk of overrun
+            timeout = max(0.0, deadline - time.time()) + self.chunk_size * self.per_pair_cost_ms / 1000 + 0.1
+            try:
+                return future.result(timeout=timeout)
+            except TimeoutError:
+                # Don't score again inline; the worker stops at its next chunk boundary
+                future.cancel()
+                print("Compute pool rerank timed out, keeping first-stage order")
+                return [], True, 0.0
+            except Exception as e:
+                print(f"Compute pool rerank failed, scoring inline: {e}")
+        return score_pairs_in_chunks(self.model.predict, pairs, self.chunk_size, deadline, self.per_pair_cost_ms)
+
+    def rerank_documents(self, query: str, documents: List[Dict[str, Any]],
+                         budget_ms: Optional[float] = None) -> RerankResult:
+        """Rerank documents using cross-encoder within a latency budget."""
         start_time = time.time()
         
+        plan = self.plan_rerank(documents, budget_ms)
+        if plan.action == "skip":
+            self.total_skipped += 1
+            self._log_decision(query, plan, 0, False, (time.time() - start_time) * 1000)
+            pre_scores = [doc.get("similarity", 0.0) for doc in documents[:self.final_top_k]]
+            return RerankResult(
+                query=query,
+                reranked_documents=documents[:self.final_top_k],
+                pre_rerank_scores=pre_scores,
+                post_rerank_scores=pre_scores,
+                improvement_pct=0.0,
+                processing_time=time.time() - start_time,
+                skipped=True,
+                decision=plan.reason
+            )
+        
         if not self.initialized:
             return self._mock_rerank(query, documents, start_time)
         
         try:
-            # Limit to max candidates
-            candidates = documents[:self.max_candidates]
+            # Limit to the candidate count the budget allows
+            candidates = documents[:plan.candidates]
             
             # Extract text and scores
             texts = [doc.get("text", "") for doc in candidates]
@@ -92,8 +245,9 @@ class CrossEncoderReranker:
             # Prepare query-document pairs
             query_doc_pairs = [(query, text) for text in texts]
             
-            # Get rerank scores
-            rerank_scores = self.model.predict(query_doc_pairs)
+            # Get rerank scores (possibly for a prefix only if the time cap hits)
+            rerank_scores, partial = self._score_pairs(query_doc_pairs, start_time)
+            scored_candidates = candidates[:len(rerank_scores)]
             
             # Combine with original scores (weighted average)
             combined_scores = []
@@ -103,7 +257,7 @@ class CrossEncoderReranker:
                 combined_scores.append(combined_score)
             
             # Sort by combined scores
-            scored_docs = list(zip(candidates, pre_scores, rerank_scores, combined_scores))
+            scored_docs = list(zip(scored_candidates, pre_scores, rerank_scores, combined_scores))
             scored_docs.sort(key=lambda x: x[3], reverse=True)
             
             # Take top results
@@ -120,11 +274,22 @@ class CrossEncoderReranker:
                 reranked_docs.append(doc_copy)
                 post_scores.append(combined_score)
             
+            # Partial rerank: unscored candidates keep first-stage order after the scored prefix
+            if partial and len(reranked_docs) < self.final_top_k:
+                for doc in documents[len(rerank_scores):]:
+                    if len(reranked_docs) >= self.final_top_k:
+                        break
+                    reranked_docs.append(doc.copy())
+                    post_scores.append(doc.get("similarity", 0.0))
+            
             # Calculate improvement
             improvement_pct = self._calculate_improvement(pre_scores, post_scores)
             
             processing_time = time.time() - start_time
             self._update_performance_stats(processing_time)
+            if partial:
+                self.total_partial += 1
+            self._log_decision(query, plan, len(rerank_scores), partial, processing_time * 1000)
             
             return RerankResult(
                 query=query,
@@ -132,7 +297,10 @@ class CrossEncoderReranker:
                 pre_rerank_scores=pre_scores,
                 post_rerank_scores=post_scores,
                 improvement_pct=improvement_pct,
-                processing_time=processing_time
+                processing_time=processing_time,
+                partial=partial,
+                candidates_scored=len(rerank_scores),
+                decision=plan.reason
             )
             
         except Exception as e:
@@ -166,7 +334,8 @@ class CrossEncoderReranker:
             pre_rerank_scores=pre_scores,
             post_rerank_scores=post_scores,
             improvement_pct=15.0,  # Mock 15% improvement
-            processing_time=time.time() - start_time
+            processing_time=time.time() - start_time,
+            decision="mock"
         )
     
     def _calculate_improvement(self, pre_scores: List[float], post_scores: List[float]) -> float:
@@ -193,9 +362,17 @@ class CrossEncoderReranker:
         return {
             "initialized": self.initialized,
             "model_name": self.model_name,
+            "backend": self.backend,
+            "quantized": self.quantized,
             "sentence_transformers_available": SENTENCE_TRANSFORMERS_AVAILABLE,
             "total_reranks": self.total_reranks,
+            "total_skipped": self.total_skipped,
+            "total_partial": self.total_partial,
             "average_latency": self.average_latency,
+            "per_pair_cost_ms": self.per_pair_cost_ms,
+            "budget_ms": self.budget_ms,
+            "max_time_ms": self.max_time_ms,
+            "margin_skip_threshold": self.margin_skip_threshold,
             "max_candidates": self.max_candidates,
             "final_top_k": self.final_top_k,
             "status": "operational" if self.initialized else "disabled"
@@ -204,9 +381,9 @@ class CrossEncoderReranker:
 # Global reranker instance
 reranker = CrossEncoderReranker()
 
-def rerank_documents(query: str, documents: List[Dict[str, Any]]) -> RerankResult:
+def rerank_documents(query: str, documents: List[Dict[str, Any]], budget_ms: Optional[float] = None) -> RerankResult:
     """Rerank documents using the global reranker."""
-    return reranker.rerank_documents(query, documents)
+    return reranker.rerank_documents(query, documents, budget_ms)
 
 def get_reranker_health() -> Dict[str, Any]:
     """Get reranker health status."""
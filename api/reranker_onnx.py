@@ -0,0 +1,146 @@
+"""
+ONNX Runtime backend for the cross-encoder reranker
+Exports the Hugging Face cross-encoder to ONNX once, optionally applies dynamic
+int8 quantization, and serves predictions through onnxruntime on CPU.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    import onnxruntime as ort
+    from transformers import AutoConfig, AutoTokenizer
+    ONNX_RUNTIME_AVAILABLE = True
+except ImportError:
+    ONNX_RUNTIME_AVAILABLE = False
+
+DEFAULT_MODEL_DIR = Path(os.getenv("RERANKER_ONNX_DIR", "data/models/reranker-onnx"))
+ONNX_INTRA_OP_THREADS = int(os.getenv("RERANKER_ONNX_THREADS", "0"))  # 0 = let onnxruntime decide
+MAX_SEQUENCE_LENGTH = 512
+
+def _model_slug(model_name: str) -> str:
+    """Filesystem-safe directory name for a model id."""
+    return model_name.replace("/", "__")
+
+def onnx_model_path(model_name: str, quantize: bool, model_dir: Path = DEFAULT_MODEL_DIR) -> Path:
+    """Location of the exported (and optionally quantized) ONNX graph."""
+    filename = "model.int8.onnx" if quantize else "model.onnx"
+    return model_dir / _model_slug(model_name) / filename
+
+def export_onnx_model(model_name: str, quantize: bool = True, model_dir: Path = DEFAULT_MODEL_DIR) -> Path:
+    """Export the cross-encoder to ONNX (and int8) if not already on disk."""
+    target = onnx_model_path(model_name, quantize, model_dir)
+    if target.exists():
+        return target
+
+    fp32_path = onnx_model_path(model_name, False, model_dir)
+    fp32_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if not fp32_path.exists():
+        # torch/transformers are only needed for the one-off export
+        import torch
+        from transformers import AutoModelForSequenceClassification
+
+        print(f"Exporting {model_name} to ONNX: {fp32_path}")
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model.eval()
+
+        sample = tokenizer(
+            ["sample query"], ["sample document"],
+            padding=True, truncation=True, return_tensors="pt"
+        )
+        input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["logits"] = {0: "batch"}
+
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                tuple(sample[name] for name in input_names),
+                str(fp32_path),
+                input_names=input_names,
+                output_names=["logits"],
+                dynamic_axes=dynamic_axes,
+                opset_version=14,
+                do_constant_folding=True
+            )
+        tokenizer.save_pretrained(fp32_path.parent)
+        model.config.save_pretrained(fp32_path.parent)
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        print(f"Quantizing {fp32_path.name} to int8: {target}")
+        quantize_dynamic(str(fp32_path), str(target), weight_type=QuantType.QInt8)
+
+    return target
+
+class OnnxCrossEncoder:
+    """Drop-in replacement for sentence_transformers.CrossEncoder.predict on CPU."""
+
+    def __init__(self, model_name: str, quantize: bool = True, model_dir: Path = DEFAULT_MODEL_DIR):
+        if not ONNX_RUNTIME_AVAILABLE:
+            raise ImportError("onnxruntime and transformers are required for the ONNX reranker backend")
+
+        self.model_name = model_name
+        self.quantize = quantize
+        self.model_path = export_onnx_model(model_name, quantize, model_dir)
+
+        model_files = self.model_path.parent
+        self.tokenizer = AutoTokenizer.from_pretrained(model_files)
+        config = AutoConfig.from_pretrained(model_files)
+
+        # Mirror CrossEncoder's default activation so scores stay on the same scale
+        activation = getattr(config, "sbert_ce_default_activation_function", None)
+        if activation:
+            self.apply_sigmoid = "Sigmoid" in activation
+        else:
+            self.apply_sigmoid = getattr(config, "num_labels", 1) == 1
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if ONNX_INTRA_OP_THREADS > 0:
+            options.intra_op_num_threads = ONNX_INTRA_OP_THREADS
+        self.session = ort.InferenceSession(
+            str(self.model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {graph_input.name for graph_input in self.session.get_inputs()}
+
+    def predict(self, sentence_pairs: Sequence[Tuple[str, str]], batch_size: int = 32) -> List[float]:
+        """Score (query, document) pairs; same contract as CrossEncoder.predict."""
+        scores: List[float] = []
+        pairs = list(sentence_pairs)
+
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start:start + batch_size]
+            encoded = self.tokenizer(
+                [pair[0] for pair in batch],
+                [pair[1] for pair in batch],
+                padding=True,
+                truncation=True,
+                max_length=MAX_SEQUENCE_LENGTH,
+                return_tensors="np"
+            )
+            feeds = {
+                name: encoded[name].astype(np.int64)
+                for name in self.input_names
+                if name in encoded
+            }
+            logits = self.session.run(["logits"], feeds)[0]
+            batch_scores = logits[:, 0] if logits.ndim == 2 else logits
+            if self.apply_sigmoid:
+                batch_scores = 1.0 / (1.0 + np.exp(-batch_scores))
+            scores.extend(float(score) for score in batch_scores)
+
+        return scores
+
+def load_onnx_cross_encoder(model_name: str, quantize: bool = True) -> Optional[OnnxCrossEncoder]:
+    """Load the ONNX backend, returning None if the runtime is unavailable."""
+    try:
+        return OnnxCrossEncoder(model_name, quantize=quantize)
+    except Exception as e:
+        print(f"Error initializing ONNX cross-encoder: {e}")
+        return None
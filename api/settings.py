@@ -9,6 +9,7 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     OPENAI_API_KEY: Optional[str] = None
     CLAUDE_API_KEY: Optional[str] = None
+    ADMIN_API_KEY: Optional[str] = None
     PUBLIC_SITE_ORIGIN: AnyHttpUrl = "https://whatismydelta.com"
     PUBLIC_API_BASE: str = ""
     APP_SCHEMA_VERSION: str = "v1"
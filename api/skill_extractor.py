@@ -0,0 +1,159 @@
+"""
+Skill Extraction Engine for Mosaic 2.0
+Compiles the skills taxonomy (canonical names plus synonyms) into a token-level
+Aho-Corasick automaton, so every skill in a job description is found in one
+linear pass and folded onto its canonical name.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SKILLS_TAXONOMY_PATH = Path(os.getenv("SKILLS_TAXONOMY_PATH", Path(__file__).resolve().parent.parent / "data" / "skills_taxonomy.json"))
+
+# Tokens keep '+', '#' and inner '.' so c++, c#, node.js and .net survive normalization
+_TOKEN_RE = re.compile(r"\.?[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased skill tokens with HTML tags stripped."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(_TAG_RE.sub(" ", text).lower())
+
+class SkillExtractor:
+    """Token-level Aho-Corasick matcher over the skills taxonomy."""
+
+    def __init__(self, taxonomy_path: Path = SKILLS_TAXONOMY_PATH):
+        self.taxonomy_path = Path(taxonomy_path)
+        self.categories: Dict[str, str] = {}
+        self.pattern_count = 0
+        # Automaton: goto[state][token] -> state, fail[state], output[state] = canonical skills
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+        self._load()
+
+    def _add_pattern(self, tokens: List[str], canonical: str):
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        if canonical not in self._output[state]:
+            self._output[state] += (canonical,)
+            self.pattern_count += 1
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                # Inherit matches that end at the failure state (suffix patterns)
+                self._output[child] += tuple(skill for skill in self._output[self._fail[child]]
+                                             if skill not in self._output[child])
+
+    def _load(self):
+        with open(self.taxonomy_path, "r") as f:
+            taxonomy = json.load(f)
+
+        for skill in taxonomy.get("skills", []):
+            canonical = skill["name"]
+            self.categories[canonical] = skill.get("category", "other")
+            patterns = list(skill.get("synonyms", []))
+            # Ambiguous names ("Go", "Excel") are ordinary words; only their synonyms match
+            if not skill.get("ambiguous"):
+                patterns.append(canonical)
+            for pattern in patterns:
+                tokens = tokenize(pattern)
+                if tokens:
+                    self._add_pattern(tokens, canonical)
+
+        self._build_failure_links()
+
+    def extract_tokens(self, tokens: List[str]) -> List[str]:
+        """Canonical skills in order of first occurrence (one pass over tokens)."""
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Dict[str, None] = {}
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for skill in output[state]:
+                found[skill] = None
+        return list(found)
+
+    def extract(self, text: str) -> List[str]:
+        return self.extract_tokens(tokenize(text))
+
+    def extract_batch(self, texts: Iterable[str]) -> List[List[str]]:
+        """Extract skills for many documents (ingestion path)."""
+        return [self.extract_tokens(tokenize(text)) for text in texts]
+
+    def enrich(self, jobs: Iterable[Any]) -> int:
+        """Merge skills found in title and description into each posting's skills list."""
+        count = 0
+        for job in jobs:
+            extracted = self.extract_tokens(tokenize(job.title) + tokenize(job.description))
+            if not extracted:
+                continue
+            existing = {skill.lower() for skill in job.skills or []}
+            job.skills = list(job.skills or []) + [skill for skill in extracted if skill.lower() not in existing]
+            count += 1
+        return count
+
+    def get_health_status(self) -> Dict[str, Any]:
+        return {
+            "taxonomy_path": str(self.taxonomy_path),
+            "skills": len(self.categories),
+            "patterns": self.pattern_count,
+            "automaton_states": len(self._goto)
+        }
+
+_extractor: Optional[SkillExtractor] = None
+_extractor_lock = threading.Lock()
+
+def get_skill_extractor() -> SkillExtractor:
+    """Shared extractor, compiled on first use."""
+    global _extractor
+    if _extractor is None:
+        with _extractor_lock:
+            if _extractor is None:
+                _extractor = SkillExtractor()
+    return _extractor
+
+def extract_skills(text: str) -> List[str]:
+    return get_skill_extractor().extract(text)
+
+def extract_skills_batch(texts: Iterable[str]) -> List[List[str]]:
+    return get_skill_extractor().extract_batch(texts)
+
+def enrich_job_skills(jobs: Iterable[Any]) -> int:
+    """Best-effort skill enrichment; a missing taxonomy never breaks a search."""
+    try:
+        return get_skill_extractor().enrich(jobs)
+    except Exception as e:
+        print(f"Skill enrichment failed: {e}")
+        return 0
+
+def get_skill_extractor_health() -> Dict[str, Any]:
+    try:
+        return get_skill_extractor().get_health_status()
+    except Exception as e:
+        return {"error": str(e)}
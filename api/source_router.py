@@ -0,0 +1,370 @@
+"""
+Statistics-based Job Source Router for Mosaic 2.0
+Ranks job sources for a search from logged outcomes (yield, success rate and
+latency) keyed by query-class features: skills and their categories, other
+keywords, remote or not, and country. Ranking is in-memory arithmetic, so
+source selection adds no network or LLM call to a search; RAG source discovery
+is only consulted, in the background, for query classes with no history.
+"""
+
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .job_sources.normalize import parse_location
+from .skill_extractor import extract_skills, get_skill_extractor
+from .storage import get_conn
+
+SOURCE_ROUTER_PRIOR_WEIGHT = float(os.getenv("SOURCE_ROUTER_PRIOR_WEIGHT", "5"))          # pseudo-searches behind each prior
+SOURCE_ROUTER_HALF_LIFE = float(os.getenv("SOURCE_ROUTER_HALF_LIFE", str(7 * 24 * 3600)))  # seconds for old outcomes to count half
+SOURCE_ROUTER_LATENCY_TARGET = float(os.getenv("SOURCE_ROUTER_LATENCY_TARGET", "2.0"))     # seconds; slower sources lose utility
+SOURCE_ROUTER_COLD_START = int(os.getenv("SOURCE_ROUTER_COLD_START", "3"))                 # searches before a keyword class is warm
+SOURCE_ROUTER_LLM_SEEDS_PER_HOUR = int(os.getenv("SOURCE_ROUTER_LLM_SEEDS_PER_HOUR", "20"))  # 0 disables LLM seeding
+SOURCE_ROUTER_TOP_K = int(os.getenv("SOURCE_ROUTER_TOP_K", "5"))                           # sources reported as optimal
+SOURCE_ROUTER_FLUSH_INTERVAL = float(os.getenv("SOURCE_ROUTER_FLUSH_INTERVAL", "30"))      # seconds between stats writes
+
+GLOBAL_FEATURE = "*"
+# Priors for a source nobody has observed yet
+DEFAULT_SUCCESS_RATE = 0.8
+DEFAULT_YIELD = 5.0
+DEFAULT_LATENCY = 1.5
+# An LLM recommendation counts as this many successful searches at full confidence
+SEED_WEIGHT = 2.0
+SEED_RESULTS = 10.0
+MAX_KEYWORDS = 3
+MAX_FEATURES = 50000            # distinct features tracked; new keywords beyond this are not learned
+RECORDED_STATUSES = {"ok", "error", "timeout"}   # cancelled/deadline/skipped say nothing about the source
+
+_TERM_RE = re.compile(r"[a-z0-9+#]+")
+_STOPWORDS = {
+    "a", "an", "and", "the", "of", "for", "in", "at", "to", "with", "or", "on",
+    "job", "jobs", "role", "roles", "position", "positions", "opening", "openings", "hiring",
+    "senior", "sr", "junior", "jr", "lead", "staff", "principal", "entry", "level", "mid",
+    "remote", "hybrid", "onsite", "full", "part", "time", "contract"
+}
+
+@dataclass
+class SourceStats:
+    """Exponentially decayed outcome counters for one (feature, source)."""
+    calls: float = 0.0
+    successes: float = 0.0
+    results: float = 0.0
+    latency: float = 0.0            # summed seconds
+    updated: float = field(default_factory=time.time)
+
+    def decay(self, now: float):
+        if now > self.updated:
+            factor = 0.5 ** ((now - self.updated) / SOURCE_ROUTER_HALF_LIFE)
+            self.calls *= factor
+            self.successes *= factor
+            self.results *= factor
+            self.latency *= factor
+            self.updated = now
+
+    def add(self, calls: float, successes: float, results: float, latency: float, now: float):
+        self.decay(now)
+        self.calls += calls
+        self.successes += successes
+        self.results += results
+        self.latency += latency
+
+@dataclass
+class Estimate:
+    success_rate: float
+    yield_: float
+    latency: float
+
+    def utility(self) -> float:
+        """Expected postings per call, discounted by how slow the source is."""
+        return self.success_rate * self.yield_ / (1.0 + self.latency / SOURCE_ROUTER_LATENCY_TARGET)
+
+@dataclass
+class SourceRoute:
+    """Ranked sources for one search."""
+    order: List[str]
+    scores: Dict[str, float]
+    features: List[str]
+    cold_start: bool
+
+    @property
+    def optimal(self) -> List[str]:
+        return self.order[:SOURCE_ROUTER_TOP_K]
+
+def _smoothed(stats: Optional[SourceStats], prior: Estimate, weight: float = SOURCE_ROUTER_PRIOR_WEIGHT) -> Estimate:
+    """Observed rates shrunk toward the prior by `weight` pseudo-searches."""
+    if stats is None or stats.calls <= 0:
+        return prior
+    calls = stats.calls + weight
+    successes = stats.successes + weight
+    return Estimate(
+        success_rate=(stats.successes + weight * prior.success_rate) / calls,
+        # yield and latency are per successful call
+        yield_=(stats.results + weight * prior.yield_) / successes,
+        latency=(stats.latency + weight * prior.latency) / calls
+    )
+
+def query_features(query: str, location: Optional[str] = None) -> List[str]:
+    """Query-class features: skills and their categories, other keywords, remote flag, country."""
+    features = []
+    skills = extract_skills(query or "")
+    categories = get_skill_extractor().categories
+    for skill in skills:
+        features.append(f"skill:{skill.lower()}")
+        features.append(f"cat:{categories.get(skill, 'other')}")
+    skill_terms = {term for skill in skills for term in _TERM_RE.findall(skill.lower())}
+    keywords = [term for term in _TERM_RE.findall((query or "").lower())
+                if term not in _STOPWORDS and term not in skill_terms and not term.isdigit()]
+    features.extend(f"kw:{term}" for term in keywords[:MAX_KEYWORDS])
+
+    place = parse_location(location) if location else None
+    remote = bool(place and place.remote) or "remote" in (query or "").lower()
+    features.append(f"remote:{'yes' if remote else 'no'}")
+    features.append(f"loc:{(place.country or 'unknown') if place else 'any'}")
+    return list(dict.fromkeys(features))
+
+def _is_keyword(feature: str) -> bool:
+    return feature.startswith(("skill:", "kw:"))
+
+class SourceRouter:
+    """Learns per-source yield and latency by query class and ranks sources from it."""
+
+    def __init__(self):
+        self.stats: Dict[Tuple[str, str], SourceStats] = {}
+        self.feature_searches: Dict[str, float] = {}
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.persistence_error: Optional[str] = None
+        self.dirty: set = set()
+        self.last_flush = time.time()
+        self.flushing = False
+        self.seeded: set = set()
+        self.seed_times: List[float] = []
+        self.total_routes = 0
+        self.cold_starts = 0
+        self.llm_seeds = 0
+        self.searches_recorded = 0
+        self.average_route_us = 0.0
+
+    def _load(self):
+        """Warm the in-memory stats from the last persisted state (once per process)."""
+        if self.loaded:
+            return
+        with self.lock:
+            if self.loaded:
+                return
+            self.loaded = True
+            try:
+                with get_conn() as conn:
+                    rows = conn.execute(
+                        "SELECT source_name, feature, calls, successes, results, latency_total, updated_at "
+                        "FROM source_route_stats"
+                    ).fetchall()
+            except Exception as e:
+                self.persistence_error = str(e)
+                print(f"Source router stats unavailable, learning in memory only: {e}")
+                return
+            for source, feature, calls, successes, results, latency, updated in rows:
+                self.stats[(feature, source)] = SourceStats(calls, successes, results, latency, updated)
+                if feature != GLOBAL_FEATURE:
+                    self.feature_searches[feature] = max(self.feature_searches.get(feature, 0.0), calls)
+
+    def _prior(self, source: str, now: float) -> Estimate:
+        default = Estimate(DEFAULT_SUCCESS_RATE, DEFAULT_YIELD, DEFAULT_LATENCY)
+        stats = self.stats.get((GLOBAL_FEATURE, source))
+        if stats is not None:
+            stats.decay(now)
+        return _smoothed(stats, default)
+
+    def estimate(self, source: str, features: List[str], now: Optional[float] = None) -> Estimate:
+        """Mean of the per-feature estimates, each shrunk toward the source's global estimate."""
+        now = now or time.time()
+        prior = self._prior(source, now)
+        estimates = []
+        for feature in features:
+            stats = self.stats.get((feature, source))
+            if stats is not None:
+                stats.decay(now)
+            estimates.append(_smoothed(stats, prior))
+        if not estimates:
+            return prior
+        n = len(estimates)
+        return Estimate(
+            success_rate=sum(e.success_rate for e in estimates) / n,
+            yield_=sum(e.yield_ for e in estimates) / n,
+            latency=sum(e.latency for e in estimates) / n
+        )
+
+    def is_cold(self, features: List[str]) -> bool:
+        """No keyword feature (or, for keyword-less queries, no feature) has enough logged searches."""
+        keywords = [feature for feature in features if _is_keyword(feature)] or features
+        return all(self.feature_searches.get(feature, 0.0) < SOURCE_ROUTER_COLD_START for feature in keywords)
+
+    def route(self, query: str, location: Optional[str], candidates: Iterable[str]) -> SourceRoute:
+        """Order candidate sources by expected utility; never blocks on I/O after the first load."""
+        self._load()
+        start = time.perf_counter()
+        features = query_features(query, location)
+        now = time.time()
+        candidates = list(candidates)
+        scores = {source: self.estimate(source, features, now).utility() for source in candidates}
+        # Stable sort keeps the caller's order between equally unknown sources
+        order = sorted(candidates, key=lambda source: -scores[source])
+        cold = self.is_cold(features)
+
+        self.total_routes += 1
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        self.average_route_us = elapsed_us if self.total_routes == 1 else self.average_route_us * 0.9 + elapsed_us * 0.1
+        if cold:
+            self.cold_starts += 1
+            self._schedule_seed(query, location, features)
+        return SourceRoute(order=order, scores={s: round(v, 3) for s, v in scores.items()},
+                           features=features, cold_start=cold)
+
+    def record(self, query: str, location: Optional[str], timings: Dict[str, Any]):
+        """Log a fan-out's per-source outcomes (SourceTiming objects) against the query's features."""
+        outcomes = [(name, timing) for name, timing in timings.items() if timing.status in RECORDED_STATUSES]
+        if not outcomes:
+            return
+        self._load()
+        features = query_features(query, location)
+        now = time.time()
+        with self.lock:
+            if len(self.feature_searches) >= MAX_FEATURES:
+                features = [feature for feature in features if feature in self.feature_searches]
+            for feature in features:
+                self.feature_searches[feature] = self.feature_searches.get(feature, 0.0) + 1
+            for name, timing in outcomes:
+                ok = timing.status == "ok"
+                for feature in [GLOBAL_FEATURE] + features:
+                    key = (feature, name)
+                    stats = self.stats.get(key)
+                    if stats is None:
+                        stats = self.stats[key] = SourceStats(updated=now)
+                    stats.add(1.0, 1.0 if ok else 0.0, float(timing.results) if ok else 0.0, timing.elapsed, now)
+                    self.dirty.add(key)
+            self.searches_recorded += 1
+        self._maybe_flush()
+
+    def _schedule_seed(self, query: str, location: Optional[str], features: List[str]):
+        """Ask RAG source discovery about an unseen query class, off the request path."""
+        if SOURCE_ROUTER_LLM_SEEDS_PER_HOUR <= 0:
+            return
+        class_key = "|".join(sorted(feature for feature in features if _is_keyword(feature))) or "|".join(features)
+        now = time.time()
+        with self.lock:
+            if class_key in self.seeded:
+                return
+            self.seed_times = [t for t in self.seed_times if now - t < 3600]
+            if len(self.seed_times) >= SOURCE_ROUTER_LLM_SEEDS_PER_HOUR:
+                return
+            self.seeded.add(class_key)
+            self.seed_times.append(now)
+        threading.Thread(target=self._seed, args=(query, location, features), daemon=True).start()
+
+    def _seed(self, query: str, location: Optional[str], features: List[str]):
+        try:
+            from .rag_source_discovery import discover_sources_for_query
+
+            discoveries = discover_sources_for_query(query, location)
+        except Exception as e:
+            print(f"Source router cold-start discovery failed: {e}")
+            return
+        now = time.time()
+        with self.lock:
+            for discovery in discoveries:
+                weight = SEED_WEIGHT * max(0.0, min(1.0, discovery.confidence))
+                for feature in features:
+                    if not _is_keyword(feature):
+                        continue
+                    key = (feature, discovery.source_name)
+                    stats = self.stats.get(key)
+                    if stats is None:
+                        stats = self.stats[key] = SourceStats(updated=now)
+                    # Pseudo-observations: real outcomes outweigh them after a few searches
+                    stats.add(weight, weight, weight * SEED_RESULTS, weight * DEFAULT_LATENCY, now)
+            self.llm_seeds += 1
+
+    def _maybe_flush(self, force: bool = False):
+        if self.persistence_error or not self.dirty or self.flushing:
+            return
+        if not force and time.time() - self.last_flush < SOURCE_ROUTER_FLUSH_INTERVAL:
+            return
+        self.flushing = True
+        if force:
+            self.flush()
+        else:
+            threading.Thread(target=self.flush, daemon=True).start()
+
+    def flush(self) -> int:
+        """Write the current state of every stats row touched since the last flush."""
+        with self.lock:
+            keys, self.dirty = self.dirty, set()
+            rows = [
+                (source, feature, stats.calls, stats.successes, stats.results, stats.latency, stats.updated)
+                for (feature, source), stats in ((key, self.stats[key]) for key in keys)
+            ]
+        try:
+            if rows:
+                with get_conn() as conn:
+                    conn.executemany(
+                        """INSERT INTO source_route_stats
+                           (source_name, feature, calls, successes, results, latency_total, updated_at)
+                           VALUES (?, ?, ?, ?, ?, ?, ?)
+                           ON CONFLICT(source_name, feature) DO UPDATE SET
+                               calls = excluded.calls, successes = excluded.successes,
+                               results = excluded.results, latency_total = excluded.latency_total,
+                               updated_at = excluded.updated_at""",
+                        rows
+                    )
+            return len(rows)
+        except Exception as e:
+            self.persistence_error = str(e)
+            print(f"Source router stats write failed, keeping stats in memory: {e}")
+            return 0
+        finally:
+            self.last_flush = time.time()
+            self.flushing = False
+
+    def get_health_status(self) -> Dict[str, Any]:
+        with self.lock:
+            sources = sorted({source for feature, source in self.stats if feature == GLOBAL_FEATURE})
+        now = time.time()
+        return {
+            "features_tracked": len(self.feature_searches),
+            "stats_rows": len(self.stats),
+            "searches_recorded": self.searches_recorded,
+            "total_routes": self.total_routes,
+            "cold_starts": self.cold_starts,
+            "llm_seeds": self.llm_seeds,
+            "average_route_us": round(self.average_route_us, 1),
+            "persistence_error": self.persistence_error,
+            "sources": {
+                source: {
+                    "success_rate": round(estimate.success_rate, 3),
+                    "yield": round(estimate.yield_, 2),
+                    "latency_s": round(estimate.latency, 3)
+                }
+                for source in sources
+                for estimate in [self._prior(source, now)]
+            }
+        }
+
+# Global source router instance
+source_router = SourceRouter()
+
+def route_sources(query: str, location: Optional[str], candidates: Iterable[str]) -> SourceRoute:
+    """Rank candidate sources for a search from logged outcomes."""
+    return source_router.route(query, location, candidates)
+
+def record_search_outcome(query: str, location: Optional[str], timings: Dict[str, Any]):
+    """Feed a fan-out's per-source timings back into the router (best effort)."""
+    try:
+        source_router.record(query, location, timings)
+    except Exception as e:
+        print(f"Source router record failed: {e}")
+
+def get_source_router_health() -> Dict[str, Any]:
+    return source_router.get_health_status()
@@ -445,6 +445,18 @@ def list_files(session_id: str) -> List[Dict[str, Any]]:
     return [dict(row) for row in rows]
 
 
+def list_file_paths(session_id: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """Most recent uploads with their on-disk paths (for server-side processing only)."""
+    with get_conn() as conn:
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor.execute(
+            "SELECT filename, file_path, file_type FROM file_uploads WHERE session_id = %s ORDER BY created_at DESC LIMIT %s",
+            (session_id, limit),
+        )
+        rows = cursor.fetchall()
+    return [dict(row) for row in rows]
+
+
 def delete_session(session_id: str) -> None:
     """Delete a session and all related data (used for logout)"""
     with get_conn() as conn:
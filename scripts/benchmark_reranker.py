@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark cross-encoder reranker backends on CPU.
+Compares PyTorch (sentence-transformers) against ONNX Runtime fp32/int8 on
+latency per 50 (query, document) pairs and ranking agreement with PyTorch.
+
+Usage:
+    RERANKER_ONNX_DIR=data/models/reranker-onnx \
+        python scripts/benchmark_reranker.py [--pairs pairs.json] [--iterations 20]
+
+pairs.json (optional): [{"query": "...", "documents": ["...", ...]}, ...]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Add parent directory to path to import api modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+DEFAULT_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+PAIRS_PER_CALL = 50
+TOP_K = 12
+
+SAMPLE_QUERIES = [
+    "senior python backend engineer remote",
+    "product manager for climate tech startup",
+    "data analyst with sql and dashboards",
+]
+
+SAMPLE_DOCUMENTS = [
+    "Backend Engineer (Python, FastAPI) - fully remote team building payments APIs",
+    "Senior Product Manager - renewable energy marketplace, hybrid in Berlin",
+    "Data Analyst - SQL, Looker and stakeholder reporting for retail operations",
+    "Frontend Developer - React and TypeScript for a design tools company",
+    "Machine Learning Engineer - ranking and recommendation systems in PyTorch",
+    "Customer Success Manager - onboarding enterprise SaaS accounts",
+    "DevOps Engineer - Kubernetes, Terraform and observability on AWS",
+    "Climate Policy Researcher - carbon markets and emissions accounting",
+    "Technical Writer - API documentation for developer platforms",
+    "Site Reliability Engineer - on-call, incident response and SLOs",
+]
+
+def _load_pairs(path: str = None) -> List[List[Tuple[str, str]]]:
+    """Build batches of exactly PAIRS_PER_CALL pairs, one batch per query."""
+    if path:
+        with open(path, "r") as f:
+            raw = json.load(f)
+        groups = [(item["query"], item["documents"]) for item in raw]
+    else:
+        groups = [(query, SAMPLE_DOCUMENTS) for query in SAMPLE_QUERIES]
+
+    batches = []
+    for query, documents in groups:
+        docs = [documents[i % len(documents)] for i in range(PAIRS_PER_CALL)]
+        batches.append([(query, doc) for doc in docs])
+    return batches
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+def _kendall_tau(a: List[float], b: List[float]) -> float:
+    """Kendall rank correlation between two score lists (tau-a)."""
+    concordant = discordant = 0
+    for i in range(len(a)):
+        for j in range(i + 1, len(a)):
+            sign = (a[i] - a[j]) * (b[i] - b[j])
+            if sign > 0:
+                concordant += 1
+            elif sign < 0:
+                discordant += 1
+    total = len(a) * (len(a) - 1) / 2
+    return (concordant - discordant) / total if total else 1.0
+
+def _top_k_overlap(a: List[float], b: List[float], k: int = TOP_K) -> float:
+    top_a = set(sorted(range(len(a)), key=lambda i: a[i], reverse=True)[:k])
+    top_b = set(sorted(range(len(b)), key=lambda i: b[i], reverse=True)[:k])
+    return len(top_a & top_b) / float(min(k, len(a)) or 1)
+
+def _time_backend(predict: Callable, batches: List[List[Tuple[str, str]]], iterations: int) -> Dict:
+    predict(batches[0])  # warm-up (graph optimization, lazy allocations)
+    latencies = []
+    scores = []
+    for _ in range(iterations):
+        for batch in batches:
+            start = time.perf_counter()
+            predict(batch)
+            latencies.append((time.perf_counter() - start) * 1000)
+    for batch in batches:
+        scores.append([float(s) for s in predict(batch)])
+    return {
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "scores": scores,
+    }
+
+def run_benchmark(pairs_path: str = None, iterations: int = 20, model_name: str = DEFAULT_MODEL) -> Dict:
+    """Run every available backend and compare against PyTorch."""
+    from sentence_transformers import CrossEncoder
+    from api.reranker_onnx import OnnxCrossEncoder
+
+    batches = _load_pairs(pairs_path)
+
+    backends = {"torch": CrossEncoder(model_name, device="cpu").predict}
+    for label, quantize in (("onnx_fp32", False), ("onnx_int8", True)):
+        try:
+            backends[label] = OnnxCrossEncoder(model_name, quantize=quantize).predict
+        except Exception as e:
+            print(f"Skipping {label}: {e}")
+
+    results = {name: _time_backend(predict, batches, iterations) for name, predict in backends.items()}
+
+    baseline = results["torch"]
+    report = {"model": model_name, "pairs_per_call": PAIRS_PER_CALL, "iterations": iterations, "backends": {}}
+    for name, result in results.items():
+        taus = [_kendall_tau(ref, got) for ref, got in zip(baseline["scores"], result["scores"])]
+        overlaps = [_top_k_overlap(ref, got) for ref, got in zip(baseline["scores"], result["scores"])]
+        report["backends"][name] = {
+            "mean_ms_per_50": round(result["mean_ms"], 2),
+            "p50_ms_per_50": round(result["p50_ms"], 2),
+            "p95_ms_per_50": round(result["p95_ms"], 2),
+            "speedup_vs_torch": round(baseline["mean_ms"] / result["mean_ms"], 2) if result["mean_ms"] else None,
+            "kendall_tau_vs_torch": round(statistics.mean(taus), 4),
+            f"top{TOP_K}_overlap_vs_torch": round(statistics.mean(overlaps), 4),
+        }
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark reranker backends")
+    parser.add_argument("--pairs", help="JSON file of queries and documents")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    args = parser.parse_args()
+
+    print(json.dumps(run_benchmark(args.pairs, args.iterations, args.model), indent=2))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Offline reranker evaluation.
+Runs a labeled query/document set through first-stage retrieval with and
+without reranking and writes a JSON report that can be diffed between runs.
+
+Usage:
+    python scripts/evaluate_reranker.py --eval-set data/rerank_eval/sample_set.json \
+        --output reports/rerank_eval.json [--first-stage lexical|embedding] \
+        [--budget-ms 250] [--force-rerank] [--no-rerank] [--allow-mock]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import api modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.rerank_eval import RerankEvaluator, load_eval_set, write_report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate reranking quality and latency offline")
+    parser.add_argument("--eval-set", default="data/rerank_eval/sample_set.json")
+    parser.add_argument("--output", help="Write the JSON report here (stdout if omitted)")
+    parser.add_argument("--first-stage", default="lexical", choices=["lexical", "embedding"])
+    parser.add_argument("--k", type=int, nargs="+", default=[5, 10])
+    parser.add_argument("--budget-ms", type=float, help="Override the per-request rerank budget")
+    parser.add_argument("--force-rerank", action="store_true", help="Disable the decisive-margin skip")
+    parser.add_argument("--no-rerank", action="store_true", help="Only evaluate first-stage retrieval")
+    parser.add_argument("--allow-mock", action="store_true",
+                        help="Run even without a loaded cross-encoder (reported as reranked_mock)")
+    args = parser.parse_args()
+
+    evaluator = RerankEvaluator(
+        first_stage=args.first_stage,
+        k_values=args.k,
+        budget_ms=args.budget_ms,
+        force_rerank=args.force_rerank,
+        allow_mock=args.allow_mock
+    )
+    report = evaluator.evaluate(load_eval_set(args.eval_set), with_rerank=not args.no_rerank)
+
+    if args.output:
+        write_report(report, args.output)
+        print(f"✅ Report written to {args.output}")
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
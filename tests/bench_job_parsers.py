@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: job source parse paths over recorded fixtures
+Replays tests/fixtures/job_sources through every adapter (JSON, RSS via
+ElementTree, HTML via BeautifulSoup) with caches cleared between runs and
+reports postings/sec and peak allocations per run. No network access.
+
+    python tests/bench_job_parsers.py [--iterations 50] [--source dice] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources.http import set_http_mode
+from api.job_sources.replay import (
+    FIXTURES_DIR, create_source, fixture_sources, load_cases, reset_source_caches, run_case
+)
+
+def fixture_format(name: str) -> str:
+    """json / rss / html, from the content type of the source's recorded responses."""
+    for path in sorted((FIXTURES_DIR / name).glob("*.json")):
+        if path.name == "cases.json":
+            continue
+        with open(path, "r") as f:
+            content_type = json.load(f).get("headers", {}).get("Content-Type", "")
+        for marker, label in (("json", "json"), ("xml", "rss"), ("rss", "rss"), ("html", "html")):
+            if marker in content_type:
+                return label
+    return "unknown"
+
+def bench_source(name: str, iterations: int) -> dict:
+    source = create_source(name)
+    cases = load_cases(name)
+
+    def run_all():
+        count = 0
+        for case in cases:
+            reset_source_caches(source)
+            count += len(run_case(source, case))
+        return count
+
+    postings = run_all()  # warm-up (imports, fixture cache)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        run_all()
+    elapsed = time.perf_counter() - start
+
+    # Separate pass so tracing overhead does not skew timings
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    run_all()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "source": name,
+        "format": fixture_format(name),
+        "postings_per_run": postings,
+        "ms_per_run": round(elapsed / iterations * 1000, 3),
+        "postings_per_sec": round(postings * iterations / elapsed, 1) if elapsed else 0.0,
+        "peak_alloc_kib": round((peak - before) / 1024, 1),
+        "retained_kib": round((current - before) / 1024, 1)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job source parsers over recorded fixtures")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--source", action="append", help="limit to one or more sources")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    set_http_mode("replay")
+    results = [bench_source(name, args.iterations) for name in (args.source or fixture_sources())]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'source':<16}{'format':<8}{'postings':>9}{'ms/run':>10}{'postings/s':>13}{'peak KiB':>10}{'kept KiB':>10}")
+    for r in results:
+        print(f"{r['source']:<16}{r['format']:<8}{r['postings_per_run']:>9}{r['ms_per_run']:>10}"
+              f"{r['postings_per_sec']:>13}{r['peak_alloc_kib']:>10}{r['retained_kib']:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""
+Shared JobPosting factory for job source tests
+"""
+import os
+import sys
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources.base import JobPosting
+
+def make_job(job_id, title="Python Engineer", source="test", company="Acme", location="Remote",
+             description="", url=None, **fields):
+    """A posting with neutral defaults; any other JobPosting field can be passed by keyword."""
+    return JobPosting(id=job_id, title=title, company=company, location=location, description=description,
+                      url=f"https://{source}.example/{job_id}" if url is None else url, source=source, **fields)
@@ -5,6 +5,7 @@ Tests all job sources with realistic user queries based on persona framework
 """
 
 import json
+import os
 import sys
 import time
 import requests
@@ -12,8 +13,8 @@ from datetime import datetime
 from typing import Dict, List
 from dataclasses import dataclass, asdict
 
-# Base API URL
-API_BASE = "https://what-is-my-delta-site-production.up.railway.app"
+# Base API URL (point at a local server; offline parser checks live in bench_job_parsers.py)
+API_BASE = os.getenv("MOSAIC_API_BASE", "https://what-is-my-delta-site-production.up.railway.app")
 
 @dataclass
 class TestPersona:
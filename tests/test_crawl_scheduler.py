@@ -0,0 +1,159 @@
+"""
+Tests for per-source token buckets and the persistent crawl queue
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import httpx
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources import http
+from api.job_sources.base import JobPosting, feed_cache
+from api.job_sources.crawl_queue import CrawlQueue, CrawlScheduler
+from api.job_sources.hackernews import HackerNewsSource
+from api.job_sources.rate_limits import BACKGROUND, HOT, INTERACTIVE, TokenBucket, rate_limiter, request_priority
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class FakeSource:
+    """Records the order and priority of its searches."""
+
+    self_indexed = False
+
+    def __init__(self, name, log, rate_limit=6000):
+        self.name = name
+        self.log = log
+        self.rate_limit = rate_limit
+
+    def search_jobs(self, query, location=None, limit=10):
+        self.log.append((self.name, query, request_priority.get()))
+        return [JobPosting(id=f"{self.name}_{query}", title=query, company="Acme", location="Remote",
+                           description="", url="", source=self.name)]
+
+class TestTokenBucket(unittest.TestCase):
+    """Refill, per-class reserves and interactive precedence"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.bucket = TokenBucket("test", 60, clock=self.clock)  # 1/s, burst of 10
+
+    def test_reserves_keep_tokens_for_urgent_classes(self):
+        granted = 0
+        while self.bucket.try_acquire(BACKGROUND):
+            granted += 1
+        self.assertEqual(granted, 5)  # half the burst is reserved
+        self.assertTrue(self.bucket.try_acquire(HOT))
+        self.assertGreater(self.bucket.wait_time(BACKGROUND), 0)
+        while self.bucket.try_acquire(INTERACTIVE):
+            pass
+        self.assertEqual(self.bucket.wait_time(INTERACTIVE), 1.0)
+        self.clock.now += 1.0
+        self.assertTrue(self.bucket.try_acquire(INTERACTIVE))
+
+    def test_waiting_interactive_request_blocks_background(self):
+        self.bucket.interactive_waiting = 1
+        self.assertFalse(self.bucket.try_acquire(BACKGROUND))
+        self.assertTrue(self.bucket.try_acquire(INTERACTIVE))
+        self.bucket.interactive_waiting = 0
+        self.assertTrue(self.bucket.try_acquire(BACKGROUND))
+
+    def test_interactive_acquire_times_out(self):
+        while self.bucket.try_acquire(INTERACTIVE):
+            pass
+        self.assertFalse(self.bucket.acquire(INTERACTIVE, timeout=0))
+        self.assertEqual(self.bucket.denied, 1)
+
+def _hn_response(request):
+    if request.url.path.endswith("/jobstories.json"):
+        return httpx.Response(200, json=list(range(1, 41)))
+    item_id = int(request.url.path.rsplit("/", 1)[-1].split(".")[0])
+    return httpx.Response(200, json={"id": item_id, "title": f"Acme (Remote) | Python Engineer {item_id}",
+                                     "text": "Python services", "time": 1700000000})
+
+class TestBatchedTokens(unittest.TestCase):
+    """A search's item fan-out is charged as one request"""
+
+    def test_back_to_back_hn_searches_return_full_pages(self):
+        rate_limiter._buckets.pop("hackernews", None)
+        source = HackerNewsSource()
+
+        async def search_twice():
+            http._async_clients[asyncio.get_running_loop()] = httpx.AsyncClient(
+                transport=httpx.MockTransport(_hn_response))
+            pages = []
+            for _ in range(2):
+                # Nothing cached, so both searches fetch every item
+                feed_cache.clear()
+                source.item_cache.clear()
+                pages.append(await source.asearch_jobs("python", limit=10))
+            return pages
+
+        try:
+            pages = asyncio.run(search_twice())
+        finally:
+            http.close_http_session()
+        self.assertEqual([len(page) for page in pages], [10, 10])
+        self.assertEqual(rate_limiter.bucket("hackernews", source.rate_limit).denied, 0)
+
+class TestCrawlScheduler(unittest.TestCase):
+    """Fair interleaving, priority classes and persistence"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "crawl_queue.db"
+        self.queue = CrawlQueue(self.path)
+        self.log = []
+        self.sources = {name: FakeSource(name, self.log) for name in ("crawl_test_a", "crawl_test_b")}
+        self.written = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _handler(self, source_name, jobs):
+        self.written.extend(jobs)
+        return len(jobs)
+
+    def test_sources_are_interleaved(self):
+        self.queue.enqueue([("crawl_test_a", q, None) for q in ("q1", "q2", "q3")], recurring=True)
+        self.queue.enqueue([("crawl_test_b", q, None) for q in ("q1", "q2", "q3")], recurring=True)
+        summary = CrawlScheduler(self.queue, concurrency=1).drain(self.sources, self._handler, 10, 3600)
+        self.assertEqual([name for name, _, _ in self.log], ["crawl_test_a", "crawl_test_b"] * 3)
+        self.assertEqual(summary["crawl_test_a"]["upserted"], 3)
+        self.assertEqual(len(self.written), 6)
+        # Recurring tasks stay queued for the next pass
+        self.assertEqual(self.queue.stats()["due"], 0)
+        self.assertEqual(self.queue.stats()["tasks"], 6)
+
+    def test_hot_tasks_run_first_at_their_priority(self):
+        self.queue.enqueue([("crawl_test_a", "seed", None)], priority=BACKGROUND, recurring=True)
+        self.queue.enqueue([("crawl_test_a", "user query", "Berlin")], priority=HOT, expedite=True)
+        CrawlScheduler(self.queue, concurrency=1).drain(self.sources, self._handler, 10, 3600)
+        self.assertEqual(self.log, [("crawl_test_a", "user query", HOT), ("crawl_test_a", "seed", BACKGROUND)])
+        # The one-shot hot task is gone, the seed remains
+        self.assertEqual(self.queue.stats()["tasks"], 1)
+
+    def test_queue_survives_restart_and_stop(self):
+        self.queue.enqueue([("crawl_test_a", q, None) for q in ("q1", "q2")], recurring=True)
+        stop = threading.Event()
+        stop.set()
+        CrawlScheduler(self.queue).drain(self.sources, self._handler, 10, 3600, stop)
+        self.assertEqual(self.log, [])
+        reopened = CrawlQueue(self.path)
+        self.assertEqual(reopened.stats()["due"], 2)
+        CrawlScheduler(reopened).drain(self.sources, self._handler, 10, 3600)
+        self.assertEqual(len(self.log), 2)
+
+if __name__ == '__main__':
+    unittest.main()
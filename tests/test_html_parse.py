@@ -0,0 +1,78 @@
+"""
+Tests for scraping-source card extraction
+"""
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.compute_pool import ComputePool
+from api.job_sources import html_parse
+from api.job_sources.html_parse import CardSpec, parse_cards_inline
+
+PAGE = b"""<html><body>
+<div class="card featured"><a class="card-title-link" href="/job/1"> Python <b>Engineer</b> </a>
+  <a class="card-company">Acme</a><span class="location">Remote</span></div>
+<div class="card"><a class="card-title-link" href="/job/2">Designer</a></div>
+<div class="cards"><a class="card-title-link" href="/job/3">Not a card</a></div>
+</body></html>"""
+
+SPEC = CardSpec.build(
+    'div.card',
+    title='a.card-title-link',
+    href=('a.card-title-link', 'href'),
+    company='.card-company',
+    location='span.location'
+)
+
+class TestCardExtraction(unittest.TestCase):
+    """lxml and BeautifulSoup backends agree"""
+
+    def _parse(self, backend):
+        previous = html_parse.HTML_PARSER_BACKEND
+        html_parse.HTML_PARSER_BACKEND = backend
+        try:
+            return parse_cards_inline(PAGE, SPEC, 10)
+        finally:
+            html_parse.HTML_PARSER_BACKEND = previous
+
+    def test_backends_extract_the_same_cards(self):
+        expected = [
+            {"title": "Python Engineer", "href": "/job/1", "company": "Acme", "location": "Remote"},
+            {"title": "Designer", "href": "/job/2", "company": None, "location": None},
+        ]
+        self.assertEqual(self._parse("bs4"), expected)
+        if html_parse.LXML_AVAILABLE:
+            self.assertEqual(self._parse("lxml"), expected)
+
+    def test_rejects_unsupported_selectors(self):
+        with self.assertRaises(ValueError):
+            CardSpec.build('div > a', title='a')
+
+class TestOffloadBackPressure(unittest.TestCase):
+    """A saturated compute pool skips the page instead of parsing it on the caller"""
+
+    def setUp(self):
+        # Every slot taken, so submit gives up after acquire_timeout without starting workers
+        self.pool = ComputePool(workers=1, max_pending=1, acquire_timeout=0.01)
+        self.pool._slots.acquire()
+        patches = [
+            mock.patch("api.compute_pool.compute_pool", self.pool),
+            mock.patch.object(html_parse, "HTML_PARSE_OFFLOAD_BYTES", 0),
+            mock.patch.object(html_parse, "parse_cards_inline", side_effect=AssertionError("parsed inline")),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_busy_pool_skips_page(self):
+        self.assertEqual(html_parse.parse_cards(PAGE, SPEC, 10), [])
+        self.assertEqual(asyncio.run(html_parse.aparse_cards(PAGE, SPEC, 10)), [])
+        self.assertEqual(self.pool.total_rejected, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Tests for cross-source job deduplication
+"""
+import os
+import sys
+import unittest
+from functools import partial
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources.dedupe import (
+    SIMHASH_MAX_DISTANCE, canonical_company, cluster_jobs, dedupe_jobs, hamming_distance, normalize_location,
+    normalize_title, simhash
+)
+from tests.job_fixtures import make_job
+
+# A full-length posting: short texts make every SimHash comparison look close
+DESCRIPTION = (
+    "Stripe is a financial infrastructure platform for businesses. Millions of companies, from the "
+    "world's largest enterprises to the most ambitious startups, use Stripe to accept payments, grow "
+    "their revenue and accelerate new business opportunities. Our mission is to increase the GDP of "
+    "the internet, and we have a staggering amount of work ahead. "
+    "About the team: the Payments Platform team builds the core systems that move money for every "
+    "Stripe user. We own the services that authorize, capture and settle charges across dozens of "
+    "payment methods and currencies, and we hold ourselves to a very high bar for availability, "
+    "correctness and latency. "
+    "What you will do: design, build and operate backend services in Ruby, Java and Go that process "
+    "billions of dollars each year. Write clear technical designs and review them with engineers "
+    "across the company. Improve the reliability of critical paths by adding observability, load "
+    "testing and graceful degradation. Partner with product managers and designers to scope new "
+    "features and ship them incrementally. Mentor other engineers and help grow a healthy, "
+    "inclusive team culture. Participate in a shared on-call rotation and lead incident reviews "
+    "that turn outages into lasting improvements. "
+    "Who you are: you have at least five years of experience building and running distributed "
+    "systems in production. You are comfortable with relational databases, message queues and "
+    "caching, and you know how to reason about consistency and failure. You write code that other "
+    "people enjoy reading, and you care about testing, documentation and operational excellence. "
+    "You communicate clearly in writing and enjoy working with people across functions and time "
+    "zones. Experience with payments, banking or other regulated domains is a plus but not required. "
+    "Benefits: competitive salary and equity, comprehensive health coverage, a generous parental "
+    "leave policy, a learning and development stipend, flexible time off and a hybrid work model "
+    "with offices in San Francisco, Seattle, New York and Dublin. We welcome applicants of all "
+    "backgrounds and are committed to building a diverse and inclusive workplace."
+)
+
+# One Stripe posting as different boards list it
+stripe_job = partial(make_job, title="Backend Engineer", company="Stripe", location="San Francisco, CA",
+                     description=DESCRIPTION)
+
+class TestNormalization(unittest.TestCase):
+    """Fingerprint components"""
+
+    def test_title_abbreviations_and_noise(self):
+        self.assertEqual(normalize_title("Sr. Backend Eng (Remote)"), "senior backend engineer")
+
+    def test_company_suffixes(self):
+        self.assertEqual(canonical_company("Stripe, Inc."), canonical_company("stripe"))
+
+    def test_location(self):
+        self.assertEqual(normalize_location("San Francisco, CA"), "san francisco")
+        self.assertEqual(normalize_location("Remote - US"), "remote")
+        self.assertEqual(normalize_location("See description"), "")
+
+    def test_simhash_near_duplicates(self):
+        original = simhash(DESCRIPTION)
+        for old, new in [("Dublin", "London"), ("five years", "four years"),
+                         (" but not required", ""), ("Ruby, Java and Go", "Ruby and Go")]:
+            with self.subTest(edit=old):
+                edited = simhash(DESCRIPTION.replace(old, new))
+                self.assertLessEqual(hamming_distance(original, edited), SIMHASH_MAX_DISTANCE)
+        self.assertIsNone(simhash("too short"))
+
+    def test_simhash_separates_different_roles(self):
+        other = DESCRIPTION.split("What you will do:")[0] + (
+            "What you will do: research how businesses discover and adopt Stripe products through "
+            "interviews, usability studies and surveys, then turn the findings into clear product "
+            "recommendations, journey maps and prototypes that shape the roadmap for our dashboard "
+            "and onboarding flows."
+        )
+        self.assertGreater(hamming_distance(simhash(DESCRIPTION), simhash(other)), SIMHASH_MAX_DISTANCE)
+
+class TestDedupe(unittest.TestCase):
+    """Clustering and representative selection"""
+
+    def test_cross_source_duplicates_collapse_to_richest(self):
+        jobs = [
+            stripe_job("greenhouse_1", source="greenhouse"),
+            stripe_job("linkedin_9", source="linkedin", title="Backend Engineer", company="Stripe Inc",
+                       location="San Francisco", salary_range="$180k - $220k"),
+            stripe_job("indeed_4", source="indeed", title="Backend Engineer (Hybrid)", company="Stripe",
+                       description=DESCRIPTION.replace("Dublin", "London")),
+        ]
+        result = dedupe_jobs(jobs)
+
+        self.assertEqual([job.id for job in result], ["linkedin_9"])
+        alternates = result[0].metadata["alternates"]
+        self.assertEqual([alt["id"] for alt in alternates], ["greenhouse_1", "indeed_4"])
+        # Inputs are not mutated
+        self.assertNotIn("alternates", jobs[1].metadata)
+
+    def test_same_role_in_different_cities_kept(self):
+        jobs = [stripe_job("a", source="greenhouse"),
+                stripe_job("b", source="greenhouse", location="New York, NY")]
+        self.assertEqual(len(dedupe_jobs(jobs)), 2)
+
+    def test_shared_boilerplate_different_titles_kept(self):
+        jobs = [stripe_job("a", source="greenhouse"), stripe_job("b", source="lever", title="Product Designer")]
+        self.assertEqual(len(dedupe_jobs(jobs)), 2)
+
+    def test_unknown_location_matches_by_description(self):
+        jobs = [stripe_job("a", source="greenhouse"),
+                stripe_job("b", source="hackernews", location="See description")]
+        result = dedupe_jobs(jobs)
+        self.assertEqual(len(result), 1)
+
+    def test_near_identical_descriptions_cluster_by_simhash(self):
+        # Titles and locations differ as written, so only the description match can join them
+        jobs = [stripe_job("a", source="greenhouse"),
+                stripe_job("b", source="linkedin", title="Sr. Backend Engineer", location="See description",
+                           description=DESCRIPTION.replace("Dublin", "London"))]
+        self.assertEqual(cluster_jobs(jobs), [[0, 1]])
+        self.assertEqual(len(dedupe_jobs(jobs)), 1)
+
+    def test_exact_id_repeats_dropped(self):
+        self.assertEqual(len(dedupe_jobs([stripe_job("a", source="x"), stripe_job("a", source="x")])), 1)
+
+if __name__ == '__main__':
+    unittest.main()
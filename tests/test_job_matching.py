@@ -0,0 +1,50 @@
+"""
+Tests for profile building from session uploads
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api import job_matching
+from api.job_matching import JobMatcher
+
+class TestUploadCache(unittest.TestCase):
+    """Uploads are parsed once until the file changes"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "resume.txt"
+        self.path.write_text("Python engineer with Django experience")
+        self.matcher = JobMatcher()
+        patch = mock.patch.object(job_matching, "_read_upload", wraps=job_matching._read_upload)
+        self.read_upload = patch.start()
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_unchanged_upload_is_not_reparsed(self):
+        for _ in range(3):
+            self.assertEqual(self.matcher.upload_text(self.path, "text/plain"),
+                             "Python engineer with Django experience")
+        self.assertEqual(self.read_upload.call_count, 1)
+
+    def test_rewritten_upload_is_reparsed(self):
+        self.matcher.upload_text(self.path, "text/plain")
+        self.path.write_text("Data scientist working in pandas and PyTorch")
+        self.assertEqual(self.matcher.upload_text(self.path, "text/plain"),
+                         "Data scientist working in pandas and PyTorch")
+        self.assertEqual(self.read_upload.call_count, 2)
+
+    def test_missing_upload_is_empty(self):
+        self.assertEqual(self.matcher.upload_text(Path(self.tmp.name) / "gone.pdf", "application/pdf"), "")
+        self.read_upload.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests for location/salary normalization and the indexed radius and salary filters
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources.job_index import JobIndex
+from api.job_sources.normalize import parse_location, parse_salary
+from tests.job_fixtures import make_job
+
+class TestParsing(unittest.TestCase):
+    """Free-text locations and salaries"""
+
+    def test_locations(self):
+        austin = parse_location("Austin, TX 78701")
+        self.assertEqual((austin.city, austin.region, austin.country), ("Austin", "TX", "US"))
+        self.assertTrue(austin.geohash.startswith("9v6"))
+        # A region code that matches the city beats a country with the same code
+        self.assertEqual(parse_location("San Francisco, CA").country, "US")
+        self.assertEqual(parse_location("Toronto, ON, CA").country, "CA")
+        self.assertEqual(parse_location("Cambridge, UK").country, "GB")
+        remote = parse_location("Remote - US")
+        self.assertTrue(remote.remote)
+        self.assertEqual((remote.city, remote.country), (None, "US"))
+
+    def test_salaries(self):
+        salary = parse_salary("$120k - $150k")
+        self.assertEqual((salary.min, salary.max, salary.currency, salary.period), (120000, 150000, "USD", "year"))
+        hourly = parse_salary("$60/hr")
+        self.assertEqual((hourly.period, hourly.annual_min), ("hour", 60 * 2080))
+        self.assertEqual(parse_salary("CAD 90-110K").currency, "CAD")
+        self.assertEqual(parse_salary("€4.500 - €5.500 per month").annual_max, 66000)
+        self.assertIsNone(parse_salary("Competitive, DOE"))
+
+    def test_grouped_amounts(self):
+        spaced = parse_salary("£45 000 - 50 000")
+        self.assertEqual((spaced.min, spaced.max, spaced.currency), (45000, 50000, "GBP"))
+        self.assertEqual(parse_salary("€1.234,56 per month").min, 1234.56)
+        self.assertEqual(parse_salary("$1,234.50/week").min, 1234.5)
+        self.assertEqual(parse_salary("€45.000 - €52.500,00").max, 52500)
+
+class TestIndexedFilters(unittest.TestCase):
+    """Radius and salary-range filters on a temporary JobIndex"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "jobs.db"
+        self.index = JobIndex(self.path)
+        self.index.upsert([
+            make_job("austin", location="Austin, TX", salary_range="$130,000 - $160,000"),
+            make_job("paris", location="Paris, France", salary_range="€45 000 - 50 000"),
+            make_job("san-antonio", location="San Antonio, TX", salary_range="$50/hour"),
+            make_job("dallas", location="Dallas, TX", salary_range="$90k-$110k"),
+            make_job("london", location="London, UK", salary_range="£70,000 - £90,000"),
+            make_job("remote", location="Remote - US", salary_range="$140k"),
+        ])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _ids(self, **kwargs):
+        jobs, total = self.index.search("python", limit=20, **kwargs)
+        self.assertEqual(total, len(jobs))
+        return {job.id for job in jobs}
+
+    def test_location_and_radius(self):
+        self.assertEqual(self._ids(location="Texas"), {"austin", "san-antonio", "dallas"})
+        # San Antonio is ~118 km from Austin, Dallas ~300 km
+        self.assertEqual(self._ids(location="Austin, TX", radius_km=150), {"austin", "san-antonio"})
+        self.assertEqual(self._ids(location="Austin, TX", radius_km=400), {"austin", "san-antonio", "dallas"})
+        self.assertEqual(self._ids(location="Remote"), {"remote"})
+
+    def test_salary_range(self):
+        self.assertEqual(self._ids(salary_min=120000), {"austin", "remote"})
+        self.assertEqual(self._ids(salary_min=100000, salary_max=125000), {"dallas", "san-antonio"})
+        self.assertEqual(self._ids(salary_min=60000, currency="GBP"), {"london"})
+        # Space-grouped amounts index like any other
+        self.assertEqual(self._ids(salary_min=40000, currency="EUR"), {"paris"})
+
+    def test_existing_index_is_migrated(self):
+        legacy = Path(self.tmp.name) / "legacy.db"
+        conn = sqlite3.connect(legacy)
+        conn.execute("CREATE TABLE jobs (rowid INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, title TEXT NOT NULL, "
+                     "company TEXT, location TEXT, description TEXT, url TEXT, source TEXT NOT NULL, "
+                     "posted_date TEXT, salary_range TEXT, job_type TEXT, remote INTEGER NOT NULL DEFAULT 0, "
+                     "skills TEXT, experience_level TEXT, metadata TEXT, first_seen REAL NOT NULL, "
+                     "last_seen REAL NOT NULL)")
+        conn.execute("INSERT INTO jobs (id, title, location, source, salary_range, first_seen, last_seen) "
+                     "VALUES ('old', 'Python Engineer', 'Berlin, Germany', 'test', '€65,000', 0, 0)")
+        conn.commit()
+        conn.close()
+
+        migrated = JobIndex(legacy).get("old")
+        self.assertIsNotNone(migrated)
+        conn = sqlite3.connect(legacy)
+        row = conn.execute("SELECT city, country, salary_currency, salary_min_annual FROM jobs").fetchone()
+        conn.close()
+        self.assertEqual(row, ("Berlin", "DE", "EUR", 65000))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Tests for cursor pagination across job sources
+"""
+import os
+import sys
+import unittest
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources.pagination import InvalidCursor, SearchCursor, paginate_live, query_key
+from tests.job_fixtures import make_job
+
+class TestSearchCursor(unittest.TestCase):
+    """Cursor encoding"""
+
+    def test_round_trip(self):
+        key = query_key("python", None, None, None)
+        cursor = SearchCursor(key, "live", source_offsets={"reddit": 4}, seen=["abc"])
+        decoded = SearchCursor.decode(cursor.encode(), key)
+        self.assertEqual(decoded.source_offsets, {"reddit": 4})
+        self.assertEqual(decoded.seen, ["abc"])
+
+    def test_rejects_other_query_and_garbage(self):
+        token = SearchCursor(query_key("python"), "index", offset=10).encode()
+        with self.assertRaises(InvalidCursor):
+            SearchCursor.decode(token, query_key("golang"))
+        with self.assertRaises(InvalidCursor):
+            SearchCursor.decode("not-a-cursor", query_key("python"))
+
+class TestPaginateLive(unittest.TestCase):
+    """Merging per-source pages"""
+
+    def test_offsets_advance_only_past_consumed_postings(self):
+        batches = {
+            "a": [make_job("a1", "Python Engineer", source="a"), make_job("a2", "Data Engineer", source="a")],
+            "b": [make_job("b1", "Python Engineer", source="b"), make_job("b2", "Designer", source="b"),
+                  make_job("b3", "Writer", source="b")],
+        }
+        page, offsets, seen = paginate_live(batches, ["a", "b"], 3, {"a": 0, "b": 0},
+                                            {"a": 3, "b": 3}, ["a", "b"], [])
+
+        # b1 duplicates a1 and is consumed without taking a slot
+        self.assertEqual([job.title for job in page], ["Python Engineer", "Data Engineer", "Designer"])
+        # a returned a short page -> exhausted; b resumes after b2
+        self.assertEqual(offsets, {"b": 2})
+
+        # The next page skips anything already returned
+        batches = {"b": [make_job("b3", "Writer", source="b"), make_job("b9", "Python Engineer", source="b")]}
+        page, offsets, _ = paginate_live(batches, ["b"], 3, offsets, {"b": 3}, ["b"], seen)
+        self.assertEqual([job.id for job in page], ["b3"])
+        self.assertEqual(offsets, {})
+
+    def test_incomplete_sources_keep_offset(self):
+        page, offsets, _ = paginate_live({}, ["a"], 5, {"a": 6}, {"a": 3}, [], [])
+        self.assertEqual(page, [])
+        self.assertEqual(offsets, {"a": 6})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Tests for the precomputed job vector index
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources.job_index import JobIndex
+from api.job_sources.job_vectors import JobEmbedder, JobVectorIndex
+from tests.job_fixtures import make_job
+
+class TestJobVectorIndex(unittest.TestCase):
+    """Embedding, incremental updates and top-k search (hashing backend)"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = Path(self.tmp.name) / "jobs.db"
+        self.index = JobIndex(path)
+        self.vectors = JobVectorIndex(path, JobEmbedder(backend="hashing", dim=256))
+        self.jobs = [
+            make_job("1", "Backend Engineer", description="Python, Django and PostgreSQL services on AWS",
+                     skills=["Python", "Django"]),
+            make_job("2", "Pastry Chef", description="Bake bread, croissants and cakes for our bakery"),
+            make_job("3", "Data Scientist", description="Machine learning models in Python with pandas",
+                     skills=["Python"]),
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_nearest_posting_ranks_first(self):
+        self.assertEqual(self.vectors.index_jobs(self.jobs), 3)
+        hits = self.vectors.search(self.vectors.embed_query("Python Django backend developer"), k=2)
+        self.assertEqual(hits[0][0], "1")
+        self.assertNotIn("2", [job_id for job_id, _ in hits])
+
+    def test_only_changed_postings_are_reembedded(self):
+        self.vectors.index_jobs(self.jobs)
+        self.jobs[1].description = "Sourdough specialist"
+        self.assertEqual(self.vectors.index_jobs(self.jobs), 1)
+
+    def test_backfill_and_prune_follow_the_job_index(self):
+        self.index.upsert(self.jobs)
+        self.assertEqual(self.vectors.backfill(), 3)
+        self.index.delete(["2"])
+        self.assertEqual(self.vectors.prune(), 1)
+        hits = self.vectors.search(self.vectors.embed_query("bakery"), k=5)
+        self.assertEqual(sorted(job_id for job_id, _ in hits), ["1", "3"])
+
+if __name__ == '__main__':
+    unittest.main()
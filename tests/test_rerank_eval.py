@@ -0,0 +1,89 @@
+"""
+Test suite for offline reranker evaluation metrics
+"""
+import unittest
+import sys
+import os
+
+# Add the repository root to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.rerank_eval import (
+    ndcg_at_k, reciprocal_rank, percentile, lexical_first_stage, RerankEvaluator, EvalQuery
+)
+
+class TestRerankEval(unittest.TestCase):
+    """Test cases for reranker evaluation metrics"""
+
+    def test_ndcg_perfect_ranking(self):
+        """Ideal ordering scores 1.0"""
+        relevance = {"a": 2, "b": 1}
+        self.assertAlmostEqual(ndcg_at_k(["a", "b", "c"], relevance, 3), 1.0)
+
+    def test_ndcg_penalizes_swaps(self):
+        """Putting the partial match first lowers NDCG"""
+        relevance = {"a": 2, "b": 1}
+        self.assertLess(ndcg_at_k(["b", "a"], relevance, 2), 1.0)
+        self.assertEqual(ndcg_at_k(["x", "y"], {}, 2), 0.0)
+
+    def test_reciprocal_rank(self):
+        """MRR uses the first relevant document"""
+        self.assertEqual(reciprocal_rank(["x", "a"], {"a": 1}), 0.5)
+        self.assertEqual(reciprocal_rank(["x", "y"], {"a": 1}), 0.0)
+
+    def test_percentile_interpolates(self):
+        """Percentiles interpolate between samples"""
+        self.assertEqual(percentile([], 95), 0.0)
+        self.assertEqual(percentile([1, 2, 3, 4, 5], 50), 3)
+        self.assertAlmostEqual(percentile([0, 10], 95), 9.5)
+
+    def test_lexical_first_stage_ranks_overlap_first(self):
+        """BM25 puts the document sharing query terms on top"""
+        docs = [{"id": "1", "text": "gardening tips"}, {"id": "2", "text": "python data analyst jobs"}]
+        ranked = lexical_first_stage("data analyst", docs)
+        self.assertEqual(ranked[0]["id"], "2")
+        self.assertEqual(ranked[0]["similarity"], 1.0)
+
+    def test_first_stage_only_report(self):
+        """Evaluation without reranking reports quality and latency"""
+        item = EvalQuery("q", "data analyst", [{"id": "1", "text": "gardening"},
+                                               {"id": "2", "text": "data analyst"}], {"2": 2})
+        report = RerankEvaluator(k_values=(1,)).evaluate([item], with_rerank=False)
+        summary = report["configurations"]["first_stage"]
+        self.assertEqual(summary["quality"]["ndcg@1"], 1.0)
+        self.assertIn("p95_ms", summary["latency"]["first_stage"])
+
+    def test_mock_reranker_is_refused_or_labeled(self):
+        """Without a model, evaluation fails unless mock runs are allowed and labeled"""
+        from api.reranker import reranker
+        item = EvalQuery("q", "data analyst", [{"id": str(i), "text": f"data analyst {i}"} for i in range(6)],
+                         {"2": 2})
+        initialized, threshold = reranker.initialized, reranker.margin_skip_threshold
+        reranker.initialized = False
+        try:
+            with self.assertRaises(RuntimeError):
+                RerankEvaluator(k_values=(1,)).evaluate([item])
+            report = RerankEvaluator(k_values=(1,), force_rerank=True, allow_mock=True).evaluate([item])
+            self.assertIn("reranked_mock", report["configurations"])
+            self.assertTrue(report["reranker"]["mock"])
+            # force_rerank only overrides the shared reranker for the run
+            self.assertEqual(reranker.margin_skip_threshold, threshold)
+        finally:
+            reranker.initialized = initialized
+
+    def test_chunked_scoring_stops_at_deadline(self):
+        """The whole batch is scored in one call that stops between chunks at the cap"""
+        import time
+        from api.cpu_kernels import score_pairs_in_chunks
+        pairs = [("q", str(i)) for i in range(20)]
+        calls = []
+        predict = lambda chunk: calls.append(len(chunk)) or [1.0] * len(chunk)
+        scores, partial, _ = score_pairs_in_chunks(predict, pairs, 8, time.time() + 60, 1.0)
+        self.assertEqual((len(scores), partial, calls), (20, False, [8, 8, 4]))
+        calls.clear()
+        # Past the deadline only the first chunk is scored
+        scores, partial, _ = score_pairs_in_chunks(predict, pairs, 8, time.time() - 1, 1.0)
+        self.assertEqual((len(scores), partial, calls), (8, True, [8]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for saved searches and new-posting alert percolation
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources.job_index import JobIndex
+from api.job_sources.job_vectors import JobEmbedder, JobVectorIndex
+from api.job_sources.saved_searches import SavedSearchStore, query_terms
+from tests.job_fixtures import make_job
+
+class TestSavedSearches(unittest.TestCase):
+    """Compilation, percolation, similarity thresholds and the alert queue"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        JobIndex(root / "jobs.db")
+        self.vectors = JobVectorIndex(root / "jobs.db", JobEmbedder(backend="hashing", dim=256))
+        self.path = root / "saved_searches.db"
+        self.store = SavedSearchStore(self.path, self.vectors)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_query_terms(self):
+        self.assertEqual(query_terms("Python Engineers, python"), ("python", "engineer"))
+
+    def test_new_postings_match_only_candidate_searches(self):
+        python = self.store.create("u1", "python developer")
+        self.store.create("u1", "pastry chef")
+        berlin = self.store.create("u2", "python", location="Berlin, Germany", remote=False)
+        paid = self.store.create("u2", "engineer", salary_min=150000)
+        jobs = [
+            make_job("1", "Senior Python Developer", description="Django services", remote=True),
+            make_job("2", "Python Engineer", description="Data pipelines", location="Berlin, Germany",
+                     salary_range="$120,000 - $140,000"),
+            make_job("3", "Backend Engineer", description="Go services", remote=True, salary_range="$160k - $190k"),
+        ]
+        self.assertEqual(self.store.percolate(jobs), 3)
+        # Only searches whose anchor term occurs in a posting were tested
+        self.assertLessEqual(self.store.candidates_tested, 5)
+        self.assertEqual([alert["job_id"] for alert in self.store.pending_alerts("u1")], ["1"])
+        matched = {(alert["search_id"], alert["job_id"]) for alert in self.store.pending_alerts("u2")}
+        self.assertEqual(matched, {(berlin.id, "2"), (paid.id, "3")})
+        self.assertEqual(self.store.pending_alerts("u1")[0]["search_id"], python.id)
+        # Seeing the same postings again queues nothing new
+        self.assertEqual(self.store.percolate(jobs), 0)
+
+    def test_similarity_threshold(self):
+        self.store.create("u1", "python", min_similarity=0.99)
+        self.store.create("u2", "python", min_similarity=-1.0)
+        job = make_job("1", "Python Developer", description="Django services")
+        self.vectors.index_jobs([job])
+        self.store.percolate([job])
+        self.assertEqual(self.store.pending_alerts("u1"), [])
+        self.assertEqual(len(self.store.pending_alerts("u2")), 1)
+        self.assertIsNotNone(self.store.pending_alerts("u2")[0]["score"])
+
+    def test_searches_and_alerts_persist(self):
+        search = self.store.create("u1", "python developer", name="Daily python")
+        self.store.percolate([make_job("1", "Python Developer", description="Django")])
+        reopened = SavedSearchStore(self.path, self.vectors)
+        self.assertEqual([s.to_dict()["name"] for s in reopened.list("u1")], ["Daily python"])
+        alerts = reopened.pending_alerts("u1")
+        self.assertEqual(reopened.mark_delivered("u2", [alerts[0]["id"]]), 0)  # not theirs
+        self.assertEqual(reopened.mark_delivered("u1", [alerts[0]["id"]]), 1)
+        self.assertEqual(reopened.pending_alerts("u1"), [])
+        self.assertFalse(reopened.delete("u2", search.id))
+        self.assertTrue(reopened.delete("u1", search.id))
+        self.assertEqual(reopened.percolate([make_job("2", "Python Developer", description="Flask")]), 0)
+
+if __name__ == '__main__':
+    unittest.main()
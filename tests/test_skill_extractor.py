@@ -0,0 +1,43 @@
+"""
+Tests for taxonomy-driven skill extraction
+"""
+import os
+import sys
+import unittest
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources.base import JobPosting
+from api.skill_extractor import SkillExtractor
+
+class TestSkillExtractor(unittest.TestCase):
+    """Multi-pattern matching against the skills taxonomy"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.extractor = SkillExtractor()
+
+    def test_synonyms_fold_to_canonical_names(self):
+        skills = self.extractor.extract("Node.js and k8s on <b>AWS</b>; golang preferred, some C++ and C#.")
+        for expected in ["Node.js", "Kubernetes", "AWS", "Go", "C++", "C#"]:
+            self.assertIn(expected, skills)
+
+    def test_multi_token_patterns_and_order(self):
+        skills = self.extractor.extract("Machine learning with PyTorch, deployed via CI/CD")
+        self.assertEqual(skills[:3], ["Machine Learning", "PyTorch", "CI/CD"])
+
+    def test_ambiguous_names_need_a_synonym(self):
+        self.assertNotIn("Go", self.extractor.extract("Ready to go to market and excel"))
+        self.assertNotIn("Excel", self.extractor.extract("You will excel here"))
+
+    def test_enrich_merges_without_duplicates(self):
+        job = JobPosting(id="1", title="Python Developer", company="Acme", location="Remote",
+                         description="Django and python services", url="", source="test", skills=["python"])
+        self.extractor.enrich([job])
+        self.assertEqual(job.skills[0], "python")
+        self.assertIn("Django", job.skills)
+        self.assertEqual(sum(1 for skill in job.skills if skill.lower() == "python"), 1)
+
+if __name__ == '__main__':
+    unittest.main()
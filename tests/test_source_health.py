@@ -0,0 +1,87 @@
+"""
+Tests for circuit breaker probes under async fan-out cancellation
+"""
+import asyncio
+import os
+import sys
+import time
+import unittest
+
+import httpx
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources import http
+from api.job_sources.base import JobSource
+from api.job_sources.fanout import FanOutExecutor
+from api.job_sources.health import CLOSED, HALF_OPEN, OPEN, source_health
+
+class SlowTransport(httpx.AsyncBaseTransport):
+    """Answers 200 after `delay` seconds."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    async def handle_async_request(self, request):
+        await asyncio.sleep(self.delay)
+        return httpx.Response(200, json=[], request=request)
+
+class BrokenTransport(httpx.AsyncBaseTransport):
+    """Fails with an error outside the httpx/requests hierarchies."""
+
+    async def handle_async_request(self, request):
+        raise RuntimeError("decoder exploded")
+
+class ProbeSource(JobSource):
+    def __init__(self, name):
+        super().__init__(name, rate_limit=10 ** 9)
+
+    async def asearch_jobs(self, query, location=None, limit=10):
+        (await self._aget("https://example.invalid/jobs")).json()
+        return []
+
+    def get_job_details(self, job_id):
+        return None
+
+class TestCancelledProbe(unittest.TestCase):
+    """A cancelled half-open probe must not wedge the breaker"""
+
+    def setUp(self):
+        self.name = f"probe_test_{time.time_ns()}"
+        self.breaker = source_health.breaker(self.name)
+        # Open, with the cooldown already over: the next request is the probe
+        self.breaker.state = OPEN
+        self.breaker.opened_at = time.time() - self.breaker.cooldown - 1
+
+    async def _search(self, delay, deadline):
+        http._async_clients[asyncio.get_running_loop()] = httpx.AsyncClient(transport=SlowTransport(delay))
+        result = await FanOutExecutor(deadline=deadline, per_source_timeout=deadline * 2).run(
+            {self.name: ProbeSource(self.name)}, "python")
+        await asyncio.sleep(0.05)  # let the cancelled task unwind
+        return result
+
+    def test_deadline_releases_probe(self):
+        result = asyncio.run(self._search(delay=5, deadline=0.1))
+        self.assertEqual(result.timings[self.name].status, "deadline")
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertFalse(self.breaker.probe_in_flight)
+        self.assertEqual(source_health.stats(self.name).searches[-1][0], "deadline")
+        # The next request probes again and closes the circuit
+        result = asyncio.run(self._search(delay=0, deadline=1))
+        self.assertEqual(result.timings[self.name].status, "ok")
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_unexpected_error_resolves_probe(self):
+        async def probe():
+            http._async_clients[asyncio.get_running_loop()] = httpx.AsyncClient(transport=BrokenTransport())
+            with self.assertRaises(RuntimeError):
+                await ProbeSource(self.name)._aget("https://example.invalid/jobs")
+
+        asyncio.run(probe())
+        # The failed probe re-opens the circuit instead of staying in flight
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.probe_in_flight)
+
+if __name__ == '__main__':
+    unittest.main()
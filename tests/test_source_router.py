@@ -0,0 +1,82 @@
+"""
+Tests for the statistics-based job source router
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the repository root to the path so `api` imports as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.job_sources.fanout import SourceTiming
+from api.source_router import SourceRouter, query_features
+
+MIGRATION = Path(__file__).resolve().parents[1] / "api" / "migrations" / "007_add_source_route_stats.sql"
+
+def _timings(**outcomes):
+    """source=(status, results, seconds) -> SourceTiming dict, as a fan-out reports them."""
+    return {name: SourceTiming(name, status, elapsed, results) for name, (status, results, elapsed) in outcomes.items()}
+
+class TestSourceRouter(unittest.TestCase):
+    """Learning from outcomes, ranking, cold start and persistence"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        db_path = Path(self.tmp.name) / "mosaic.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(MIGRATION.read_text())
+        conn.close()
+        self.env = mock.patch.dict(os.environ, {"DATABASE_PATH": str(db_path)})
+        self.env.start()
+        self.router = SourceRouter()
+        # Never reach the LLM from tests
+        self.seed = mock.patch.object(SourceRouter, "_schedule_seed")
+        self.seed.start()
+
+    def tearDown(self):
+        self.seed.stop()
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_query_features(self):
+        features = query_features("Senior Python nurse", "Remote - US")
+        self.assertIn("skill:python", features)
+        self.assertIn("kw:nurse", features)
+        self.assertNotIn("kw:senior", features)
+        self.assertIn("remote:yes", features)
+        self.assertIn("loc:US", features)
+
+    def test_learns_per_query_class(self):
+        for _ in range(5):
+            self.router.record("python developer", None, _timings(
+                greenhouse=("ok", 10, 0.4), reddit=("ok", 1, 0.5), serpapi=("timeout", 0, 5.0)))
+            self.router.record("registered nurse", None, _timings(
+                greenhouse=("ok", 0, 0.4), reddit=("ok", 8, 0.5), serpapi=("timeout", 0, 5.0)))
+
+        python_route = self.router.route("python engineer", None, ["serpapi", "reddit", "greenhouse"])
+        self.assertEqual(python_route.order[0], "greenhouse")
+        self.assertEqual(python_route.order[-1], "serpapi")
+        self.assertFalse(python_route.cold_start)
+        nurse_route = self.router.route("nurse", None, ["serpapi", "greenhouse", "reddit"])
+        self.assertEqual(nurse_route.order[0], "reddit")
+
+    def test_cold_start_consults_llm_once_per_class(self):
+        route = self.router.route("underwater welder", None, ["greenhouse", "reddit"])
+        self.assertTrue(route.cold_start)
+        self.assertEqual(route.order, ["greenhouse", "reddit"])  # no evidence: caller's order kept
+        SourceRouter._schedule_seed.assert_called_once()
+
+    def test_stats_survive_restart(self):
+        self.router.record("python developer", None, _timings(greenhouse=("ok", 10, 0.4), reddit=("error", 0, 1.0)))
+        self.assertGreater(self.router.flush(), 0)
+        restarted = SourceRouter()
+        route = restarted.route("python developer", None, ["reddit", "greenhouse"])
+        self.assertEqual(route.order[0], "greenhouse")
+        self.assertIsNone(restarted.persistence_error)
+
+if __name__ == '__main__':
+    unittest.main()